@@ -1,21 +1,65 @@
 # backend/app.py
 
-from flask import Flask, request, jsonify
+if __name__ == '__main__':
+    # Patch before anything opens a socket, so requests/redis calls made from
+    # handlers and background tasks yield to other clients instead of blocking.
+    import eventlet
+    eventlet.monkey_patch()
+
+from flask import Flask, Response, request, jsonify
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS  # <-- Add this import
 from topstepx_trader.accounts import search_accounts
 from topstepx_trader.auth import authenticate
 from topstepx_trader.redis_utils import get_json, set_str, get_str
+from topstepx_trader import config, token_manager
+from topstepx_trader.account_broadcast import AccountBroadcaster, AccountRefresher
+from topstepx_trader.bridge_client import BridgeIngestor, add_listener
+from topstepx_trader.market_state import market_state
+from topstepx_trader.market_events import parse_time
+from topstepx_trader import analytics, contract_catalog, history_store, metrics, request_scheduler
+from topstepx_trader.logging_setup import configure_logging
+from topstepx_trader.read_cache import ReadCache
+from topstepx_trader.account_poller import AccountPoller
+from topstepx_trader.scheduler import scheduler
 import os
 
+configure_logging()
+
 app = Flask(__name__)
 CORS(app)  # <-- This enables CORS for all routes
 socketio = SocketIO(app, cors_allowed_origins="*")
+read_cache = ReadCache()
+account_broadcaster = AccountBroadcaster(socketio, loader=lambda: read_cache.get("accounts", []).value)
+account_refresher = AccountRefresher(socketio, account_broadcaster, search_accounts)
+
+account_poller = AccountPoller()
+account_poller.on_snapshot(lambda snapshot: socketio.emit("positions_snapshot", snapshot))
+
+_market_feed = None
+
+def start_market_feed():
+    # The bridge process already writes the Redis streams; this in-process
+    # feed only keeps market_state current for the endpoints below.
+    global _market_feed
+    if _market_feed is None and config.NODE_BRIDGE_URL:
+        add_listener(market_state.on_events)
+        _market_feed = BridgeIngestor(publish_to_redis=False).start()
+
+def start_account_poller():
+    account_poller.start(scheduler)
+
+def cached_json_response(key, default=None):
+    # Served from read_cache; a client echoing the ETag gets an empty 304.
+    entry = read_cache.get(key, default)
+    response = Response(entry.body, mimetype="application/json")
+    response.set_etag(entry.etag)
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
 
 @app.route('/api/accounts', methods=['GET'])
 def get_accounts():
-    accounts = get_json("accounts", [])
-    return jsonify(accounts)
+    return cached_json_response("accounts", [])
 
 @app.route('/api/save-creds', methods=['POST'])
 def save_creds():
@@ -31,20 +75,134 @@ def save_creds():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/market', methods=['GET'])
+def get_market_snapshots():
+    start_market_feed()
+    depth = request.args.get("depth", 10, type=int)
+    return jsonify(market_state.snapshot_all(depth))
+
+@app.route('/api/contracts/search', methods=['GET'])
+def search_contract_catalog():
+    # As-you-type symbol search over the local catalog; never calls the API
+    query = request.args.get("q", "")
+    try:
+        limit = int(request.args.get("limit", 20))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    limit = max(1, min(limit, 100))
+    catalog = contract_catalog.catalog
+    return jsonify({"contracts": catalog.search(query, limit), "catalogSize": len(catalog.index),
+                    "refreshedAt": catalog.refreshed_at})
+
+@app.route('/api/market/<contract_id>', methods=['GET'])
+def get_market_snapshot(contract_id):
+    start_market_feed()
+    depth = request.args.get("depth", 10, type=int)
+    snapshot = market_state.snapshot(contract_id, depth)
+    if snapshot is None:
+        return jsonify({"error": "No market data for contract"}), 404
+    return jsonify(snapshot)
+
+def _history_args():
+    account_id = request.args.get("accountId", type=int)
+    start = parse_time(request.args.get("start"))
+    end = parse_time(request.args.get("end"))
+    return account_id, start, end, request.args.get("contractId")
+
+@app.route('/api/history/trades', methods=['GET'])
+def get_trade_history():
+    try:
+        account_id, start, end, contract_id = _history_args()
+    except ValueError as e:
+        return jsonify({"error": f"Invalid start/end: {e}"}), 400
+    if account_id is None:
+        return jsonify({"error": "accountId is required"}), 400
+    try:
+        trades = history_store.get_trades(account_id, start, end, contract_id)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 502
+    return jsonify({"trades": trades})
+
+@app.route('/api/history/orders', methods=['GET'])
+def get_order_history():
+    try:
+        account_id, start, end, contract_id = _history_args()
+    except ValueError as e:
+        return jsonify({"error": f"Invalid start/end: {e}"}), 400
+    if account_id is None:
+        return jsonify({"error": "accountId is required"}), 400
+    status = request.args.get("status", type=int)
+    try:
+        orders = history_store.get_orders(account_id, start, end, contract_id, status)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 502
+    return jsonify({"orders": orders})
+
+@app.route('/api/analytics/<int:account_id>', methods=['GET'])
+def get_account_analytics(account_id):
+    try:
+        summary = analytics.account_analytics(account_id, parse_time(request.args.get("start"))).summary()
+    except Exception as e:
+        return jsonify({"error": str(e)}), 502
+    return jsonify(summary)
+
+@app.route('/api/analytics/<int:account_id>/equity', methods=['GET'])
+def get_account_equity(account_id):
+    points = request.args.get("points", 1000, type=int)
+    try:
+        account = analytics.account_analytics(account_id, parse_time(request.args.get("start")))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 502
+    return jsonify(account.equity_series(points))
+
+@app.route('/api/strategies', methods=['GET'])
+def get_strategy_stats():
+    return jsonify(get_json("strategies:stats", {}))
+
+@app.route('/api/request-queue', methods=['GET'])
+def get_request_queue():
+    # Rate-limit tokens and queued requests per group and priority, this process only
+    return jsonify(request_scheduler.outbound.stats())
+
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    return Response(metrics.render(), mimetype="text/plain; version=0.0.4")
+
+@socketio.on('subscribe_market')
+def handle_subscribe_market(data=None):
+    start_market_feed()
+    depth = (data or {}).get("depth", 10)
+    contract_id = (data or {}).get("contractId")
+    if contract_id:
+        emit("market_snapshot", market_state.snapshot(contract_id, depth))
+    else:
+        emit("market_snapshot", market_state.snapshot_all(depth))
+
 @socketio.on('subscribe_accounts')
 def handle_subscribe_accounts():
-    emit("accounts_update", get_json("accounts", []))
+    emit("accounts_snapshot", account_broadcaster.snapshot())
+
+@socketio.on('resync_accounts')
+def handle_resync_accounts(data=None):
+    if (data or {}).get("version") != account_broadcaster.version:
+        emit("accounts_snapshot", account_broadcaster.snapshot())
 
 @socketio.on('refresh_accounts')
 def handle_refresh_accounts():
-    search_accounts()
-    emit("accounts_update", get_json("accounts", []), broadcast=True)
+    # Answered with "accounts_refreshed" once the shared in-flight refresh lands
+    account_refresher.request(request.sid)
+
+@socketio.on('subscribe_positions')
+def handle_subscribe_positions():
+    emit("positions_snapshot", account_poller.snapshot())
 
 def emit_accounts_update():
-    socketio.emit("accounts_update", get_json("accounts", []), broadcast=True)
+    account_broadcaster.publish(read_cache.get("accounts", []).value)
 
 if __name__ == '__main__':
     # Use eventlet for production-like SocketIO experience
-    import eventlet
-    eventlet.monkey_patch()
+    token_manager.start()
+    start_market_feed()
+    start_account_poller()
+    contract_catalog.catalog.start_background_refresh(scheduler)
     socketio.run(app, host='0.0.0.0', port=5000)
@@ -1,12 +1,31 @@
-from backend.topstepx_trader.auth import authenticate
-from backend.topstepx_trader.scheduler import schedule_reauth
-from backend.topstepx_trader.bridge_client import listen_to_bridge
+from topstepx_trader import config, token_manager
+from topstepx_trader.auth import authenticate
+from topstepx_trader.scheduler import schedule_reauth, scheduler
+from topstepx_trader.bridge_client import add_listener, listen_to_bridge
+from topstepx_trader.bar_aggregator import BarAggregator
+from topstepx_trader.contract_cache import start_background_refresh
+from topstepx_trader.strategy_runner import StrategyRunner
+from topstepx_trader.logging_setup import configure_logging
+import json
 import threading
 
 if __name__ == "__main__":
+    configure_logging()
     token = authenticate()
     print(f"Authenticated. Token: {token[:10]}...")
+    token_manager.start()
     schedule_reauth()
+    start_background_refresh(config.WATCH_SYMBOLS, live=config.LIVE_MODE)
+
+    aggregator = BarAggregator(publish_to_redis=True)
+    add_listener(aggregator.on_events)
+    scheduler.every(0.25, aggregator.close_due, name="bar-close")
+
+    strategy_specs = json.loads(config.STRATEGY_CONFIG)
+    if strategy_specs:
+        runner = StrategyRunner(strategy_specs, subscribe=False).start()
+        aggregator.on_close(runner.on_bar_close)
+        scheduler.every(config.STRATEGY_STATS_INTERVAL, runner.publish_stats, name="strategy-stats")
 
     bridge_thread = threading.Thread(target=listen_to_bridge)
     bridge_thread.start()
@@ -0,0 +1,155 @@
+# backend/topstepx_trader/account_broadcast.py
+
+import logging
+import threading
+from topstepx_trader import config
+from topstepx_trader.redis_utils import get_json
+
+logger = logging.getLogger(__name__)
+
+
+def diff_accounts(previous, current):
+    """
+    Delta between two ``{account_id: account}`` maps.
+
+    Returns ``(added, changed, removed)``: full new accounts, ``{"id", ...}``
+    dicts holding only the fields that changed, and ids that disappeared. An
+    account that lost a field is sent as removed + added so clients replace it.
+    """
+    added, changed, removed = [], [], []
+    for account_id, account in current.items():
+        before = previous.get(account_id)
+        if before is None:
+            added.append(account)
+            continue
+        if before == account:
+            continue
+        if not before.keys() <= account.keys():
+            removed.append(account_id)
+            added.append(account)
+            continue
+        fields = {k: v for k, v in account.items() if before.get(k) != v}
+        fields["id"] = account_id
+        changed.append(fields)
+    removed.extend(account_id for account_id in previous if account_id not in current)
+    return added, changed, removed
+
+
+class AccountBroadcaster:
+    """
+    Versioned, coalesced ``accounts_delta`` broadcasts over Socket.IO.
+
+    ``publish`` may be called for every account change; updates arriving
+    within ``window`` seconds are folded together and diffed once against the
+    last state sent, so clients only receive what changed. Each delta carries
+    ``baseVersion``/``version``; a client whose version does not match
+    ``baseVersion`` asks for a full ``accounts_snapshot`` instead.
+    """
+
+    def __init__(self, socketio, window=None, loader=None):
+        self.socketio = socketio
+        self.window = config.ACCOUNT_BROADCAST_WINDOW if window is None else window
+        self.loader = loader or (lambda: get_json("accounts", []))
+        self.version = 0
+        self._sent = None
+        self._pending = None
+        self._scheduled = False
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        if self._sent is None:
+            self._sent = {a["id"]: a for a in self.loader() or []}
+
+    def snapshot(self):
+        with self._lock:
+            self._ensure_loaded()
+            return {"version": self.version, "accounts": list(self._sent.values())}
+
+    def publish(self, accounts):
+        with self._lock:
+            self._pending = accounts
+            if self._scheduled:
+                return
+            self._scheduled = True
+        if self.window > 0:
+            self.socketio.start_background_task(self._flush_after_window)
+        else:
+            self.flush()
+
+    def _flush_after_window(self):
+        self.socketio.sleep(self.window)
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            self._scheduled = False
+            accounts, self._pending = self._pending, None
+            if accounts is None:
+                return None
+            self._ensure_loaded()
+            current = {a["id"]: a for a in accounts}
+            added, changed, removed = diff_accounts(self._sent, current)
+            if not (added or changed or removed):
+                return None
+            self._sent = current
+            self.version += 1
+            delta = {
+                "baseVersion": self.version - 1,
+                "version": self.version,
+                "added": added,
+                "changed": changed,
+                "removed": removed,
+            }
+        self.socketio.emit("accounts_delta", delta)
+        return delta
+
+
+class AccountRefresher:
+    """
+    Runs account refreshes off the Socket.IO handlers, one API call at a time.
+
+    ``request`` returns at once: the first caller starts ``fetch`` (normally
+    ``search_accounts``) as a background task, and callers arriving while it
+    is in flight join it instead of issuing their own call. When it finishes
+    the accounts go out through the broadcaster and every waiting client gets
+    ``accounts_refreshed`` (with ``error`` set if the fetch failed).
+    """
+
+    def __init__(self, socketio, broadcaster, fetch):
+        self.socketio = socketio
+        self.broadcaster = broadcaster
+        self.fetch = fetch
+        self.calls = 0
+        self._waiting = set()  # client sids; None for server-side callers
+        self._running = False
+        self._lock = threading.Lock()
+
+    def request(self, sid=None):
+        """Refresh for ``sid``; True if this started a fetch, False if it joined one in flight."""
+        with self._lock:
+            self._waiting.add(sid)
+            if self._running:
+                return False
+            self._running = True
+            self.calls += 1
+        self.socketio.start_background_task(self._run)
+        return True
+
+    def _run(self):
+        error = None
+        try:
+            result = self.fetch()
+            if result and result.get("accounts"):
+                self.broadcaster.publish(result["accounts"])
+        except Exception as e:
+            error = str(e)
+            logger.warning("Account refresh failed: %s", e)
+        with self._lock:
+            waiting, self._waiting = self._waiting, set()
+            self._running = False
+        payload = {"version": self.broadcaster.version}
+        if error is not None:
+            payload["error"] = error
+        for sid in waiting:
+            if sid is not None:
+                self.socketio.emit("accounts_refreshed", payload, to=sid)
@@ -0,0 +1,149 @@
+# backend/topstepx_trader/account_poller.py
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from topstepx_trader import config, request_scheduler
+from topstepx_trader.order_api_client import search_open_orders
+from topstepx_trader.position_api_client import search_open_positions
+from topstepx_trader.redis_utils import set_json
+
+logger = logging.getLogger(__name__)
+
+
+def active_account_ids(raw=None):
+    """Account ids from ``TSX_ACTIVE_ACCOUNTS`` (a JSON list of account dicts or ids)."""
+    raw = config.TSX_ACTIVE_ACCOUNTS if raw is None else raw
+    try:
+        accounts = json.loads(raw) if raw else []
+    except ValueError:
+        logger.warning("TSX_ACTIVE_ACCOUNTS is not valid JSON")
+        return []
+    return [a["id"] if isinstance(a, dict) else int(a) for a in accounts]
+
+
+def poll_interval(account_count, rate_limit=None):
+    """
+    Seconds between rounds for ``account_count`` accounts.
+
+    ``ACCOUNT_POLL_INTERVAL``, stretched so the two requests per account and
+    round use at most ``ACCOUNT_POLL_RATE_SHARE`` of ``API_RATE_LIMIT``. Poll
+    traffic outranks general and history requests in ``request_scheduler``,
+    so without this cap a handful of accounts would starve them.
+    """
+    rate, _ = request_scheduler.parse_limit(config.API_RATE_LIMIT if rate_limit is None else rate_limit)
+    if not rate or not account_count:
+        return config.ACCOUNT_POLL_INTERVAL
+    return max(config.ACCOUNT_POLL_INTERVAL, 2 * account_count / (rate * config.ACCOUNT_POLL_RATE_SHARE))
+
+
+def _call(fn, account_id, key):
+    try:
+        result = fn(account_id)
+    except Exception as e:
+        return None, str(e)
+    if not result or not result.get("success", True):
+        return None, (result or {}).get("errorMessage") or "request failed"
+    return result.get(key, []), None
+
+
+class AccountPoller:
+    """
+    Polls open positions and open orders for many accounts at once.
+
+    Every request of a round (two per account) is submitted to a bounded
+    pool together, so with ``max_workers`` >= 2 x accounts (and an HTTP pool
+    at least as large) a refresh costs about one round trip instead of one
+    per account. Results are merged into a single snapshot; an account whose
+    request failed keeps its previous data flagged ``stale``. The snapshot's
+    ``version`` only moves when something changed, and each new version is
+    written to Redis under ``ACCOUNT_SNAPSHOT_KEY`` and handed to listeners.
+    ``start`` runs rounds on a scheduler at ``poll_interval`` for the current
+    number of accounts.
+    """
+
+    def __init__(self, account_ids=None, max_workers=None, publish_to_redis=True):
+        self.account_ids = account_ids
+        self.pool = ThreadPoolExecutor(max_workers=max_workers or config.ACCOUNT_POLL_WORKERS,
+                                       thread_name_prefix="account-poll")
+        self.publish_to_redis = publish_to_redis
+        self.version = 0
+        self.accounts = {}
+        self.last_poll_ms = None
+        self.interval = config.ACCOUNT_POLL_INTERVAL
+        self._listeners = []
+        self._lock = threading.Lock()
+
+    def on_snapshot(self, callback):
+        self._listeners.append(callback)
+
+    def _ids(self):
+        return self.account_ids if self.account_ids is not None else active_account_ids()
+
+    def poll(self):
+        """Run one round; returns the snapshot (new version only if changed)."""
+        started = time.perf_counter()
+        ids = self._ids()
+        self.interval = poll_interval(len(ids))
+        futures = {
+            account_id: (self.pool.submit(_call, search_open_positions, account_id, "positions"),
+                         self.pool.submit(_call, search_open_orders, account_id, "orders"))
+            for account_id in ids
+        }
+        accounts = {}
+        for account_id, (positions_future, orders_future) in futures.items():
+            positions, positions_error = positions_future.result()
+            orders, orders_error = orders_future.result()
+            previous = self.accounts.get(account_id, {})
+            error = positions_error or orders_error
+            accounts[account_id] = {
+                "accountId": account_id,
+                "positions": previous.get("positions", []) if positions is None else positions,
+                "orders": previous.get("orders", []) if orders is None else orders,
+                "stale": error is not None,
+                "error": error,
+            }
+        self.last_poll_ms = 1000.0 * (time.perf_counter() - started)
+
+        with self._lock:
+            if accounts == self.accounts:
+                return self.snapshot()
+            self.accounts = accounts
+            self.version += 1
+            snapshot = self.snapshot()
+        if self.publish_to_redis:
+            try:
+                set_json(config.ACCOUNT_SNAPSHOT_KEY, snapshot)
+            except Exception as e:
+                logger.warning("Account snapshot Redis write failed: %s", e)
+        for callback in list(self._listeners):
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logger.exception("Account poll listener failed: %s", e)
+        return snapshot
+
+    def start(self, scheduler, name="account-poll"):
+        """Poll on ``scheduler`` from now on, re-deriving the interval after every round."""
+        if name not in scheduler.jobs:
+            def run():
+                self.poll()
+                job.interval = self.interval
+
+            self.interval = poll_interval(len(self._ids()))
+            job = scheduler.every(self.interval, run, name=name, first_delay=0)
+            scheduler.start()
+        return self
+
+    def snapshot(self):
+        return {
+            "version": self.version,
+            "timestamp": time.time(),
+            "pollMs": self.last_poll_ms,
+            "accounts": list(self.accounts.values()),
+        }
+
+    def shutdown(self, wait=True):
+        self.pool.shutdown(wait=wait)
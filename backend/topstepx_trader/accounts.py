@@ -1,18 +1,16 @@
 # backend/topstepx_trader/accounts.py
 
-import requests
-from topstepx_trader import config
+from topstepx_trader import config, http_client
 from topstepx_trader.redis_utils import set_json
 
 def search_accounts(only_active=True):
     url = f"{config.BASE_API_URL}/api/Account/search"
     headers = {
         "accept": "text/plain",
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {config.SESSION_TOKEN}"
+        "Content-Type": "application/json"
     }
     payload = {"onlyActiveAccounts": only_active}
-    response = requests.post(url, headers=headers, json=payload)
+    response = http_client.post(url, headers=headers, json=payload, authorized=True)
     try:
         result = response.json()
         accounts = result.get("accounts", [])
@@ -0,0 +1,213 @@
+# backend/topstepx_trader/analytics.py
+
+import threading
+from collections import OrderedDict
+import numpy as np
+from topstepx_trader import config, history_store
+from topstepx_trader.market_events import parse_time
+
+
+def trades_to_arrays(trades):
+    """
+    Columnar form of Trade/search records, voided fills dropped.
+
+    ``pnl`` is NaN for half-turn fills (the API reports ``profitAndLoss`` as
+    null when a fill only opens a position).
+    """
+    trades = [t for t in trades if not t.get("voided")]
+    pnl = [t.get("profitAndLoss") for t in trades]
+    return {
+        "id": np.array([t["id"] for t in trades], dtype=np.int64),
+        "ts": np.array([parse_time(t.get("creationTimestamp")) or 0.0 for t in trades], dtype=np.float64),
+        "pnl": np.array([np.nan if p is None else p for p in pnl], dtype=np.float64),
+        "fees": np.array([t.get("fees") or 0.0 for t in trades], dtype=np.float64),
+        "size": np.array([t.get("size") or 0 for t in trades], dtype=np.int64),
+        "contract": np.array([t.get("contractId") or "" for t in trades], dtype=object),
+    }
+
+
+def equity_curve(pnl, fees, start_equity=0.0):
+    """Cumulative net P&L after each fill (NaN pnl counts as 0)."""
+    return start_equity + np.cumsum(np.nan_to_num(pnl) - fees)
+
+
+def drawdown(equity, start_peak=0.0):
+    """Drawdown from the running peak at each point (<= 0) and the running peak."""
+    peak = np.maximum.accumulate(np.maximum(equity, start_peak)) if len(equity) else equity
+    return equity - peak, peak
+
+
+def trade_stats(pnl, fees):
+    """Win/loss counts and ratios over round-turn fills."""
+    closed = ~np.isnan(pnl)
+    gross = pnl[closed]
+    wins = gross[gross > 0]
+    losses = gross[gross < 0]
+    gross_loss = -losses.sum()
+    return {
+        "fills": int(len(pnl)),
+        "roundTurns": int(closed.sum()),
+        "wins": int(len(wins)),
+        "losses": int(len(losses)),
+        "winRate": float(len(wins) / len(gross)) if len(gross) else None,
+        "grossPnl": float(gross.sum()),
+        "fees": float(fees.sum()),
+        "netPnl": float(gross.sum() - fees.sum()),
+        "avgWin": float(wins.mean()) if len(wins) else None,
+        "avgLoss": float(losses.mean()) if len(losses) else None,
+        "largestWin": float(wins.max()) if len(wins) else None,
+        "largestLoss": float(losses.min()) if len(losses) else None,
+        "profitFactor": float(wins.sum() / gross_loss) if gross_loss else None,
+    }
+
+
+def per_contract_stats(contract, pnl, fees, size):
+    """Grouped P&L, fees, fill counts and volume per contract via ``bincount``."""
+    if not len(contract):
+        return {}
+    names, idx = np.unique(contract.astype(str), return_inverse=True)
+    closed = ~np.isnan(pnl)
+    gross = np.nan_to_num(pnl)
+    n = len(names)
+    gross_sum = np.bincount(idx, weights=gross, minlength=n)
+    fee_sum = np.bincount(idx, weights=fees, minlength=n)
+    fills = np.bincount(idx, minlength=n)
+    volume = np.bincount(idx, weights=size, minlength=n)
+    round_turns = np.bincount(idx, weights=closed, minlength=n)
+    wins = np.bincount(idx, weights=closed & (gross > 0), minlength=n)
+    return {
+        name: {
+            "fills": int(fills[i]),
+            "volume": int(volume[i]),
+            "roundTurns": int(round_turns[i]),
+            "winRate": float(wins[i] / round_turns[i]) if round_turns[i] else None,
+            "grossPnl": float(gross_sum[i]),
+            "fees": float(fee_sum[i]),
+            "netPnl": float(gross_sum[i] - fee_sum[i]),
+        }
+        for i, name in enumerate(names)
+    }
+
+
+def daily_pnl(ts, net):
+    """Net P&L per UTC day as (day start epoch seconds, pnl) arrays."""
+    days = (ts // 86400).astype(np.int64)
+    keys, idx = np.unique(days, return_inverse=True)
+    return keys * 86400, np.bincount(idx, weights=net, minlength=len(keys))
+
+
+class AccountAnalytics:
+    """
+    Vectorized P&L analytics over one account's fills.
+
+    Fills are kept as NumPy columns sorted by time. ``update`` pulls only fills
+    newer than the last one seen from the local history store and extends the
+    equity curve and running peak from where they left off; a fill that lands
+    before the tail (late report) triggers a full, still vectorized, rebuild.
+    """
+
+    def __init__(self, account_id, start=None):
+        self.account_id = account_id
+        self.start = start
+        self.cols = trades_to_arrays([])
+        self.equity = np.empty(0, dtype=np.float64)
+        self.peak = np.empty(0, dtype=np.float64)
+        self._lock = threading.Lock()
+
+    def _rebuild(self):
+        order = np.lexsort((self.cols["id"], self.cols["ts"]))
+        self.cols = {k: v[order] for k, v in self.cols.items()}
+        self.equity = equity_curve(self.cols["pnl"], self.cols["fees"])
+        _, self.peak = drawdown(self.equity)
+
+    def _extend(self, new):
+        last_equity = self.equity[-1] if len(self.equity) else 0.0
+        last_peak = self.peak[-1] if len(self.peak) else 0.0
+        equity = equity_curve(new["pnl"], new["fees"], last_equity)
+        _, peak = drawdown(equity, last_peak)
+        self.cols = {k: np.concatenate([self.cols[k], new[k]]) for k in self.cols}
+        self.equity = np.concatenate([self.equity, equity])
+        self.peak = np.concatenate([self.peak, peak])
+
+    def add_trades(self, trades):
+        """Merge fills (duplicates ignored); returns how many were new."""
+        new = trades_to_arrays(trades)
+        order = np.lexsort((new["id"], new["ts"]))
+        new = {k: v[order] for k, v in new.items()}
+        with self._lock:
+            fresh = ~np.isin(new["id"], self.cols["id"])
+            new = {k: v[fresh] for k, v in new.items()}
+            if not len(new["id"]):
+                return 0
+            if len(self.cols["ts"]) and new["ts"][0] < self.cols["ts"][-1]:
+                self.cols = {k: np.concatenate([self.cols[k], new[k]]) for k in self.cols}
+                self._rebuild()
+            else:
+                self._extend(new)
+        return len(new["id"])
+
+    def update(self):
+        """Sync new fills through ``history_store`` and fold them in."""
+        if len(self.cols["ts"]):
+            since = self.cols["ts"][-1] - config.HISTORY_SYNC_OVERLAP
+        else:
+            since = self.start
+        return self.add_trades(history_store.get_trades(self.account_id, since))
+
+    def summary(self):
+        with self._lock:
+            cols, equity, peak = self.cols, self.equity, self.peak
+        dd = equity - peak
+        trough = int(np.argmin(dd)) if len(dd) else None
+        day_keys, day_pnl = daily_pnl(cols["ts"], np.nan_to_num(cols["pnl"]) - cols["fees"])
+        stats = trade_stats(cols["pnl"], cols["fees"])
+        stats.update({
+            "accountId": self.account_id,
+            "firstTimestamp": float(cols["ts"][0]) if len(cols["ts"]) else None,
+            "lastTimestamp": float(cols["ts"][-1]) if len(cols["ts"]) else None,
+            "equity": float(equity[-1]) if len(equity) else 0.0,
+            "peakEquity": float(peak[-1]) if len(peak) else 0.0,
+            "currentDrawdown": float(dd[-1]) if len(dd) else 0.0,
+            "maxDrawdown": float(dd[trough]) if trough is not None else 0.0,
+            "maxDrawdownAt": float(cols["ts"][trough]) if trough is not None else None,
+            "tradingDays": int(len(day_keys)),
+            "bestDay": float(day_pnl.max()) if len(day_pnl) else None,
+            "worstDay": float(day_pnl.min()) if len(day_pnl) else None,
+            "contracts": per_contract_stats(cols["contract"], cols["pnl"], cols["fees"], cols["size"]),
+        })
+        return stats
+
+    def equity_series(self, points=None):
+        """``{t, equity, drawdown}`` lists, downsampled to ``points`` if given."""
+        with self._lock:
+            ts, equity, peak = self.cols["ts"], self.equity, self.peak
+        if points and len(ts) > points:
+            idx = np.unique(np.linspace(0, len(ts) - 1, points).astype(np.int64))
+            ts, equity, peak = ts[idx], equity[idx], peak[idx]
+        return {"t": ts.tolist(), "equity": equity.tolist(), "drawdown": (equity - peak).tolist()}
+
+
+# (account id, start) -> AccountAnalytics, least recently used first.
+_accounts = OrderedDict()
+_accounts_lock = threading.Lock()
+MAX_CACHED = 32
+
+
+def account_analytics(account_id, start=None):
+    """
+    Shared, incrementally updated ``AccountAnalytics`` for ``account_id``
+    from ``start``. Each window has its own entry, since the equity curve and
+    drawdown depend on where it begins; the least recently used are dropped
+    beyond ``MAX_CACHED``.
+    """
+    key = (account_id, start)
+    with _accounts_lock:
+        analytics = _accounts.get(key)
+        if analytics is None:
+            analytics = _accounts[key] = AccountAnalytics(account_id, start)
+            while len(_accounts) > MAX_CACHED:
+                _accounts.popitem(last=False)
+        else:
+            _accounts.move_to_end(key)
+    analytics.update()
+    return analytics
@@ -1,19 +1,16 @@
 # backend/topstepx_trader/auth.py
 
-import requests
-from dotenv import load_dotenv
-from topstepx_trader import config
+from topstepx_trader import config, http_client, token_manager
 from topstepx_trader.redis_utils import set_str, get_str
 
-def authenticate():
-    load_dotenv(override=True)
+def login():
     url = f"{config.BASE_API_URL}/api/Auth/loginKey"
     data = {"userName": config.USERNAME, "apiKey": config.API_KEY}
     headers = {
         "accept": "text/plain",
         "Content-Type": "application/json"
     }
-    response = requests.post(url, headers=headers, json=data)
+    response = http_client.post(url, headers=headers, json=data)
     if response.ok:
         result = response.json()
         token = result.get("token")
@@ -22,19 +19,31 @@ def authenticate():
             return token
     raise Exception("Authentication failed")
 
-def validate_token():
-    load_dotenv(override=True)
+def renew_token(session_token):
+    """Exchange a still-valid token for a fresh one; returns None if refused."""
     url = f"{config.BASE_API_URL}/api/Auth/validate"
-    session_token = get_str("SESSION_TOKEN")
     headers = {
         "accept": "text/plain",
         "Content-Type": "application/json",
         "Authorization": f"Bearer {session_token}"
     }
-    response = requests.post(url, headers=headers)
+    response = http_client.post(url, headers=headers)
     if response.ok:
         result = response.json()
-        if result.get("success") and result.get("newToken"):
-            set_str("SESSION_TOKEN", result["newToken"])
-            return True
+        if result.get("success"):
+            new_token = result.get("newToken") or session_token
+            set_str("SESSION_TOKEN", new_token)
+            return new_token
+    return None
+
+def authenticate():
+    token = login()
+    token_manager.set_token(token)
+    return token
+
+def validate_token():
+    new_token = renew_token(get_str("SESSION_TOKEN"))
+    if new_token:
+        token_manager.set_token(new_token)
+        return True
     return False
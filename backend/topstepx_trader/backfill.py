@@ -0,0 +1,141 @@
+# backend/topstepx_trader/backfill.py
+
+import argparse
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from topstepx_trader import bar_store, config
+from topstepx_trader.logging_setup import configure_logging
+from topstepx_trader.request_scheduler import TokenBucket
+from topstepx_trader.retrieve_bars import fetch_bars, get_current_front_month_contract_id, iso_timestamp
+
+logger = logging.getLogger(__name__)
+
+
+def plan_chunks(contract_id, start, end, unit=2, unit_number=1, chunk_bars=None):
+    """
+    Split the uncovered parts of ``[start, end)`` into API-sized chunks.
+
+    Ranges already in the bar store are skipped, which is what makes an
+    interrupted backfill resumable: re-running it only plans what is left.
+    """
+    step = bar_store.bar_seconds(unit, unit_number)
+    span = (chunk_bars or config.HISTORY_MAX_BARS) * step
+    chunks = []
+    for gap_start, gap_end in bar_store.missing_ranges(contract_id, unit, unit_number, start, end):
+        cursor = gap_start
+        while cursor < gap_end:
+            chunk_end = min(cursor + span, gap_end)
+            chunks.append((cursor, chunk_end))
+            cursor = chunk_end
+    return chunks
+
+
+def _fetch_chunk(contract_id, chunk, unit, unit_number, limiter):
+    start, end = chunk
+    limit = -(-(end - start) // bar_store.bar_seconds(unit, unit_number))
+    limiter.acquire()
+    try:
+        result = fetch_bars(contract_id, iso_timestamp(start), iso_timestamp(end), unit, unit_number, limit)
+    except Exception as e:
+        result = {"success": False, "errorMessage": str(e)}
+    if result and result.get("success"):
+        return bar_store.bars_to_columns(result.get("bars") or [])
+    raise Exception(f"retrieveBars failed for {contract_id} {iso_timestamp(start)}-{iso_timestamp(end)}: {result}")
+
+
+def _flush(contract_id, unit, unit_number, pending):
+    if not pending:
+        return 0
+    columns = {name: np.concatenate([cols[name] for _, cols in pending]) for name in bar_store.COLUMNS}
+    bar_store.write_columns(contract_id, unit, unit_number, columns)
+    # Coverage is recorded after the data is on disk, so a crash in between
+    # only costs a refetch, never a silent hole.
+    covered = (bar_store.cap_coverage(start, end, cols["t"], unit, unit_number) for (start, end), cols in pending)
+    bar_store.add_coverage(contract_id, unit, unit_number, [chunk for chunk in covered if chunk])
+    return len(columns["t"])
+
+
+def backfill(symbols, start, end, unit=2, unit_number=1, max_workers=None,
+             requests_per_second=None, chunk_bars=None, flush_chunks=20):
+    """
+    Backfill ``[start, end)`` (datetimes or epoch seconds) for several symbols.
+
+    Each symbol resolves to its current front-month contract unless a full
+    contract id (``CON.F...``) is given. Chunks are fetched concurrently by a
+    bounded worker pool paced at ``requests_per_second`` and written to the bar
+    store in bulk every ``flush_chunks`` chunks. The requests themselves go
+    out at history priority through ``request_scheduler``, so a backfill only
+    uses spare History capacity and never delays orders. Transient failures
+    are retried by ``http_client`` (``HTTP_READ_RETRIES``); a chunk that still
+    fails is counted and left uncovered for the next run to pick up.
+
+    Returns throughput stats: bars, chunks, failed chunks, seconds, bars/sec.
+    """
+    if isinstance(start, datetime):
+        start = int(start.timestamp())
+    if isinstance(end, datetime):
+        end = int(end.timestamp())
+    step = bar_store.bar_seconds(unit, unit_number)
+    start = -(-start // step) * step
+    end -= end % step
+    limiter = TokenBucket(requests_per_second or config.BACKFILL_REQUESTS_PER_SECOND,
+                          capacity=max_workers or config.BACKFILL_WORKERS)
+    stats = {"bars": 0, "chunks": 0, "failed": 0}
+    began = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers or config.BACKFILL_WORKERS) as pool:
+        futures = {}
+        pending = {}
+        for symbol in symbols:
+            contract_id = symbol if symbol.startswith("CON.") else get_current_front_month_contract_id(symbol)
+            pending[contract_id] = []
+            for chunk in plan_chunks(contract_id, start, end, unit, unit_number, chunk_bars):
+                future = pool.submit(_fetch_chunk, contract_id, chunk, unit, unit_number, limiter)
+                futures[future] = (contract_id, chunk)
+
+        try:
+            for future in as_completed(futures):
+                contract_id, chunk = futures[future]
+                try:
+                    columns = future.result()
+                except Exception as e:
+                    stats["failed"] += 1
+                    logger.warning("Backfill chunk failed: %s", e)
+                    continue
+                stats["chunks"] += 1
+                pending[contract_id].append((chunk, columns))
+                if len(pending[contract_id]) >= flush_chunks:
+                    stats["bars"] += _flush(contract_id, unit, unit_number, pending[contract_id])
+                    pending[contract_id] = []
+        finally:
+            # Keep whatever finished before an interruption.
+            for future in futures:
+                future.cancel()
+            for contract_id, items in pending.items():
+                stats["bars"] += _flush(contract_id, unit, unit_number, items)
+
+    stats["seconds"] = time.perf_counter() - began
+    stats["bars_per_sec"] = stats["bars"] / stats["seconds"] if stats["seconds"] else 0.0
+    logger.info("Backfilled %d bars in %d chunks (%d failed) in %.1fs = %.0f bars/sec",
+                stats["bars"], stats["chunks"], stats["failed"], stats["seconds"], stats["bars_per_sec"])
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill historical bars into the local bar store.")
+    parser.add_argument("symbols", nargs="+", help="symbols (NQ, ES, CL...) or contract ids")
+    parser.add_argument("--days", type=float, default=30)
+    parser.add_argument("--unit", type=int, default=2)
+    parser.add_argument("--unit-number", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--rps", type=float, default=None, help="max requests per second")
+    args = parser.parse_args()
+
+    configure_logging()
+    end_time = datetime.now(timezone.utc)
+    backfill(args.symbols, end_time - timedelta(days=args.days), end_time,
+             unit=args.unit, unit_number=args.unit_number,
+             max_workers=args.workers, requests_per_second=args.rps)
@@ -0,0 +1,166 @@
+# backend/topstepx_trader/backtest.py
+
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from topstepx_trader import config
+from topstepx_trader.analytics import daily_pnl, drawdown
+from topstepx_trader.bar_store import read_bars
+from topstepx_trader.strategy import STRATEGIES, StrategyContext
+
+
+class FillModel:
+    """Market fills at the next bar's open, ``slippage_ticks`` against the trade."""
+
+    def __init__(self, slippage_ticks=None, tick_size=0.25):
+        self.slippage_ticks = config.BACKTEST_SLIPPAGE_TICKS if slippage_ticks is None else slippage_ticks
+        self.tick_size = tick_size
+
+    def prices(self, open_, trades):
+        return open_ + np.sign(trades) * self.slippage_ticks * self.tick_size
+
+
+class CommissionModel:
+    """Flat fee per contract per side."""
+
+    def __init__(self, per_contract=None):
+        self.per_contract = config.BACKTEST_COMMISSION if per_contract is None else per_contract
+
+    def costs(self, trades):
+        return np.abs(trades) * self.per_contract
+
+
+def load_bars(contract_id, start=None, end=None, unit=2, unit_number=1):
+    """Bars from the local store (see backfill.py) as in-memory NumPy columns."""
+    return {name: np.array(col) for name, col in read_bars(contract_id, unit, unit_number, start, end).items()}
+
+
+def _results(bars, position, fill, commission, point_value):
+    """
+    Mark-to-market accounting shared by both modes.
+
+    ``position[i]`` is held from bar ``i``'s open to its close; the change
+    from ``position[i - 1]`` is filled at that open.
+    """
+    trades = np.diff(position, prepend=0)
+    prices = fill.prices(bars["o"], trades)
+    costs = commission.costs(trades)
+    cash = -np.cumsum(trades * prices) * point_value - np.cumsum(costs)
+    equity = cash + position * bars["c"] * point_value
+    dd, _ = drawdown(equity)
+    _, days = daily_pnl(bars["t"].astype(np.float64), np.diff(equity, prepend=0.0))
+    std = days.std()
+    return {
+        "equity": equity,
+        "position": position,
+        "summary": {
+            "bars": int(len(position)),
+            "trades": int(np.count_nonzero(trades)),
+            "contracts": int(np.abs(trades).sum()),
+            "commission": float(costs.sum()),
+            "netPnl": float(equity[-1]) if len(equity) else 0.0,
+            "maxDrawdown": float(dd.min()) if len(dd) else 0.0,
+            "sharpe": float(days.mean() / std * np.sqrt(252)) if std else None,
+            "exposure": float(np.count_nonzero(position) / len(position)) if len(position) else 0.0,
+        },
+    }
+
+
+def run_vectorized(strategy, bars, fill=None, commission=None, point_value=20.0):
+    """Evaluate ``strategy.signals`` over all bars at once."""
+    target = np.asarray(strategy.signals(bars), dtype=np.int64)
+    position = np.concatenate([[0], target[:-1]]) if len(target) else target
+    return _results(bars, position, fill or FillModel(), commission or CommissionModel(), point_value)
+
+
+def run_events(strategy, bars, fill=None, commission=None, point_value=20.0, contract_id=None):
+    """
+    Replay bars one at a time through ``strategy.on_bar``, as the live runner
+    does. Targets returned at a bar's close are filled at the next open.
+    """
+    strategy.reset()
+    ctx = StrategyContext(contract_id)
+    names = ("t", "o", "h", "l", "c", "v")
+    columns = [bars[name].tolist() for name in names]
+    position = np.zeros(len(columns[0]), dtype=np.int64)
+    pending = None
+    for i, values in enumerate(zip(*columns)):
+        if pending is not None:
+            ctx.position = pending
+            pending = None
+        position[i] = ctx.position
+        target = strategy.on_bar(dict(zip(names, values)), ctx)
+        ctx.bars_seen += 1
+        if target is not None and target != ctx.position:
+            pending = target
+    return _results(bars, position, fill or FillModel(), commission or CommissionModel(), point_value)
+
+
+def param_grid(grid):
+    """Every combination of ``{"name": [values...]}`` as a list of param dicts."""
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[n] for n in names))]
+
+
+_sweep_state = None
+
+
+def _init_sweep(bars, strategy_cls, fill, commission, point_value):
+    # Bars are shipped to each worker once, not once per combination.
+    global _sweep_state
+    _sweep_state = (bars, strategy_cls, fill, commission, point_value)
+
+
+def _sweep_one(params):
+    bars, strategy_cls, fill, commission, point_value = _sweep_state
+    return params, run_vectorized(strategy_cls(**params), bars, fill, commission, point_value)["summary"]
+
+
+def sweep(strategy_cls, grid, bars, fill=None, commission=None, point_value=20.0, max_workers=None,
+          sort_by="netPnl"):
+    """
+    Run ``run_vectorized`` for every parameter combination on a process pool.
+
+    Returns ``(params, summary)`` pairs, best ``sort_by`` first.
+    """
+    combos = param_grid(grid) if isinstance(grid, dict) else list(grid)
+    max_workers = max_workers or config.BACKTEST_WORKERS or os.cpu_count() or 1
+    chunksize = max(1, len(combos) // (max_workers * 4))
+    initargs = (bars, strategy_cls, fill or FillModel(), commission or CommissionModel(), point_value)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_sweep, initargs=initargs) as pool:
+        results = list(pool.map(_sweep_one, combos, chunksize=chunksize))
+    return sorted(results, key=lambda r: r[1][sort_by] if r[1][sort_by] is not None else -np.inf, reverse=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep a strategy over bars in the local bar store.")
+    parser.add_argument("contract_id")
+    parser.add_argument("--strategy", default="sma_cross", choices=sorted(STRATEGIES))
+    parser.add_argument("--days", type=float, default=365)
+    parser.add_argument("--unit", type=int, default=2)
+    parser.add_argument("--unit-number", type=int, default=1)
+    parser.add_argument("--param", action="append", default=[], metavar="NAME=V1,V2,...",
+                        help="grid values for one parameter (repeatable)")
+    parser.add_argument("--point-value", type=float, default=20.0)
+    parser.add_argument("--tick-size", type=float, default=0.25)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    end_time = datetime.now(timezone.utc)
+    start_time = end_time - timedelta(days=args.days)
+    bars = load_bars(args.contract_id, int(start_time.timestamp()), int(end_time.timestamp()),
+                     args.unit, args.unit_number)
+    grid = {name: [int(v) if v.lstrip("-").isdigit() else float(v) for v in values.split(",")]
+            for name, values in (p.split("=", 1) for p in args.param)}
+    started = time.perf_counter()
+    results = sweep(STRATEGIES[args.strategy], grid, bars, fill=FillModel(tick_size=args.tick_size),
+                    point_value=args.point_value, max_workers=args.workers)
+    elapsed = time.perf_counter() - started
+    print(f"[Backtest] {len(results)} combinations over {len(bars['t'])} bars in {elapsed:.1f}s")
+    for params, summary in results[:args.top]:
+        print(params, summary)
@@ -0,0 +1,172 @@
+# backend/topstepx_trader/bar_aggregator.py
+
+import json
+import logging
+import threading
+import time
+import numpy as np
+from topstepx_trader import config
+from topstepx_trader.bar_store import COLUMNS
+from topstepx_trader.redis_utils import pipeline
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEFRAMES = (1, 60, 300, 3600)
+
+
+class BarRing:
+    """Fixed-capacity ring of closed bars, one NumPy array per OHLCV column."""
+
+    __slots__ = ("capacity", "columns", "head", "count")
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in COLUMNS.items()}
+        self.head = 0  # next write position
+        self.count = 0
+
+    def append(self, t, o, h, l, c, v):
+        i = self.head
+        cols = self.columns
+        cols["t"][i] = t
+        cols["o"][i] = o
+        cols["h"][i] = h
+        cols["l"][i] = l
+        cols["c"][i] = c
+        cols["v"][i] = v
+        self.head = (i + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def last(self, n=None):
+        """Copies of the newest ``n`` bars (all by default), oldest first."""
+        n = self.count if n is None else min(n, self.count)
+        idx = (np.arange(self.head - n, self.head)) % self.capacity
+        return {name: col[idx] for name, col in self.columns.items()}
+
+
+class _OpenBar:
+    __slots__ = ("t", "o", "h", "l", "c", "v")
+
+    def __init__(self, t, price, size):
+        self.t = t
+        self.o = self.h = self.l = self.c = price
+        self.v = size
+
+
+class BarAggregator:
+    """
+    Builds OHLCV bars for several timeframes at once from live trade ticks.
+
+    Register ``on_events`` as a bridge listener. Every timeframe (seconds) of
+    every contract keeps one open bar plus a ``BarRing`` of closed ones. A bar
+    closes when a trade lands in a later bucket or when ``close_due`` is
+    called ``close_grace`` seconds (``BAR_CLOSE_GRACE``) after the bucket has
+    ended, so ticks stamped inside the bucket that reach us a little after
+    the boundary still count; each close is passed to the
+    ``on_close(contract_id, timeframe, bar)`` callbacks and, if enabled,
+    published as JSON on the ``BAR_CLOSE_CHANNEL`` Redis channel.
+    """
+
+    def __init__(self, timeframes=DEFAULT_TIMEFRAMES, capacity=None, publish_to_redis=False, close_grace=None):
+        self.timeframes = tuple(sorted(timeframes))
+        self.capacity = capacity or config.BAR_RING_SIZE
+        self.close_grace = config.BAR_CLOSE_GRACE if close_grace is None else close_grace
+        self.publish_to_redis = publish_to_redis
+        self._open = {}    # (contract_id, timeframe) -> _OpenBar
+        self._rings = {}   # (contract_id, timeframe) -> BarRing
+        self._last_closed = {}  # (contract_id, timeframe) -> last closed bucket
+        self._callbacks = []
+        self._lock = threading.Lock()
+        self.late_ticks = 0
+
+    def on_close(self, callback):
+        self._callbacks.append(callback)
+
+    def on_events(self, events):
+        closed = []
+        with self._lock:
+            for event in events:
+                if event.kind == "trade" and event.price is not None and event.ts is not None:
+                    self._apply(event, closed)
+        self._emit(closed)
+
+    def _apply(self, trade, closed):
+        size = trade.size or 0
+        for tf in self.timeframes:
+            key = (trade.contract_id, tf)
+            bucket = int(trade.ts // tf) * tf
+            bar = self._open.get(key)
+            if bar is None:
+                if bucket <= self._last_closed.get(key, -1):
+                    self.late_ticks += 1
+                    continue
+                self._open[key] = _OpenBar(bucket, trade.price, size)
+                continue
+            if bucket == bar.t:
+                if trade.price > bar.h:
+                    bar.h = trade.price
+                elif trade.price < bar.l:
+                    bar.l = trade.price
+                bar.c = trade.price
+                bar.v += size
+            elif bucket > bar.t:
+                self._close(key, bar, closed)
+                self._open[key] = _OpenBar(bucket, trade.price, size)
+            else:
+                self.late_ticks += 1
+
+    def _close(self, key, bar, closed):
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = self._rings[key] = BarRing(self.capacity)
+        ring.append(bar.t, bar.o, bar.h, bar.l, bar.c, bar.v)
+        self._last_closed[key] = bar.t
+        closed.append((key[0], key[1], {"t": bar.t, "o": bar.o, "h": bar.h,
+                                        "l": bar.l, "c": bar.c, "v": bar.v}))
+
+    def close_due(self, now=None):
+        """Close open bars whose bucket ended ``close_grace`` ago, even with no further ticks."""
+        now = time.time() if now is None else now
+        closed = []
+        with self._lock:
+            for key, bar in list(self._open.items()):
+                if bar.t + key[1] + self.close_grace <= now:
+                    self._close(key, bar, closed)
+                    del self._open[key]
+        self._emit(closed)
+        return len(closed)
+
+    def _emit(self, closed):
+        if not closed:
+            return
+        for contract_id, tf, bar in closed:
+            for callback in self._callbacks:
+                try:
+                    callback(contract_id, tf, bar)
+                except Exception as e:
+                    logger.exception("Bar close callback failed: %s", e)
+        if self.publish_to_redis:
+            try:
+                pipe = pipeline()
+                for contract_id, tf, bar in closed:
+                    pipe.publish(config.BAR_CLOSE_CHANNEL,
+                                 json.dumps({"contractId": contract_id, "timeframe": tf, "bar": bar}))
+                pipe.execute()
+            except Exception as e:
+                logger.warning("Bar Redis publish failed: %s", e)
+
+    def bars(self, contract_id, timeframe, count=None):
+        """Closed bars as columnar arrays, oldest first."""
+        with self._lock:
+            ring = self._rings.get((contract_id, timeframe))
+            if ring is None:
+                return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()}
+            return ring.last(count)
+
+    def current_bar(self, contract_id, timeframe):
+        with self._lock:
+            bar = self._open.get((contract_id, timeframe))
+            if bar is None:
+                return None
+            return {"t": bar.t, "o": bar.o, "h": bar.h, "l": bar.l, "c": bar.c, "v": bar.v}
@@ -0,0 +1,333 @@
+# backend/topstepx_trader/bar_store.py
+
+import json
+import os
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+import numpy as np
+from topstepx_trader import config
+
+# Column name -> dtype; "t" is the bar open time in epoch seconds (UTC).
+COLUMNS = {
+    "t": np.int64,
+    "o": np.float64,
+    "h": np.float64,
+    "l": np.float64,
+    "c": np.float64,
+    "v": np.int64,
+}
+
+# Seconds per TopstepX aggregate unit. Weeks and months are not fixed-width
+# and are never stored locally.
+UNIT_SECONDS = {1: 1, 2: 60, 3: 3600, 4: 86400}
+
+_locks = {}
+_locks_guard = threading.Lock()
+_mapped = {}
+
+
+def bar_seconds(unit, unit_number):
+    if unit not in UNIT_SECONDS:
+        raise ValueError(f"Unsupported bar unit for local storage: {unit}")
+    return UNIT_SECONDS[unit] * unit_number
+
+
+def settled_before(unit, unit_number, now=None):
+    """
+    Bar boundary before which the API can be trusted to have published every
+    bar: the newest closed bar may take ``HISTORY_PUBLISH_DELAY`` seconds to
+    show up in ``retrieveBars``.
+    """
+    step = bar_seconds(unit, unit_number)
+    cutoff = int(time.time() if now is None else now) - config.HISTORY_PUBLISH_DELAY
+    return cutoff - cutoff % step
+
+
+def cap_coverage(start, end, times, unit, unit_number, now=None):
+    """
+    The part of a fetched ``[start, end)`` that can be recorded as covered.
+
+    Past ``settled_before`` an empty tail may just mean the API has not
+    published those bars yet, so coverage there stops after the newest bar
+    actually returned (``times`` are bar open epochs). None if nothing is left.
+    """
+    settled = settled_before(unit, unit_number, now)
+    if end > settled:
+        newest = max((int(t) for t in times), default=None)
+        end = min(end, max(settled, start if newest is None else newest + bar_seconds(unit, unit_number)))
+    return (start, end) if end > start else None
+
+
+def parse_timestamp(value):
+    """Epoch seconds for an API timestamp such as ``2025-07-14T05:15:00+00:00``."""
+    if isinstance(value, str) and value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    dt = datetime.fromisoformat(value)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp())
+
+
+def format_timestamp(epoch):
+    return datetime.fromtimestamp(int(epoch), timezone.utc).isoformat()
+
+
+def _series_dir(contract_id, unit, unit_number):
+    return os.path.join(config.BAR_STORE_DIR, contract_id, f"{unit}_{unit_number}")
+
+
+def _lock(path):
+    with _locks_guard:
+        return _locks.setdefault(path, threading.Lock())
+
+
+def _empty():
+    return {name: np.empty(0, dtype=dtype) for name, dtype in COLUMNS.items()}
+
+
+def _current(path):
+    """
+    Directory holding a series' live column files.
+
+    A full rewrite goes to a fresh generation directory that ``current.json``
+    is then atomically switched to, so a reader never mixes columns from two
+    rewrites. Series written before generations existed keep their columns
+    in ``path`` itself until their first rewrite.
+    """
+    try:
+        with open(os.path.join(path, "current.json"), "r") as f:
+            return os.path.join(path, json.load(f)["dir"])
+    except FileNotFoundError:
+        return path
+
+
+def _load(path, attempts=5):
+    """Memory-map every column of a series, reusing maps until the files change."""
+    for _ in range(attempts):
+        data = _current(path)
+        try:
+            stat = os.stat(os.path.join(data, "t.npy"))
+        except FileNotFoundError:
+            if data == path and _current(path) == path:
+                return _empty()
+            continue  # a rewrite replaced this generation meanwhile
+        version = (data, stat.st_mtime_ns, stat.st_size)
+        cached = _mapped.get(path)
+        if cached and cached[0] == version:
+            return cached[1]
+        try:
+            arrays = {name: np.load(os.path.join(data, f"{name}.npy"), mmap_mode="r") for name in COLUMNS}
+        except FileNotFoundError:
+            continue
+        # "t" is written last, so its length is the committed row count; other
+        # columns may hold a few extra rows from an interrupted append.
+        arrays = {name: column[:len(arrays["t"])] for name, column in arrays.items()}
+        _mapped[path] = (version, arrays)
+        return arrays
+    raise Exception(f"Bar store series {path} kept changing while being read")
+
+
+def _merge_ranges(ranges):
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def coverage(contract_id, unit, unit_number):
+    """Merged ``[start, end)`` epoch ranges already fetched from the API."""
+    path = os.path.join(_series_dir(contract_id, unit, unit_number), "coverage.json")
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def missing_ranges(contract_id, unit, unit_number, start, end):
+    """Sub-ranges of ``[start, end)`` that are not yet covered by the store."""
+    gaps = []
+    cursor = start
+    for covered_start, covered_end in coverage(contract_id, unit, unit_number):
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+def read_bars(contract_id, unit, unit_number, start=None, end=None):
+    """
+    Columnar bars with ``start <= t < end`` as read-only memory-mapped views.
+
+    Returns a dict of NumPy arrays keyed by column name, ascending by ``t``.
+    """
+    arrays = _load(_series_dir(contract_id, unit, unit_number))
+    t = arrays["t"]
+    lo = 0 if start is None else int(np.searchsorted(t, start, side="left"))
+    hi = len(t) if end is None else int(np.searchsorted(t, end, side="left"))
+    return {name: col[lo:hi] for name, col in arrays.items()}
+
+
+def bars_to_columns(bars):
+    """Columnar arrays for a list of API bar dicts."""
+    columns = {"t": np.fromiter((parse_timestamp(b["t"]) for b in bars), dtype=np.int64, count=len(bars))}
+    for name in ("o", "h", "l", "c", "v"):
+        columns[name] = np.fromiter((b[name] for b in bars), dtype=COLUMNS[name], count=len(bars))
+    return columns
+
+
+def write_bars(contract_id, unit, unit_number, bars, covered=None):
+    """
+    Merge API bars (``{"t", "o", "h", "l", "c", "v"}`` dicts) into the store.
+
+    Newer values win on duplicate timestamps. ``covered`` is the ``(start, end)``
+    epoch range the bars were fetched for, recorded so later reads know that
+    range needs no API call even where the market had no bars.
+    """
+    write_columns(contract_id, unit, unit_number, bars_to_columns(bars), covered=covered)
+
+
+def write_columns(contract_id, unit, unit_number, columns, covered=None):
+    """Columnar counterpart of ``write_bars`` for callers that already hold arrays."""
+    path = _series_dir(contract_id, unit, unit_number)
+    with _lock(path):
+        os.makedirs(path, exist_ok=True)
+        if len(columns["t"]):
+            _write_columns(path, {name: np.asarray(columns[name], dtype=dtype) for name, dtype in COLUMNS.items()})
+        if covered is not None:
+            _add_coverage(path, contract_id, unit, unit_number, [covered])
+
+
+def add_coverage(contract_id, unit, unit_number, ranges):
+    """Mark several ``(start, end)`` ranges as fetched in one write."""
+    path = _series_dir(contract_id, unit, unit_number)
+    with _lock(path):
+        os.makedirs(path, exist_ok=True)
+        _add_coverage(path, contract_id, unit, unit_number, ranges)
+
+
+def _add_coverage(path, contract_id, unit, unit_number, ranges):
+    merged = coverage(contract_id, unit, unit_number)
+    merged.extend([int(start), int(end)] for start, end in ranges)
+    tmp = os.path.join(path, "coverage.json.tmp")
+    with open(tmp, "w") as f:
+        json.dump(_merge_ranges(merged), f)
+    os.replace(tmp, os.path.join(path, "coverage.json"))
+
+
+def _dedupe(columns):
+    # Sort by time, keeping the last occurrence of each timestamp so fresh
+    # data overrides stale.
+    reversed_t = columns["t"][::-1]
+    _, first = np.unique(reversed_t, return_index=True)
+    keep = len(reversed_t) - 1 - first
+    return {name: columns[name][keep] for name in COLUMNS}
+
+
+def _write_columns(path, new):
+    new = _dedupe(new)
+    existing = _load(path)
+    count = len(existing["t"])
+    # Live and incremental writes only ever add bars after the last stored
+    # one; those are appended in place instead of rewriting the series.
+    if not (count and new["t"][0] > existing["t"][-1] and _append(_current(path), count, new)):
+        combined = new
+        if count:
+            combined = _dedupe({name: np.concatenate([existing[name], new[name]]) for name in COLUMNS})
+        _rewrite(path, combined)
+    # Drop the cached maps so the next read picks up the new rows.
+    _mapped.pop(path, None)
+
+
+def _rewrite(path, columns):
+    """Write a whole new generation of the series and switch readers to it at once."""
+    previous = _current(path)
+    name = f"gen-{os.getpid()}-{time.time_ns()}"
+    os.makedirs(os.path.join(path, name))
+    for column in COLUMNS:
+        np.save(os.path.join(path, name, f"{column}.npy"), np.ascontiguousarray(columns[column]))
+    tmp = os.path.join(path, "current.json.tmp")
+    with open(tmp, "w") as f:
+        json.dump({"dir": name}, f)
+    os.replace(tmp, os.path.join(path, "current.json"))
+    # Readers still holding maps of the old files keep them (the data stays
+    # until unmapped); one caught mid-load retries on the new generation.
+    if previous == path:
+        for column in COLUMNS:
+            try:
+                os.remove(os.path.join(path, f"{column}.npy"))
+            except FileNotFoundError:
+                pass
+    else:
+        shutil.rmtree(previous, ignore_errors=True)
+
+
+def _npy_header(file):
+    """``(data offset, dtype)`` of a version 1.0 ``.npy`` file, or None."""
+    with open(file, "rb") as f:
+        if np.lib.format.read_magic(f) != (1, 0):
+            return None
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        return (f.tell(), dtype) if len(shape) == 1 and not fortran_order else None
+
+
+def _append(path, count, new):
+    """
+    Append ``new`` rows after the first ``count`` rows of every column file.
+
+    Each file gets its data first and its header's shape after, and ``t`` is
+    done last, so readers never see rows that are not fully written. Returns
+    False (nothing written) if a header cannot take the new shape in place.
+    """
+    total = count + len(new["t"])
+    headers = {}
+    for name, dtype in COLUMNS.items():
+        file = os.path.join(path, f"{name}.npy")
+        header = _npy_header(file)
+        if header is None or header[1] != np.dtype(dtype):
+            return False
+        text = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (header[1].str, total)
+        if len(text) + 1 > header[0] - 10:
+            return False
+        headers[name] = (header[0], (text.ljust(header[0] - 11) + "\n").encode("latin1"))
+    for name in reversed(list(COLUMNS)):
+        offset, header = headers[name]
+        column = np.ascontiguousarray(new[name], dtype=COLUMNS[name])
+        with open(os.path.join(path, f"{name}.npy"), "r+b") as f:
+            f.seek(offset + count * column.itemsize)
+            f.write(column.tobytes())
+            f.truncate()
+            f.flush()
+            f.seek(10)
+            f.write(header)
+    return True
+
+
+def to_api_bars(columns, descending=True):
+    """Convert columnar bars back to the API's list-of-dicts shape."""
+    order = range(len(columns["t"]) - 1, -1, -1) if descending else range(len(columns["t"]))
+    t, o, h, l, c, v = (columns[name] for name in COLUMNS)
+    return [
+        {
+            "t": format_timestamp(t[i]),
+            "o": float(o[i]),
+            "h": float(h[i]),
+            "l": float(l[i]),
+            "c": float(c[i]),
+            "v": int(v[i]),
+        }
+        for i in order
+    ]
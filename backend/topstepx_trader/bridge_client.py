@@ -1,8 +1,276 @@
+# backend/topstepx_trader/bridge_client.py
+
+import codecs
+import json
+import logging
+import queue
+import threading
+import time
 import requests
-from topstepx_trader import config
+from topstepx_trader import config, metrics
+from topstepx_trader.market_events import parse_message
+from topstepx_trader.redis_utils import pipeline
+
+logger = logging.getLogger(__name__)
+
+STREAM_KEYS = {"quote": "market:quotes", "trade": "market:trades", "depth": "market:depth"}
+
+_listeners = []
+
+
+def add_listener(callback):
+    """Register ``callback(events)`` to receive every decoded micro-batch in-process."""
+    _listeners.append(callback)
+
+
+def remove_listener(callback):
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+class JsonStreamDecoder:
+    """
+    Incremental decoder for the bridge feed.
+
+    Accepts newline-delimited JSON, back-to-back JSON values and SSE
+    ``data:`` framing, in arbitrarily split byte chunks. Malformed lines are
+    skipped and counted in ``errors``.
+    """
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buffer = ""
+        self.errors = 0
+
+    def feed(self, chunk):
+        buf = self._buffer + self._text.decode(chunk)
+        n = len(buf)
+        pos = 0
+        out = []
+        while pos < n:
+            ch = buf[pos]
+            if ch in " \t\r\n,":
+                pos += 1
+                continue
+            if ch in "{[":
+                try:
+                    value, pos = self._decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    if e.pos >= n - 1 or e.msg.startswith("Unterminated string"):
+                        break  # incomplete value, wait for more bytes
+                    newline = buf.find("\n", e.pos)
+                    if newline < 0:
+                        break
+                    self.errors += 1
+                    pos = newline + 1
+                    continue
+                out.append(value)
+                continue
+            if buf.startswith("data:", pos):
+                pos += 5
+                continue
+            # SSE comments/fields (": ping", "event: ...", "id: ...") or stray text
+            newline = buf.find("\n", pos)
+            if newline < 0:
+                break
+            if buf[pos] != ":" and not buf.startswith(("event:", "id:", "retry:"), pos):
+                self.errors += 1
+            pos = newline + 1
+        self._buffer = buf[pos:]
+        return out
+
+
+class BridgeIngestor:
+    """
+    Reads the Node bridge ``/stream`` feed and fans typed events out to Redis
+    Streams (``market:quotes`` / ``market:trades`` / ``market:depth``) and to
+    in-process listeners.
+
+    A reader thread decodes the stream into a bounded queue; a writer thread
+    drains it in micro-batches of up to ``batch_size`` events or
+    ``batch_interval`` seconds and writes each batch with one pipelined round
+    trip. When Redis falls behind the queue fills, the reader blocks on
+    ``put`` and stops pulling from the socket, so backpressure reaches the
+    bridge over TCP instead of growing memory. Messages that fail to parse are
+    counted and skipped. Dropped connections, and any other reader error, are
+    retried with exponential backoff and resumed from the last ``seq`` seen.
+    """
+
+    def __init__(self, url=None, queue_size=None, batch_size=None, batch_interval=None,
+                 publish_to_redis=True):
+        self.url = url or f"{config.NODE_BRIDGE_URL}/stream"
+        self.queue = queue.Queue(maxsize=queue_size or config.BRIDGE_QUEUE_SIZE)
+        self.batch_size = batch_size or config.BRIDGE_BATCH_SIZE
+        self.batch_interval = batch_interval or config.BRIDGE_BATCH_INTERVAL
+        self.publish_to_redis = publish_to_redis
+        self.last_seq = None
+        self._stop = threading.Event()
+        self._response = None
+        self._started = time.monotonic()
+        self.counters = {
+            "messages": 0,
+            "events": 0,
+            "batches": 0,
+            "decode_errors": 0,
+            "parse_errors": 0,
+            "reconnects": 0,
+            "blocked_seconds": 0.0,
+            "max_queue_depth": 0,
+        }
+
+    # -- reader -----------------------------------------------------------
+
+    def _connect(self):
+        params = {}
+        headers = {}
+        if self.last_seq is not None:
+            params["since"] = self.last_seq
+            headers["Last-Event-ID"] = str(self.last_seq)
+        response = requests.get(self.url, params=params, headers=headers, stream=True,
+                                timeout=(config.HTTP_CONNECT_TIMEOUT, config.BRIDGE_READ_TIMEOUT))
+        response.raise_for_status()
+        return response
+
+    def _enqueue(self, events):
+        for event in events:
+            try:
+                self.queue.put_nowait(event)
+            except queue.Full:
+                began = time.monotonic()
+                self.queue.put(event)
+                self.counters["blocked_seconds"] += time.monotonic() - began
+        depth = self.queue.qsize()
+        metrics.BRIDGE_QUEUE_DEPTH.set(depth)
+        if depth > self.counters["max_queue_depth"]:
+            self.counters["max_queue_depth"] = depth
+
+    def _read(self):
+        backoff = config.BRIDGE_RECONNECT_MIN
+        while not self._stop.is_set():
+            decoder = JsonStreamDecoder()
+            try:
+                self._response = self._connect()
+                backoff = config.BRIDGE_RECONNECT_MIN
+                for chunk in self._response.iter_content(chunk_size=None):
+                    if self._stop.is_set():
+                        break
+                    for message in decoder.feed(chunk):
+                        self.counters["messages"] += 1
+                        metrics.BRIDGE_MESSAGES.inc()
+                        if isinstance(message, dict) and message.get("seq") is not None:
+                            self.last_seq = message["seq"]
+                        try:
+                            events = parse_message(message)
+                        except Exception as e:
+                            # One bad message (e.g. an unparseable timestamp) is skipped, not fatal.
+                            self.counters["parse_errors"] += 1
+                            metrics.BRIDGE_DECODE_ERRORS.inc()
+                            logger.warning("Skipping malformed bridge message: %s", e)
+                            continue
+                        self._enqueue(events)
+            except requests.RequestException as e:
+                logger.warning("Bridge stream error: %s", e)
+            except Exception as e:
+                logger.exception("Bridge reader error: %s", e)
+            finally:
+                self.counters["decode_errors"] += decoder.errors
+                metrics.BRIDGE_DECODE_ERRORS.inc(decoder.errors)
+                if self._response is not None:
+                    self._response.close()
+            if self._stop.is_set():
+                break
+            self.counters["reconnects"] += 1
+            metrics.BRIDGE_RECONNECTS.inc()
+            logger.info("Bridge reconnecting in %.1fs", backoff, extra={"since": self.last_seq})
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, config.BRIDGE_RECONNECT_MAX)
+
+    # -- writer -----------------------------------------------------------
+
+    def _next_batch(self):
+        try:
+            batch = [self.queue.get(timeout=self.batch_interval)]
+        except queue.Empty:
+            return []
+        deadline = time.monotonic() + self.batch_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _publish(self, batch):
+        with metrics.REDIS_LATENCY.time(op="bridge_xadd"):
+            pipe = pipeline()
+            for event in batch:
+                pipe.xadd(STREAM_KEYS[event.kind], event.to_fields(),
+                          maxlen=config.BRIDGE_STREAM_MAXLEN, approximate=True)
+            pipe.execute()
+
+    def _write(self):
+        while not (self._stop.is_set() and self.queue.empty()):
+            batch = self._next_batch()
+            if not batch:
+                continue
+            if self.publish_to_redis:
+                try:
+                    self._publish(batch)
+                except Exception as e:
+                    logger.warning("Bridge Redis publish failed: %s", e)
+            for callback in list(_listeners):
+                try:
+                    callback(batch)
+                except Exception as e:
+                    logger.exception("Bridge listener failed: %s", e)
+            self.counters["events"] += len(batch)
+            kinds = {}
+            for event in batch:
+                kinds[event.kind] = kinds.get(event.kind, 0) + 1
+            for kind, count in kinds.items():
+                metrics.BRIDGE_EVENTS.inc(count, kind=kind)
+            self.counters["batches"] += 1
+
+    # -- control ----------------------------------------------------------
+
+    def stats(self):
+        elapsed = max(time.monotonic() - self._started, 1e-9)
+        stats = dict(self.counters)
+        stats["queue_depth"] = self.queue.qsize()
+        stats["messages_per_sec"] = stats["messages"] / elapsed
+        stats["events_per_sec"] = stats["events"] / elapsed
+        return stats
+
+    def start(self):
+        self._started = time.monotonic()
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._writer = threading.Thread(target=self._write, daemon=True)
+        self._reader.start()
+        self._writer.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._response is not None:
+            self._response.close()
+
+    def join(self):
+        self._reader.join()
+        self._writer.join()
+
 
 def listen_to_bridge():
-    response = requests.get(f"{config.NODE_BRIDGE_URL}/stream", stream=True)
-    for line in response.iter_lines():
-        if line:
-            print("[Bridge]", line.decode('utf-8'))
+    ingestor = BridgeIngestor().start()
+    last_report = time.monotonic()
+    try:
+        while ingestor._reader.is_alive():
+            ingestor._reader.join(timeout=1.0)
+            if time.monotonic() - last_report >= config.BRIDGE_STATS_INTERVAL:
+                last_report = time.monotonic()
+                logger.info("Bridge stats", extra={"stats": ingestor.stats()})
+    finally:
+        ingestor.stop()
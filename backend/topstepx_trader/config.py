@@ -12,3 +12,118 @@ MARKET_HUB_URL = os.getenv("MARKET_HUB_URL")
 NODE_BRIDGE_URL = os.getenv("NODE_BRIDGE_URL")
 LIVE_MODE = os.getenv("LIVE_MODE", "false").lower() == "true"
 TSX_ACTIVE_ACCOUNTS = os.getenv("TSX_ACTIVE_ACCOUNTS")
+
+# Shared HTTP connection pool (see http_client.py)
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "4"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "32"))
+HTTP_POOL_BLOCK = os.getenv("HTTP_POOL_BLOCK", "false").lower() == "true"
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+HTTP_READ_TIMEOUT = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+
+# Retries, circuit breaking and hedging (see resilience.py); seconds unless
+# noted. Retries and hedges only ever apply to idempotent reads.
+HTTP_READ_RETRIES = int(os.getenv("HTTP_READ_RETRIES", "2"))
+HTTP_RETRY_BACKOFF = float(os.getenv("HTTP_RETRY_BACKOFF", "0.2"))
+HTTP_RETRY_BACKOFF_MAX = float(os.getenv("HTTP_RETRY_BACKOFF_MAX", "5"))
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RESET_TIMEOUT = float(os.getenv("CIRCUIT_RESET_TIMEOUT", "30"))
+HTTP_HEDGE_READS = os.getenv("HTTP_HEDGE_READS", "false").lower() == "true"
+HTTP_HEDGE_MIN_DELAY = float(os.getenv("HTTP_HEDGE_MIN_DELAY", "0.05"))
+HTTP_HEDGE_WORKERS = int(os.getenv("HTTP_HEDGE_WORKERS", "16"))
+HTTP_LATENCY_WINDOW = int(os.getenv("HTTP_LATENCY_WINDOW", "200"))  # samples per endpoint
+
+# Redis value codec per key prefix, e.g. "accounts=orjson,bars:=packed"; json
+# for anything unlisted (see serialization.py)
+REDIS_CODECS = os.getenv("REDIS_CODECS", "")
+
+# Outbound API rate limits (see request_scheduler.py) as "requests/seconds";
+# empty lifts a limit. Orders may use the last API_ORDER_RESERVE tokens alone,
+# and other requests give up after API_QUEUE_DEADLINE seconds in the queue.
+API_RATE_LIMIT = os.getenv("API_RATE_LIMIT", "200/60")
+HISTORY_RATE_LIMIT = os.getenv("HISTORY_RATE_LIMIT", "50/30")
+API_ORDER_RESERVE = int(os.getenv("API_ORDER_RESERVE", "10"))
+API_QUEUE_DEADLINE = float(os.getenv("API_QUEUE_DEADLINE", "30"))
+
+# Local on-disk OHLCV bar store (see bar_store.py)
+BAR_STORE_DIR = os.getenv(
+    "BAR_STORE_DIR",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../data/bars")),
+)
+HISTORY_MAX_BARS = int(os.getenv("HISTORY_MAX_BARS", "20000"))
+# Seconds after a bar closes before retrieveBars is trusted to include it
+HISTORY_PUBLISH_DELAY = int(os.getenv("HISTORY_PUBLISH_DELAY", "60"))
+BACKFILL_WORKERS = int(os.getenv("BACKFILL_WORKERS", "4"))
+BACKFILL_REQUESTS_PER_SECOND = float(os.getenv("BACKFILL_REQUESTS_PER_SECOND", "5"))
+
+# Local trade/order history store (see history_store.py); seconds unless noted
+HISTORY_DB_PATH = os.getenv(
+    "HISTORY_DB_PATH",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../data/history.sqlite3")),
+)
+HISTORY_SYNC_LOOKBACK_DAYS = int(os.getenv("HISTORY_SYNC_LOOKBACK_DAYS", "30"))
+HISTORY_SYNC_OVERLAP = float(os.getenv("HISTORY_SYNC_OVERLAP", "300"))
+HISTORY_SYNC_INTERVAL = float(os.getenv("HISTORY_SYNC_INTERVAL", "60"))
+
+# Contract metadata cache (see contract_cache.py); TTLs in seconds
+CONTRACT_CACHE_TTL = float(os.getenv("CONTRACT_CACHE_TTL", "21600"))
+CONTRACT_CACHE_ROLL_TTL = float(os.getenv("CONTRACT_CACHE_ROLL_TTL", "900"))
+CONTRACT_CACHE_REDIS_TTL = int(os.getenv("CONTRACT_CACHE_REDIS_TTL", "86400"))
+CONTRACT_ROLL_WINDOW_DAYS = int(os.getenv("CONTRACT_ROLL_WINDOW_DAYS", "10"))
+CONTRACT_CATALOG_REFRESH = float(os.getenv("CONTRACT_CATALOG_REFRESH", "3600"))  # see contract_catalog.py
+WATCH_SYMBOLS = [s.strip() for s in os.getenv("WATCH_SYMBOLS", "NQ").split(",") if s.strip()]
+
+# Node bridge ingestion (see bridge_client.py)
+BRIDGE_QUEUE_SIZE = int(os.getenv("BRIDGE_QUEUE_SIZE", "50000"))
+BRIDGE_BATCH_SIZE = int(os.getenv("BRIDGE_BATCH_SIZE", "500"))
+BRIDGE_BATCH_INTERVAL = float(os.getenv("BRIDGE_BATCH_INTERVAL", "0.05"))
+BRIDGE_STREAM_MAXLEN = int(os.getenv("BRIDGE_STREAM_MAXLEN", "100000"))
+BRIDGE_READ_TIMEOUT = float(os.getenv("BRIDGE_READ_TIMEOUT", "60"))
+BRIDGE_RECONNECT_MIN = float(os.getenv("BRIDGE_RECONNECT_MIN", "0.5"))
+BRIDGE_RECONNECT_MAX = float(os.getenv("BRIDGE_RECONNECT_MAX", "30"))
+BRIDGE_STATS_INTERVAL = float(os.getenv("BRIDGE_STATS_INTERVAL", "60"))
+
+# Live bar aggregation from bridge trades (see bar_aggregator.py)
+BAR_RING_SIZE = int(os.getenv("BAR_RING_SIZE", "5000"))
+BAR_CLOSE_CHANNEL = os.getenv("BAR_CLOSE_CHANNEL", "market:bars")
+BAR_CLOSE_GRACE = float(os.getenv("BAR_CLOSE_GRACE", "0.5"))  # seconds a bar stays open past its bucket
+
+# Socket.IO account broadcasts (see account_broadcast.py)
+ACCOUNT_BROADCAST_WINDOW = float(os.getenv("ACCOUNT_BROADCAST_WINDOW", "0.25"))
+
+# In-process read cache for Redis-backed endpoints (see read_cache.py); seconds
+READ_CACHE_TTL = float(os.getenv("READ_CACHE_TTL", "30"))
+
+# Concurrent order execution (see execution.py)
+EXECUTION_WORKERS = int(os.getenv("EXECUTION_WORKERS", "16"))
+EXECUTION_RETRIES = int(os.getenv("EXECUTION_RETRIES", "2"))
+EXECUTION_LATENCY_WINDOW = int(os.getenv("EXECUTION_LATENCY_WINDOW", "1000"))
+
+# Session token renewal (see token_manager.py); seconds
+TOKEN_LIFETIME = float(os.getenv("TOKEN_LIFETIME", "86400"))
+TOKEN_REFRESH_MARGIN = float(os.getenv("TOKEN_REFRESH_MARGIN", "1800"))
+TOKEN_RETRY_DELAY = float(os.getenv("TOKEN_RETRY_DELAY", "30"))
+
+# Timer scheduler worker pool (see scheduler.py)
+SCHEDULER_WORKERS = int(os.getenv("SCHEDULER_WORKERS", "8"))
+
+# Multi-account position/order poller (see account_poller.py)
+ACCOUNT_POLL_WORKERS = int(os.getenv("ACCOUNT_POLL_WORKERS", "32"))
+ACCOUNT_POLL_INTERVAL = float(os.getenv("ACCOUNT_POLL_INTERVAL", "2"))
+# Most of API_RATE_LIMIT the poller may use; the interval grows with accounts
+ACCOUNT_POLL_RATE_SHARE = float(os.getenv("ACCOUNT_POLL_RATE_SHARE", "0.5"))
+ACCOUNT_SNAPSHOT_KEY = os.getenv("ACCOUNT_SNAPSHOT_KEY", "accounts:snapshot")
+
+# Backtesting defaults (see backtest.py); commission per contract per side
+BACKTEST_COMMISSION = float(os.getenv("BACKTEST_COMMISSION", "2.0"))
+BACKTEST_SLIPPAGE_TICKS = float(os.getenv("BACKTEST_SLIPPAGE_TICKS", "1"))
+BACKTEST_WORKERS = int(os.getenv("BACKTEST_WORKERS", "0"))  # 0 = one per CPU
+
+# Live strategy processes (see strategy_runner.py); STRATEGY_CONFIG is a JSON list of specs
+STRATEGY_CONFIG = os.getenv("STRATEGY_CONFIG", "[]")
+STRATEGY_QUEUE_SIZE = int(os.getenv("STRATEGY_QUEUE_SIZE", "100"))
+STRATEGY_LATENCY_WINDOW = int(os.getenv("STRATEGY_LATENCY_WINDOW", "1000"))
+STRATEGY_STATS_INTERVAL = float(os.getenv("STRATEGY_STATS_INTERVAL", "5"))
+
+# Logging (see logging_setup.py)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # text | json
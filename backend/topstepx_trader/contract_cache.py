@@ -0,0 +1,182 @@
+# backend/topstepx_trader/contract_cache.py
+
+import calendar
+import logging
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+import redis
+from topstepx_trader import config
+from topstepx_trader.contracts import search_contracts, search_contract_by_id
+from topstepx_trader.redis_utils import get_json, set_json
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = "contracts:index"
+
+# CME month codes used in contract ids such as CON.F.US.ENQ.U25.
+MONTH_CODES = {"F": 1, "G": 2, "H": 3, "J": 4, "K": 5, "M": 6,
+               "N": 7, "Q": 8, "U": 9, "V": 10, "X": 11, "Z": 12}
+
+# "NQ:sim" -> {"contractId": ..., "expires": epoch seconds}
+_front_month = {}
+# contract id -> contract details as returned by the API
+_contracts = {}
+_lock = threading.Lock()
+_loaded = False
+_refresher = None
+
+
+def _key(symbol, live):
+    return f"{symbol}:{'live' if live else 'sim'}"
+
+
+def third_friday(year, month):
+    first_weekday, _ = calendar.monthrange(year, month)
+    first_friday = 1 + (calendar.FRIDAY - first_weekday) % 7
+    return date(year, month, first_friday + 14)
+
+
+def contract_expiry(contract_id):
+    """Approximate expiry (third Friday of the contract month) from the id suffix."""
+    try:
+        code = contract_id.rsplit(".", 1)[1]
+        month = MONTH_CODES[code[0]]
+        year = 2000 + int(code[1:])
+    except (IndexError, KeyError, ValueError):
+        return None
+    return third_friday(year, month)
+
+
+def near_roll(contract_id, today=None):
+    """True when ``contract_id`` is within ``CONTRACT_ROLL_WINDOW_DAYS`` of expiring."""
+    expiry = contract_expiry(contract_id)
+    if expiry is None:
+        return False
+    today = today or datetime.now(timezone.utc).date()
+    return expiry - timedelta(days=config.CONTRACT_ROLL_WINDOW_DAYS) <= today <= expiry + timedelta(days=1)
+
+
+def _ttl(contract_id):
+    if near_roll(contract_id):
+        return config.CONTRACT_CACHE_ROLL_TTL
+    return config.CONTRACT_CACHE_TTL
+
+
+def pick_front_month(symbol, contracts):
+    """
+    Prefer an active contract whose name is exactly the symbol root plus a
+    month/year code (``NQU5`` for ``NQ``), so ``NQ`` never resolves to ``MNQ``
+    or ``QG``; otherwise keep the API's first result.
+    """
+    for contract in contracts:
+        if contract.get("activeContract", True) and contract.get("name", "")[:-2] == symbol:
+            return contract
+    return contracts[0] if contracts else None
+
+
+def _load_from_redis():
+    global _loaded
+    _loaded = True
+    try:
+        data = get_json(REDIS_KEY)
+    except redis.exceptions.RedisError as e:
+        logger.warning("Redis unavailable, contract cache starting cold: %s", e)
+        return
+    if data:
+        _front_month.update(data.get("frontMonth", {}))
+        _contracts.update(data.get("contracts", {}))
+
+
+def _persist():
+    try:
+        set_json(REDIS_KEY, {"frontMonth": _front_month, "contracts": _contracts},
+                 ttl=config.CONTRACT_CACHE_REDIS_TTL)
+    except redis.exceptions.RedisError as e:
+        logger.warning("Could not persist contract index: %s", e)
+
+
+def refresh(symbol, live=False):
+    """Re-resolve ``symbol`` over the API and update the index."""
+    result = search_contracts(symbol, live=live)
+    contracts = (result or {}).get("contracts", [])
+    contract = pick_front_month(symbol, contracts)
+    if contract is None:
+        raise Exception("No contracts found for symbol")
+    with _lock:
+        for item in contracts:
+            _contracts[item["id"]] = item
+        _front_month[_key(symbol, live)] = {
+            "contractId": contract["id"],
+            "expires": time.time() + _ttl(contract["id"]),
+        }
+        _persist()
+    return contract["id"]
+
+
+def front_month_contract_id(symbol="NQ", live=False):
+    """
+    Current front-month contract id for ``symbol``.
+
+    A local dictionary lookup on the hot path; the API is only called on a
+    cold miss or once the entry's TTL (shorter around roll dates) has passed.
+    """
+    if not _loaded:
+        with _lock:
+            if not _loaded:
+                _load_from_redis()
+    entry = _front_month.get(_key(symbol, live))
+    if entry is not None and entry["expires"] > time.time():
+        return entry["contractId"]
+    if entry is not None and _refresher is not None:
+        # Serve the stale id; the background refresher is already on it.
+        return entry["contractId"]
+    return refresh(symbol, live)
+
+
+def contract_details(contract_id):
+    """Cached contract metadata (tick size, tick value, description...)."""
+    contract = _contracts.get(contract_id)
+    if contract is not None:
+        return contract
+    result = search_contract_by_id(contract_id)
+    contract = (result or {}).get("contract")
+    if contract:
+        with _lock:
+            _contracts[contract_id] = contract
+            _persist()
+    return contract
+
+
+def front_month_details(symbol="NQ", live=False):
+    return contract_details(front_month_contract_id(symbol, live))
+
+
+def _refresh_loop():
+    while True:
+        now = time.time()
+        next_due = now + config.CONTRACT_CACHE_ROLL_TTL
+        for key, entry in list(_front_month.items()):
+            if entry["expires"] <= now:
+                symbol, mode = key.rsplit(":", 1)
+                try:
+                    refresh(symbol, live=(mode == "live"))
+                except Exception as e:
+                    logger.warning("Contract refresh failed for %s: %s", symbol, e)
+                    continue
+            next_due = min(next_due, _front_month[key]["expires"])
+        time.sleep(max(1.0, next_due - time.time()))
+
+
+def start_background_refresh(symbols=(), live=False):
+    """
+    Warm the index for ``symbols`` and keep every tracked symbol fresh from a
+    daemon thread, which wakes at the earliest entry expiry.
+    """
+    global _refresher
+    for symbol in symbols:
+        front_month_contract_id(symbol, live)
+    if _refresher is None:
+        _refresher = threading.Thread(target=_refresh_loop, daemon=True)
+        _refresher.start()
+    return _refresher
@@ -0,0 +1,188 @@
+# backend/topstepx_trader/contract_catalog.py
+
+import bisect
+import logging
+import re
+import threading
+import time
+import redis
+from topstepx_trader import config
+from topstepx_trader.contracts import available_contracts
+from topstepx_trader.redis_utils import get_json, set_json
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = "contracts:catalog"
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def symbol_root(contract):
+    """``NQ`` for ``NQU5``: the contract name without its month/year code."""
+    name = contract.get("name") or ""
+    return name[:-2] if len(name) > 2 and name[-1].isdigit() else name
+
+
+class ContractIndex:
+    """
+    Immutable in-memory search index over a list of contracts.
+
+    Every contract contributes lower-cased keys: its name (``nqu5``), symbol
+    root (``nq``), id, ``symbolId`` parts and the words of its description,
+    weighted in that order. Postings are grouped per (key, weight) and
+    pre-sorted (active contracts first, then by name), so a query only ranks
+    the handful of distinct keys it matches and stops once ``limit``
+    contracts are found. Prefix matches come from a sorted key list via
+    ``bisect``; when those run short, keys are compared by trigram
+    similarity, so typos such as ``nasdq`` still find NQ.
+    """
+
+    def __init__(self, contracts):
+        self.contracts = list(contracts)
+        units = {}  # (key, weight) -> contract indexes
+        for i, contract in enumerate(self.contracts):
+            keys = {(contract.get("name") or "").lower(): 3, symbol_root(contract).lower(): 3,
+                    (contract.get("id") or "").lower(): 2}
+            for part in (contract.get("symbolId") or "").lower().split("."):
+                keys.setdefault(part, 2)
+            for word in _WORD.findall((contract.get("description") or "").lower()):
+                keys.setdefault(word, 1)
+            for key, weight in keys.items():
+                if key:
+                    units.setdefault((key, weight), []).append(i)
+
+        def order(i):
+            return (not self.contracts[i].get("activeContract", True), self.contracts[i].get("name") or "")
+
+        self._units = sorted((key, weight, tuple(sorted(ids, key=order))) for (key, weight), ids in units.items())
+        self._keys = [key for key, _, _ in self._units]
+        self._grams = {}  # trigram -> unit indexes (short description words are skipped)
+        self._gram_counts = []
+        for u, (key, weight, _) in enumerate(self._units):
+            grams = _trigrams(key) if weight >= 2 or len(key) > 2 else set()
+            self._gram_counts.append(len(grams))
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(u)
+
+    def __len__(self):
+        return len(self.contracts)
+
+    def _prefix(self, query):
+        lo = bisect.bisect_left(self._keys, query)
+        hi = bisect.bisect_left(self._keys, query + "\uffff", lo)
+        return [((100 if key == query else 50) + 10 * weight - 0.1 * len(key), ids)
+                for key, weight, ids in self._units[lo:hi]]
+
+    def _fuzzy(self, query):
+        # Dice similarity of trigram sets between the query and each key.
+        query_grams = _trigrams(query)
+        counts = {}
+        for gram in query_grams:
+            for u in self._grams.get(gram, ()):
+                counts[u] = counts.get(u, 0) + 1
+        scored = []
+        for u, shared in counts.items():
+            similarity = 2.0 * shared / (len(query_grams) + self._gram_counts[u])
+            if similarity >= 0.5:
+                scored.append((40 * similarity + self._units[u][1], self._units[u][2]))
+        return scored
+
+    def _matches(self, word, limit):
+        scored = self._prefix(word)
+        if len(word) >= 3 and sum(len(ids) for _, ids in scored) < limit:
+            scored += self._fuzzy(word)
+        scored.sort(key=lambda item: -item[0])
+        return scored
+
+    def search(self, query, limit=20):
+        """Best matches for ``query`` (any symbol, name or description text), best first."""
+        words = _WORD.findall((query or "").lower())
+        if not words:
+            return []
+        if len(words) == 1:
+            # Units arrive best first, so a contract's first sighting is its best score.
+            seen, results = set(), []
+            for _, ids in self._matches(words[0], limit):
+                for i in ids:
+                    if i not in seen:
+                        seen.add(i)
+                        results.append(self.contracts[i])
+                        if len(results) == limit:
+                            return results
+            return results
+        # Multi-word queries ("micro nasdaq") need every word to match; scores add up.
+        totals = None
+        for word in words:
+            best = {}
+            for score, ids in self._matches(word, limit):
+                for i in ids:
+                    best.setdefault(i, score)
+            totals = best if totals is None else {i: s + best[i] for i, s in totals.items() if i in best}
+        ranked = sorted(totals, key=lambda i: (-totals[i], self.contracts[i].get("name") or ""))
+        return [self.contracts[i] for i in ranked[:limit]]
+
+
+class ContractCatalog:
+    """
+    Every available contract, searchable locally.
+
+    ``refresh`` pulls the full list from ``Contract/available``, builds a new
+    ``ContractIndex`` and swaps it in, so searches never wait on the API or
+    see a half-built index. The list is kept in Redis too, so a restarted
+    process serves searches immediately and refreshes in the background.
+    """
+
+    def __init__(self, live=None, fetch=None):
+        self.live = config.LIVE_MODE if live is None else live
+        self.fetch = fetch or available_contracts
+        self.index = ContractIndex([])
+        self.refreshed_at = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Seed the index from the copy in Redis; True if one was found."""
+        try:
+            data = get_json(REDIS_KEY)
+        except redis.exceptions.RedisError as e:
+            logger.warning("Redis unavailable, contract catalog starting empty: %s", e)
+            return False
+        if not data or len(self.index):
+            return False
+        self.index = ContractIndex(data.get("contracts", []))
+        self.refreshed_at = data.get("refreshedAt")
+        return True
+
+    def refresh(self):
+        result = self.fetch(live=self.live)
+        contracts = (result or {}).get("contracts")
+        if not contracts:
+            raise Exception(f"Contract/available returned no contracts: {(result or {}).get('errorMessage')}")
+        index = ContractIndex(contracts)
+        with self._lock:
+            self.index = index
+            self.refreshed_at = time.time()
+        try:
+            set_json(REDIS_KEY, {"contracts": contracts, "refreshedAt": self.refreshed_at})
+        except redis.exceptions.RedisError as e:
+            logger.warning("Could not persist contract catalog: %s", e)
+        return len(index)
+
+    def search(self, query, limit=20):
+        return self.index.search(query, limit)
+
+    def start_background_refresh(self, scheduler, interval=None):
+        """Load the Redis copy, then refresh now and every ``interval`` seconds on ``scheduler``."""
+        self.load()
+        if "contract-catalog" not in scheduler.jobs:
+            scheduler.every(interval or config.CONTRACT_CATALOG_REFRESH, self.refresh,
+                            name="contract-catalog", first_delay=0)
+            scheduler.start()
+        return self
+
+
+catalog = ContractCatalog()
@@ -1,39 +1,50 @@
 # topstepx_trader/contracts.py
-import requests
-from topstepx_trader import config
+import logging
+from topstepx_trader import config, http_client
+
+logger = logging.getLogger(__name__)
+
+def _json_or_none(response, what):
+    try:
+        result = response.json()
+    except ValueError:
+        logger.warning("%s returned non-JSON response", what,
+                       extra={"status": response.status_code, "body": response.text[:500]})
+        return None
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s response", what, extra={"status": response.status_code, "response": result})
+    return result
 
 def search_contracts(search_text="NQ", live=False):
     url = f"{config.BASE_API_URL}/api/Contract/search"
     headers = {
         "accept": "text/plain",
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {config.SESSION_TOKEN}"
+        "Content-Type": "application/json"
     }
     payload = {"searchText": search_text, "live": live}
-    print("[DEBUG] Searching contracts with token:", config.SESSION_TOKEN[:10])
-    response = requests.post(url, headers=headers, json=payload)
-    print(f"[DEBUG] Status Code: {response.status_code}")
-    try:
-        print("[DEBUG] Response:", response.json())
-        return response.json()
-    except Exception:
-        print("[DEBUG] Non-JSON response:", response.text)
-        return None
+    logger.debug("Searching contracts", extra={"searchText": search_text, "live": live})
+    response = http_client.post(url, headers=headers, json=payload, authorized=True)
+    return _json_or_none(response, "Contract/search")
 
 def search_contract_by_id(contract_id):
     url = f"{config.BASE_API_URL}/api/Contract/searchById"
     headers = {
         "accept": "text/plain",
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {config.SESSION_TOKEN}"
+        "Content-Type": "application/json"
     }
     payload = {"contractId": contract_id}
-    print("[DEBUG] Searching contract by ID with token:", config.SESSION_TOKEN[:10])
-    response = requests.post(url, headers=headers, json=payload)
-    print(f"[DEBUG] Status Code: {response.status_code}")
-    try:
-        print("[DEBUG] Response:", response.json())
-        return response.json()
-    except Exception:
-        print("[DEBUG] Non-JSON response:", response.text)
-        return None
+    logger.debug("Searching contract by id", extra={"contractId": contract_id})
+    response = http_client.post(url, headers=headers, json=payload, authorized=True)
+    return _json_or_none(response, "Contract/searchById")
+
+def available_contracts(live=False):
+    """Every contract the API currently offers (the basis of the local contract catalog)."""
+    url = f"{config.BASE_API_URL}/api/Contract/available"
+    headers = {
+        "accept": "text/plain",
+        "Content-Type": "application/json"
+    }
+    payload = {"live": live}
+    logger.debug("Listing available contracts", extra={"live": live})
+    response = http_client.post(url, headers=headers, json=payload, authorized=True)
+    return _json_or_none(response, "Contract/available")
@@ -0,0 +1,176 @@
+# backend/topstepx_trader/execution.py
+
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+import requests
+from topstepx_trader import config, resilience
+from topstepx_trader import order_api_client
+from topstepx_trader.request_scheduler import ORDERS, QueueDeadlineExceeded
+from topstepx_trader.resilience import CircuitOpenError
+
+# Seconds either side of a place's first send searched for its customTag, to
+# absorb clock skew between this host and the API.
+TAG_SEARCH_SLACK = 60
+
+
+def new_custom_tag():
+    return f"qx-{uuid.uuid4().hex[:24]}"
+
+
+def place_intent(order_data):
+    return {"action": "place", "order": dict(order_data)}
+
+
+def cancel_intent(account_id, order_id):
+    return {"action": "cancel", "accountId": account_id, "orderId": order_id}
+
+
+def modify_intent(account_id, order_id, **changes):
+    return {"action": "modify", "accountId": account_id, "orderId": order_id, "changes": changes}
+
+
+def _iso(epoch):
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _percentile(ordered, pct):
+    if not ordered:
+        return None
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+class ExecutionEngine:
+    """
+    Dispatches batches of order intents concurrently over the pooled session.
+
+    Every placed order carries a ``customTag`` (generated when missing). When
+    a place fails in transport or with a 5xx its outcome is unknown, so
+    after every such failure, the last one included, the engine waits a
+    jittered backoff and searches the account's recent orders of every
+    status (filled ones included) for the tag; a match is the order's result
+    and nothing is resent. If that lookup fails too nothing is resent.
+
+    Each result has a ``status``: ``"success"``, ``"failed"`` (rejected by
+    the API, never sent, or confirmed absent by the tag lookup) or
+    ``"unknown"`` (sent, but whether it took effect could not be confirmed;
+    ``success`` is None). Submit-to-ack latency is recorded per order.
+    """
+
+    def __init__(self, max_workers=None, retries=None):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers or config.EXECUTION_WORKERS,
+                                       thread_name_prefix="execution")
+        self.retries = config.EXECUTION_RETRIES if retries is None else retries
+        self._latencies = deque(maxlen=config.EXECUTION_LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def submit(self, intent):
+        """Dispatch one intent; returns a Future resolving to its result dict."""
+        if intent["action"] == "place":
+            intent["order"].setdefault("customTag", None)
+            if not intent["order"]["customTag"]:
+                intent["order"]["customTag"] = new_custom_tag()
+        return self.pool.submit(self._execute, intent)
+
+    def submit_batch(self, intents):
+        """Dispatch every intent at once and wait; results keep the input order."""
+        futures = [self.submit(intent) for intent in intents]
+        return [future.result() for future in futures]
+
+    def _call(self, intent):
+        action = intent["action"]
+        if action == "place":
+            return order_api_client.place_order(intent["order"])
+        if action == "cancel":
+            return order_api_client.cancel_order(intent["accountId"], intent["orderId"])
+        if action == "modify":
+            return order_api_client.modify_order(intent["accountId"], intent["orderId"], **intent["changes"])
+        raise ValueError(f"Unknown order action: {action}")
+
+    def _find_by_tag(self, order, since):
+        now = time.time()
+        result = order_api_client.search_orders(order["accountId"], _iso(since - TAG_SEARCH_SLACK),
+                                                _iso(now + TAG_SEARCH_SLACK), priority=ORDERS)
+        for existing in (result or {}).get("orders", []):
+            if existing.get("customTag") == order["customTag"]:
+                return {"success": True, "orderId": existing.get("id"), "errorCode": 0,
+                        "errorMessage": None, "recovered": True}
+        return None
+
+    def _execute(self, intent):
+        result = {"intent": intent, "response": None, "success": False, "attempts": 0,
+                  "latencyMs": None, "error": None}
+        placing = intent["action"] == "place"
+        start = time.perf_counter()
+        since = time.time()
+        if placing:
+            result["customTag"] = intent["order"]["customTag"]
+            result["sentAt"] = since
+        response = None
+        uncertain = False  # a send may have reached the API without us seeing the answer
+        while True:
+            result["attempts"] += 1
+            try:
+                response = self._call(intent)
+                break
+            except (QueueDeadlineExceeded, CircuitOpenError) as e:
+                # Never sent: stale in the queue, or the endpoint is failing fast.
+                result["error"] = str(e)
+                break
+            except requests.RequestException as e:
+                result["error"] = str(e)
+                uncertain = True
+            last = result["attempts"] > self.retries
+            if placing or not last:
+                time.sleep(resilience.backoff(result["attempts"] - 1))
+            if placing:
+                try:
+                    response = self._find_by_tag(intent["order"], since)
+                except (requests.RequestException, QueueDeadlineExceeded, CircuitOpenError) as e:
+                    result["error"] += f"; customTag lookup failed, not resending: {e}"
+                    break
+                if response is not None:
+                    break
+                uncertain = False  # the tag is not there: nothing was placed
+            if last:
+                break
+        if response is not None:
+            result["response"] = response
+            result["success"] = bool(response.get("success"))
+            result["error"] = None if result["success"] else response.get("errorMessage")
+            result["status"] = "success" if result["success"] else "failed"
+        elif uncertain:
+            result["success"] = None
+            result["status"] = "unknown"
+        else:
+            result["status"] = "failed"
+        result["latencyMs"] = (time.perf_counter() - start) * 1000.0
+        if result["success"]:
+            with self._lock:
+                self._latencies.append(result["latencyMs"])
+        return result
+
+    def confirm_place(self, result):
+        """
+        Settle an ``unknown`` place result by its customTag: True if the order
+        landed, False if not. Raises if the lookup itself fails.
+        """
+        return self._find_by_tag(result["intent"]["order"], result["sentAt"]) is not None
+
+    def latency_stats(self):
+        """p50/p95/p99/max submit-to-ack latency (ms) over recent successful orders."""
+        with self._lock:
+            ordered = sorted(self._latencies)
+        return {
+            "count": len(ordered),
+            "p50": _percentile(ordered, 50),
+            "p95": _percentile(ordered, 95),
+            "p99": _percentile(ordered, 99),
+            "max": ordered[-1] if ordered else None,
+        }
+
+    def shutdown(self, wait=True):
+        self.pool.shutdown(wait=wait)
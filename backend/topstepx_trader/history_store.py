@@ -0,0 +1,260 @@
+# backend/topstepx_trader/history_store.py
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from topstepx_trader import config
+from topstepx_trader.market_events import parse_time
+from topstepx_trader.order_api_client import search_orders
+from topstepx_trader.trades_api_client import search_trades
+
+# Order statuses that can still change after creation (None, Open, Pending).
+OPEN_ORDER_STATUSES = (0, 1, 6)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trades (
+    id INTEGER PRIMARY KEY,
+    account_id INTEGER NOT NULL,
+    contract_id TEXT,
+    ts REAL NOT NULL,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trades_account_ts ON trades (account_id, ts);
+CREATE INDEX IF NOT EXISTS trades_contract_ts ON trades (contract_id, ts);
+
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY,
+    account_id INTEGER NOT NULL,
+    contract_id TEXT,
+    ts REAL NOT NULL,
+    status INTEGER,
+    raw TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_account_ts ON orders (account_id, ts);
+CREATE INDEX IF NOT EXISTS orders_contract_ts ON orders (contract_id, ts);
+CREATE INDEX IF NOT EXISTS orders_account_status ON orders (account_id, status);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    account_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    low REAL NOT NULL,
+    high REAL NOT NULL,
+    PRIMARY KEY (account_id, kind)
+);
+"""
+
+# Idle connections kept per database path.
+POOL_SIZE = 8
+
+_pools = {}  # path -> idle connections
+_pool_lock = threading.Lock()
+_sync_locks = {}
+_sync_guard = threading.Lock()
+
+
+def _iso(epoch):
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _open(path):
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+@contextmanager
+def connect():
+    """
+    Borrow a pooled SQLite connection to ``HISTORY_DB_PATH``.
+
+    Connections are shared by every thread and greenlet (under eventlet each
+    request is its own greenlet, so per-thread connections meant a new one,
+    and a schema check, per request). WAL mode and the schema are set up once
+    per path; up to ``POOL_SIZE`` idle connections are kept for reuse.
+    """
+    path = config.HISTORY_DB_PATH
+    with _pool_lock:
+        idle = _pools.get(path)
+        if idle is None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            conn = _open(path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            idle = _pools[path] = [conn]
+        conn = idle.pop() if idle else None
+    if conn is None:
+        conn = _open(path)
+    try:
+        yield conn
+    finally:
+        if conn.in_transaction:
+            conn.rollback()
+        with _pool_lock:
+            if len(idle) < POOL_SIZE:
+                idle.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+
+
+def _sync_lock(account_id, kind):
+    with _sync_guard:
+        return _sync_locks.setdefault((account_id, kind), threading.Lock())
+
+
+def _sync_range(conn, account_id, kind):
+    row = conn.execute("SELECT low, high FROM sync_state WHERE account_id = ? AND kind = ?",
+                       (account_id, kind)).fetchone()
+    return row if row else (None, None)
+
+
+def _save_range(conn, account_id, kind, low, high):
+    conn.execute(
+        "INSERT INTO sync_state (account_id, kind, low, high) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT (account_id, kind) DO UPDATE SET low = excluded.low, high = excluded.high",
+        (account_id, kind, low, high),
+    )
+
+
+def _store_trades(conn, trades):
+    conn.executemany(
+        "INSERT OR REPLACE INTO trades (id, account_id, contract_id, ts, raw) VALUES (?, ?, ?, ?, ?)",
+        [(t["id"], t["accountId"], t.get("contractId"), parse_time(t.get("creationTimestamp")) or 0.0,
+          json.dumps(t)) for t in trades],
+    )
+
+
+def _store_orders(conn, orders):
+    conn.executemany(
+        "INSERT OR REPLACE INTO orders (id, account_id, contract_id, ts, status, raw) VALUES (?, ?, ?, ?, ?, ?)",
+        [(o["id"], o["accountId"], o.get("contractId"), parse_time(o.get("creationTimestamp")) or 0.0,
+          o.get("status"), json.dumps(o)) for o in orders],
+    )
+
+
+def _fetch_trades(account_id, start, end):
+    result = search_trades(account_id, _iso(start), _iso(end))
+    if not result or not result.get("success"):
+        raise Exception(f"Trade search failed for account {account_id}: {result}")
+    return result.get("trades") or []
+
+
+def _fetch_orders(account_id, start, end):
+    result = search_orders(account_id, _iso(start), _iso(end))
+    if not result or not result.get("success"):
+        raise Exception(f"Order search failed for account {account_id}: {result}")
+    return result.get("orders") or []
+
+
+def sync_trades(account_id, start=None, now=None):
+    """
+    Bring the local trade store for ``account_id`` up to date.
+
+    Only the range after the high-water mark (minus ``HISTORY_SYNC_OVERLAP``
+    seconds, for late-arriving fills) is requested, plus anything older than
+    ``start`` that has never been fetched. Returns the number of API calls.
+    """
+    return _sync(account_id, "trades", _fetch_trades, _store_trades, start, now)
+
+
+def sync_orders(account_id, start=None, now=None):
+    """
+    Same as ``sync_trades`` for orders. Orders change after creation, so the
+    window also reaches back to the oldest order still open in the store.
+    """
+    return _sync(account_id, "orders", _fetch_orders, _store_orders, start, now)
+
+
+def _sync(account_id, kind, fetch, store, start, now):
+    now = time.time() if now is None else now
+    with _sync_lock(account_id, kind), connect() as conn:
+        low, high = _sync_range(conn, account_id, kind)
+        if low is None:
+            start = now - config.HISTORY_SYNC_LOOKBACK_DAYS * 86400 if start is None else start
+            low = high = start
+        calls = 0
+        if start is not None and start < low:
+            with conn:
+                store(conn, fetch(account_id, start, low))
+                low = start
+                _save_range(conn, account_id, kind, low, high)
+            calls += 1
+        since = high - config.HISTORY_SYNC_OVERLAP
+        if kind == "orders":
+            oldest_open = conn.execute(
+                "SELECT MIN(ts) FROM orders WHERE account_id = ? AND status IN (%s)"
+                % ",".join("?" * len(OPEN_ORDER_STATUSES)),
+                (account_id, *OPEN_ORDER_STATUSES),
+            ).fetchone()[0]
+            if oldest_open is not None:
+                since = min(since, oldest_open)
+        if since < now:
+            records = fetch(account_id, max(since, low), now)
+            with conn:
+                store(conn, records)
+                _save_range(conn, account_id, kind, low, now)
+            calls += 1
+        return calls
+
+
+def _query(table, account_id, contract_id, start, end, status=None):
+    clauses, params = [], []
+    if account_id is not None:
+        clauses.append("account_id = ?")
+        params.append(account_id)
+    if contract_id is not None:
+        clauses.append("contract_id = ?")
+        params.append(contract_id)
+    if start is not None:
+        clauses.append("ts >= ?")
+        params.append(start)
+    if end is not None:
+        clauses.append("ts < ?")
+        params.append(end)
+    if status is not None:
+        clauses.append("status = ?")
+        params.append(status)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    with connect() as conn:
+        rows = conn.execute(f"SELECT raw FROM {table} {where} ORDER BY ts, id", params).fetchall()
+    return [json.loads(raw) for (raw,) in rows]
+
+
+def query_trades(account_id=None, contract_id=None, start=None, end=None):
+    """Stored trades filtered by account, contract and ``[start, end)`` epoch range."""
+    return _query("trades", account_id, contract_id, start, end)
+
+
+def query_orders(account_id=None, contract_id=None, start=None, end=None, status=None):
+    """Stored orders filtered by account, contract, creation range and status."""
+    return _query("orders", account_id, contract_id, start, end, status)
+
+
+def _needs_sync(account_id, kind, start, end):
+    with connect() as conn:
+        low, high = _sync_range(conn, account_id, kind)
+    if low is None or (start is not None and start < low):
+        return True
+    # Past windows fully inside the synced range are served locally as-is;
+    # open-ended ones are topped up at most every HISTORY_SYNC_INTERVAL.
+    if end is not None and end <= high - config.HISTORY_SYNC_OVERLAP:
+        return False
+    return time.time() - high >= config.HISTORY_SYNC_INTERVAL
+
+
+def get_trades(account_id, start=None, end=None, contract_id=None):
+    """Trades from the local store, syncing first only if the window is not covered yet."""
+    if _needs_sync(account_id, "trades", start, end):
+        sync_trades(account_id, start)
+    return query_trades(account_id, contract_id, start, end)
+
+
+def get_orders(account_id, start=None, end=None, contract_id=None, status=None):
+    """Orders from the local store, syncing first only if the window is not covered yet."""
+    if _needs_sync(account_id, "orders", start, end):
+        sync_orders(account_id, start)
+    return query_orders(account_id, contract_id, start, end, status)
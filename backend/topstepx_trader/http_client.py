@@ -0,0 +1,221 @@
+# backend/topstepx_trader/http_client.py
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from topstepx_trader import config, metrics, request_scheduler, resilience, token_manager
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=config.HTTP_POOL_CONNECTIONS,
+        pool_maxsize=config.HTTP_POOL_MAXSIZE,
+        pool_block=config.HTTP_POOL_BLOCK,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    """
+    Return the process-wide keep-alive session shared by every API client.
+
+    Connections are pooled per host (``pool_connections`` hosts, each with up to
+    ``pool_maxsize`` idle sockets), so repeated calls to ``BASE_API_URL`` reuse
+    an open TCP+TLS connection instead of handshaking on every request.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def reset_session():
+    """Close the shared session and its pooled connections."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+
+
+def _send(session, method, url, priority=None, deadline=None, **kwargs):
+    endpoint = urlsplit(url).path
+    group, default_priority = request_scheduler.classify(endpoint)
+    priority = default_priority if priority is None else priority
+    if deadline is None and priority != request_scheduler.HISTORY:
+        deadline = config.API_QUEUE_DEADLINE
+    # Fail fast on an open circuit before waiting for (and spending) a token.
+    breaker = resilience.breaker(endpoint)
+    breaker.before()
+    try:
+        request_scheduler.outbound.acquire(group, priority, deadline)
+    except Exception:
+        breaker.release()
+        raise
+    started = time.perf_counter()
+    status = "error"
+    ok = False
+    try:
+        response = session.request(method, url, **kwargs)
+        status = str(response.status_code)
+        ok = response.status_code not in resilience.RETRYABLE_STATUSES
+        return response
+    finally:
+        elapsed = time.perf_counter() - started
+        breaker.record(ok)
+        if ok:
+            resilience.latency(endpoint).observe(elapsed)
+        metrics.HTTP_LATENCY.observe(elapsed, method=method, endpoint=endpoint)
+        metrics.HTTP_REQUESTS.inc(method=method, endpoint=endpoint, status=status)
+
+
+def _attempt(session, method, url, authorized, headers, priority, deadline, **kwargs):
+    if not authorized:
+        return _send(session, method, url, priority, deadline, headers=headers, **kwargs)
+    headers = dict(headers or {})
+    token = token_manager.get_token()
+    headers["Authorization"] = f"Bearer {token}"
+    response = _send(session, method, url, priority, deadline, headers=headers, **kwargs)
+    if response.status_code == 401:
+        headers["Authorization"] = f"Bearer {token_manager.on_unauthorized(token)}"
+        response = _send(session, method, url, priority, deadline, headers=headers, **kwargs)
+    return response
+
+
+_hedge_pool = None
+
+
+def _get_hedge_pool():
+    global _hedge_pool
+    if _hedge_pool is None:
+        with _session_lock:
+            if _hedge_pool is None:
+                _hedge_pool = ThreadPoolExecutor(max_workers=config.HTTP_HEDGE_WORKERS, thread_name_prefix="hedge")
+    return _hedge_pool
+
+
+def _hedged(call, endpoint):
+    # Send once; if no answer within the endpoint's p95, send a duplicate and
+    # take whichever succeeds first. The loser is left to finish on its own.
+    delay = resilience.hedge_delay(endpoint)
+    if delay is None:
+        return call()
+    pool = _get_hedge_pool()
+    futures = [pool.submit(call)]
+    done, _ = wait(futures, timeout=delay)
+    if not done:
+        metrics.HTTP_HEDGES.inc(endpoint=endpoint)
+        futures.append(pool.submit(call))
+    error = response = None
+    for future in as_completed(futures):
+        try:
+            response = future.result()
+        except Exception as e:
+            error = e
+            continue
+        if response.status_code not in resilience.RETRYABLE_STATUSES:
+            return response
+    if response is None:
+        raise error
+    return response
+
+
+def request(method, url, timeout=None, authorized=False, headers=None, priority=None, deadline=None,
+            retries=None, hedge=None, **kwargs):
+    """
+    Send a request through the shared pool.
+
+    Every attempt first takes a token from ``request_scheduler.outbound``:
+    the endpoint's path picks the rate-limit group and, unless ``priority``
+    is given, the priority class. A request still queued after ``deadline``
+    seconds (``API_QUEUE_DEADLINE``; history never expires) raises
+    ``QueueDeadlineExceeded`` without being sent. Before queueing, each
+    attempt passes the endpoint's circuit breaker, which fails fast with
+    ``CircuitOpenError`` while open, so a dead endpoint uses no rate budget.
+    Each attempt is bounded by ``timeout``
+    (``HTTP_CONNECT_TIMEOUT``/``HTTP_READ_TIMEOUT``).
+
+    Reads in ``resilience.IDEMPOTENT_READS`` are retried ``retries`` times
+    (``HTTP_READ_RETRIES``) with jittered backoff on transport errors and
+    429/5xx, and with ``hedge`` (``HTTP_HEDGE_READS``) are duplicated once
+    they run past the endpoint's p95. Everything else is sent exactly once.
+
+    With ``authorized=True`` the current session token from the token
+    manager is attached, and a 401 triggers one (single-flight) re-login and
+    a single resend with the new token. Every attempt is counted and timed
+    per endpoint in ``metrics``.
+    """
+    if timeout is None:
+        timeout = (config.HTTP_CONNECT_TIMEOUT, config.HTTP_READ_TIMEOUT)
+    endpoint = urlsplit(url).path
+    idempotent = endpoint in resilience.IDEMPOTENT_READS
+    if retries is None:
+        retries = config.HTTP_READ_RETRIES if idempotent else 0
+    if hedge is None:
+        hedge = idempotent and config.HTTP_HEDGE_READS
+    session = get_session()
+
+    def call():
+        return _attempt(session, method, url, authorized, headers, priority, deadline, timeout=timeout, **kwargs)
+
+    attempt = 0
+    while True:
+        response = None
+        try:
+            response = _hedged(call, endpoint) if hedge else call()
+        except resilience.TRANSPORT_ERRORS:
+            if attempt >= retries:
+                raise
+        else:
+            if attempt >= retries or response.status_code not in resilience.RETRYABLE_STATUSES:
+                return response
+        metrics.HTTP_RETRIES.inc(endpoint=endpoint)
+        time.sleep(resilience.backoff(attempt, response))
+        attempt += 1
+
+
+class ApiError(requests.HTTPError):
+    """An API response that could not be interpreted (5xx, or a non-JSON success body)."""
+
+
+def parse_json(response):
+    """
+    Decode an API response body.
+
+    5xx responses and unreadable success bodies raise ``ApiError`` (a
+    ``requests.HTTPError``): the call's outcome is unknown. Other error
+    statuses without a JSON body come back in the API's own error shape
+    (``success`` False, ``errorCode`` the HTTP status).
+    """
+    try:
+        body = response.json()
+    except ValueError:
+        body = None
+    if response.status_code >= 500 or (body is None and response.ok):
+        raise ApiError(f"{response.status_code} from {urlsplit(response.url).path}: "
+                       f"{(response.text or response.reason or '')[:200]}", response=response)
+    if body is None:
+        return {"success": False, "errorCode": response.status_code,
+                "errorMessage": (response.text or response.reason or "")[:200]}
+    return body
+
+
+def post(url, **kwargs):
+    """Drop-in replacement for ``requests.post`` that goes through the shared pool."""
+    return request("POST", url, **kwargs)
+
+
+def get(url, **kwargs):
+    """Drop-in replacement for ``requests.get`` that goes through the shared pool."""
+    return request("GET", url, **kwargs)
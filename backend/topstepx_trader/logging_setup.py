@@ -0,0 +1,53 @@
+# backend/topstepx_trader/logging_setup.py
+
+import json
+import logging
+import sys
+from topstepx_trader import config
+
+# Attributes every LogRecord has; anything else came in through ``extra=``.
+_STANDARD = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+def _fields(record):
+    return {k: v for k, v in vars(record).items() if k not in _STANDARD}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message and ``extra`` fields."""
+
+    def format(self, record):
+        entry = {"ts": record.created, "level": record.levelname, "logger": record.name,
+                 "msg": record.getMessage(), **_fields(record)}
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """Plain log line with ``extra`` fields appended as ``key=value``."""
+
+    def format(self, record):
+        line = super().format(record)
+        fields = _fields(record)
+        if fields:
+            line += " " + " ".join(f"{k}={v}" for k, v in fields.items())
+        return line
+
+
+def configure_logging(level=None, fmt=None):
+    """
+    Route ``topstepx_trader`` loggers to stderr at ``LOG_LEVEL`` in
+    ``LOG_FORMAT`` (``text`` or ``json``). Debug call sites guard expensive
+    arguments with ``isEnabledFor``, so below-level logging costs one check.
+    """
+    handler = logging.StreamHandler(sys.stderr)
+    if (fmt or config.LOG_FORMAT) == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(TextFormatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    logger = logging.getLogger("topstepx_trader")
+    logger.handlers[:] = [handler]
+    logger.setLevel((level or config.LOG_LEVEL).upper())
+    logger.propagate = False
+    return logger
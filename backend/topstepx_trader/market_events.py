@@ -0,0 +1,141 @@
+# backend/topstepx_trader/market_events.py
+
+from datetime import datetime, timezone
+
+# DomType values sent by the TopstepX market hub in GatewayDepth updates.
+DOM_ASK = 1
+DOM_BID = 2
+DOM_BEST_ASK = 3
+DOM_BEST_BID = 4
+DOM_TRADE = 5
+DOM_RESET = 6
+DOM_NEW_BEST_BID = 9
+DOM_NEW_BEST_ASK = 10
+
+
+def parse_time(value):
+    """Epoch seconds (float) for an ISO timestamp; None/empty passes through."""
+    if not value:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(value)
+    except ValueError:
+        # More than 6 fractional digits (e.g. .NET ticks); trim to microseconds.
+        head, _, tail = value.partition(".")
+        digits = "".join(ch for ch in tail if ch.isdigit())
+        zone = tail[len(digits):]
+        dt = datetime.fromisoformat(f"{head}.{digits[:6]}{zone}")
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+class QuoteEvent:
+    __slots__ = ("contract_id", "ts", "bid", "ask", "last", "volume")
+    kind = "quote"
+
+    def __init__(self, contract_id, ts, bid, ask, last, volume):
+        self.contract_id = contract_id
+        self.ts = ts
+        self.bid = bid
+        self.ask = ask
+        self.last = last
+        self.volume = volume
+
+    @classmethod
+    def from_gateway(cls, contract_id, data):
+        return cls(
+            contract_id,
+            parse_time(data.get("lastUpdated") or data.get("timestamp")),
+            data.get("bestBid"),
+            data.get("bestAsk"),
+            data.get("lastPrice"),
+            data.get("volume"),
+        )
+
+    def to_fields(self):
+        return {"c": self.contract_id, "ts": self.ts or 0, "b": _num(self.bid), "a": _num(self.ask),
+                "p": _num(self.last), "v": _num(self.volume)}
+
+
+class TradeEvent:
+    __slots__ = ("contract_id", "ts", "price", "size", "side")
+    kind = "trade"
+
+    def __init__(self, contract_id, ts, price, size, side):
+        self.contract_id = contract_id
+        self.ts = ts
+        self.price = price
+        self.size = size
+        self.side = side
+
+    @classmethod
+    def from_gateway(cls, contract_id, data):
+        return cls(contract_id, parse_time(data.get("timestamp")), data.get("price"),
+                   data.get("volume"), data.get("type"))
+
+    def to_fields(self):
+        return {"c": self.contract_id, "ts": self.ts or 0, "p": _num(self.price),
+                "v": _num(self.size), "s": _num(self.side)}
+
+
+class DepthEvent:
+    __slots__ = ("contract_id", "ts", "dom_type", "price", "size")
+    kind = "depth"
+
+    def __init__(self, contract_id, ts, dom_type, price, size):
+        self.contract_id = contract_id
+        self.ts = ts
+        self.dom_type = dom_type
+        self.price = price
+        self.size = size
+
+    @classmethod
+    def from_gateway(cls, contract_id, data):
+        return cls(contract_id, parse_time(data.get("timestamp")), data.get("type"),
+                   data.get("price"), data.get("volume"))
+
+    def to_fields(self):
+        return {"c": self.contract_id, "ts": self.ts or 0, "t": _num(self.dom_type),
+                "p": _num(self.price), "v": _num(self.size)}
+
+
+def _num(value):
+    return "" if value is None else value
+
+
+_EVENT_TYPES = {
+    "gatewayquote": QuoteEvent,
+    "quote": QuoteEvent,
+    "gatewaytrade": TradeEvent,
+    "trade": TradeEvent,
+    "gatewaydepth": DepthEvent,
+    "depth": DepthEvent,
+}
+
+
+def parse_message(message):
+    """
+    Typed events for one bridge message.
+
+    The bridge forwards market hub callbacks as
+    ``{"type": "GatewayQuote" | "GatewayTrade" | "GatewayDepth", "contractId": ..., "data": ...}``
+    where ``data`` is one object or a list of them (trades and depth arrive
+    batched). Unknown message types yield no events.
+    """
+    if not isinstance(message, dict):
+        return []
+    event_type = _EVENT_TYPES.get(str(message.get("type", "")).lower())
+    if event_type is None:
+        return []
+    contract_id = message.get("contractId")
+    data = message.get("data")
+    if isinstance(data, list):
+        return [event_type.from_gateway(contract_id, item) for item in data if isinstance(item, dict)]
+    if isinstance(data, dict):
+        return [event_type.from_gateway(contract_id, data)]
+    return []
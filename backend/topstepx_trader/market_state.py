@@ -0,0 +1,129 @@
+# backend/topstepx_trader/market_state.py
+
+import heapq
+import threading
+from topstepx_trader.market_events import (
+    DOM_ASK, DOM_BEST_ASK, DOM_BEST_BID, DOM_BID, DOM_NEW_BEST_ASK, DOM_NEW_BEST_BID, DOM_RESET,
+)
+
+_BID_TYPES = (DOM_BID, DOM_BEST_BID, DOM_NEW_BEST_BID)
+_ASK_TYPES = (DOM_ASK, DOM_BEST_ASK, DOM_NEW_BEST_ASK)
+
+
+class OrderBook:
+    """L2 book as two ``price -> size`` maps; a size of 0 removes the level."""
+
+    __slots__ = ("bids", "asks", "ts")
+
+    def __init__(self):
+        self.bids = {}
+        self.asks = {}
+        self.ts = None
+
+    def apply(self, dom_type, price, size, ts):
+        if dom_type == DOM_RESET:
+            self.bids.clear()
+            self.asks.clear()
+        elif price is not None:
+            if dom_type in _BID_TYPES:
+                side = self.bids
+            elif dom_type in _ASK_TYPES:
+                side = self.asks
+            else:
+                return
+            if size:
+                side[price] = size
+            else:
+                side.pop(price, None)
+        self.ts = ts
+
+    def top(self, depth):
+        bids = heapq.nlargest(depth, self.bids.items())
+        asks = heapq.nsmallest(depth, self.asks.items())
+        return [[p, s] for p, s in bids], [[p, s] for p, s in asks]
+
+
+class ContractState:
+    __slots__ = ("contract_id", "bid", "ask", "last", "volume", "quote_ts",
+                 "trade_price", "trade_size", "trade_side", "trade_ts", "book")
+
+    def __init__(self, contract_id):
+        self.contract_id = contract_id
+        self.bid = self.ask = self.last = self.volume = self.quote_ts = None
+        self.trade_price = self.trade_size = self.trade_side = self.trade_ts = None
+        self.book = OrderBook()
+
+
+class MarketState:
+    """
+    Latest quote, last trade and L2 book per contract, kept in process.
+
+    Register ``on_events`` as a bridge listener; ``snapshot`` and ``quote``
+    answer from memory, so readers never go to the bridge or the API.
+    """
+
+    def __init__(self):
+        self._contracts = {}
+        self._lock = threading.Lock()
+
+    def _state(self, contract_id):
+        state = self._contracts.get(contract_id)
+        if state is None:
+            state = self._contracts[contract_id] = ContractState(contract_id)
+        return state
+
+    def on_events(self, events):
+        with self._lock:
+            for event in events:
+                state = self._state(event.contract_id)
+                kind = event.kind
+                if kind == "depth":
+                    state.book.apply(event.dom_type, event.price, event.size, event.ts)
+                elif kind == "quote":
+                    # Quote updates can be partial; keep the previous value for missing fields.
+                    if event.bid is not None:
+                        state.bid = event.bid
+                    if event.ask is not None:
+                        state.ask = event.ask
+                    if event.last is not None:
+                        state.last = event.last
+                    if event.volume is not None:
+                        state.volume = event.volume
+                    state.quote_ts = event.ts
+                elif kind == "trade":
+                    state.trade_price = event.price
+                    state.trade_size = event.size
+                    state.trade_side = event.side
+                    state.trade_ts = event.ts
+
+    def contracts(self):
+        with self._lock:
+            return list(self._contracts)
+
+    def quote(self, contract_id):
+        """Best bid/ask/last as a tuple, or None if the contract is unknown."""
+        state = self._contracts.get(contract_id)
+        if state is None:
+            return None
+        return state.bid, state.ask, state.last
+
+    def snapshot(self, contract_id, depth=10):
+        with self._lock:
+            state = self._contracts.get(contract_id)
+            if state is None:
+                return None
+            bids, asks = state.book.top(depth)
+            return {
+                "contractId": contract_id,
+                "quote": {"bid": state.bid, "ask": state.ask, "last": state.last,
+                          "volume": state.volume, "ts": state.quote_ts},
+                "lastTrade": {"price": state.trade_price, "size": state.trade_size,
+                              "side": state.trade_side, "ts": state.trade_ts},
+                "book": {"bids": bids, "asks": asks, "ts": state.book.ts},
+            }
+
+    def snapshot_all(self, depth=10):
+        return {contract_id: self.snapshot(contract_id, depth) for contract_id in self.contracts()}
+
+
+market_state = MarketState()
@@ -0,0 +1,172 @@
+# backend/topstepx_trader/metrics.py
+
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+# Seconds; HTTP calls to the API and Redis round trips live on different scales.
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+REDIS_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+_registry = []
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(names, values, extra=()):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)] + list(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    def _key(self, labels):
+        return tuple(labels.get(n, "") for n in self.label_names)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = sorted(self._values.items())
+        lines.extend(self._render_items(items))
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name, help_text, labels=()):
+        super().__init__(name, help_text, labels)
+        if not self.label_names:
+            self._values[()] = 0
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels), 0)
+
+    def _render_items(self, items):
+        return [f"{self.name}{_labels(self.label_names, key)} {_number(v)}" for key, v in items]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=HTTP_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels):
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def _render_items(self, items):
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, key, [le])} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, key)} {count}")
+        return lines
+
+
+def render():
+    """Every registered metric in Prometheus text exposition format (0.0.4)."""
+    lines = []
+    for metric in list(_registry):
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+HTTP_REQUESTS = Counter("topstepx_http_requests_total", "API requests by endpoint and status.",
+                        ("method", "endpoint", "status"))
+HTTP_LATENCY = Histogram("topstepx_http_request_seconds", "API request latency by endpoint.",
+                         ("method", "endpoint"))
+REDIS_LATENCY = Histogram("topstepx_redis_op_seconds", "Redis helper call latency by operation.",
+                          ("op",), buckets=REDIS_BUCKETS)
+REDIS_ERRORS = Counter("topstepx_redis_errors_total", "Redis helper calls that raised.", ("op",))
+BRIDGE_MESSAGES = Counter("topstepx_bridge_messages_total", "Bridge stream messages decoded.")
+BRIDGE_EVENTS = Counter("topstepx_bridge_events_total", "Market events ingested from the bridge.", ("kind",))
+BRIDGE_DECODE_ERRORS = Counter("topstepx_bridge_decode_errors_total", "Undecodable bridge stream data.")
+BRIDGE_RECONNECTS = Counter("topstepx_bridge_reconnects_total", "Bridge stream reconnects.")
+BRIDGE_QUEUE_DEPTH = Gauge("topstepx_bridge_queue_depth", "Events waiting between bridge reader and writer.")
+HTTP_RETRIES = Counter("topstepx_http_retries_total", "Idempotent API reads resent after a transient failure.",
+                       ("endpoint",))
+HTTP_HEDGES = Counter("topstepx_http_hedges_total", "Duplicate API reads sent after passing the endpoint p95.",
+                      ("endpoint",))
+HTTP_CIRCUIT_OPENS = Counter("topstepx_http_circuit_opens_total", "Times an endpoint's circuit breaker opened.",
+                             ("endpoint",))
+HTTP_QUEUE_DEPTH = Gauge("topstepx_http_queue_depth", "API requests waiting for a rate-limit token.",
+                         ("group", "priority"))
+HTTP_QUEUE_WAIT = Histogram("topstepx_http_queue_wait_seconds", "Time API requests spent waiting for a token.",
+                            ("group", "priority"))
+HTTP_QUEUE_EXPIRED = Counter("topstepx_http_queue_expired_total", "API requests dropped at their queue deadline.",
+                             ("group", "priority"))
+
+
+def timed_redis(op):
+    """Decorator recording a Redis helper's latency (and failures) under ``op``."""
+    def wrap(fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            except Exception:
+                REDIS_ERRORS.inc(op=op)
+                raise
+            finally:
+                REDIS_LATENCY.observe(time.perf_counter() - started, op=op)
+        return timed
+    return wrap
@@ -1,37 +1,35 @@
 import os
 from dotenv import load_dotenv
-import requests
+from topstepx_trader import http_client
 
 load_dotenv()
 
 BASE_URL = os.getenv("BASE_API_URL")
-SESSION_TOKEN = os.getenv("SESSION_TOKEN")
 
 headers = {
-    "Authorization": f"Bearer {SESSION_TOKEN}",
     "Content-Type": "application/json"
 }
 
-def search_orders(account_id, start_ts, end_ts):
+def search_orders(account_id, start_ts, end_ts, priority=None):
     url = f"{BASE_URL}/api/Order/search"
     payload = {
         "accountId": account_id,
         "startTimestamp": start_ts,
         "endTimestamp": end_ts
     }
-    response = requests.post(url, json=payload, headers=headers)
-    return response.json()
+    response = http_client.post(url, json=payload, headers=headers, authorized=True, priority=priority)
+    return http_client.parse_json(response)
 
 def search_open_orders(account_id):
     url = f"{BASE_URL}/api/Order/searchOpen"
     payload = {"accountId": account_id}
-    response = requests.post(url, json=payload, headers=headers)
-    return response.json()
+    response = http_client.post(url, json=payload, headers=headers, authorized=True)
+    return http_client.parse_json(response)
 
 def place_order(order_data):
     url = f"{BASE_URL}/api/Order/place"
-    response = requests.post(url, json=order_data, headers=headers)
-    return response.json()
+    response = http_client.post(url, json=order_data, headers=headers, authorized=True)
+    return http_client.parse_json(response)
 
 def cancel_order(account_id, order_id):
     url = f"{BASE_URL}/api/Order/cancel"
@@ -39,11 +37,11 @@ def cancel_order(account_id, order_id):
         "accountId": account_id,
         "orderId": order_id
     }
-    response = requests.post(url, json=payload, headers=headers)
-    return response.json()
+    response = http_client.post(url, json=payload, headers=headers, authorized=True)
+    return http_client.parse_json(response)
 
 def modify_order(account_id, order_id, **kwargs):
     url = f"{BASE_URL}/api/Order/modify"
     payload = {"accountId": account_id, "orderId": order_id, **kwargs}
-    response = requests.post(url, json=payload, headers=headers)
-    return response.json()
+    response = http_client.post(url, json=payload, headers=headers, authorized=True)
+    return http_client.parse_json(response)
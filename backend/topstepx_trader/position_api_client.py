@@ -1,22 +1,20 @@
 import os
-import requests
 from dotenv import load_dotenv
+from topstepx_trader import http_client
 
 load_dotenv()
 
 BASE_URL = os.getenv("BASE_API_URL")
-SESSION_TOKEN = os.getenv("SESSION_TOKEN")
 
 headers = {
-    "Authorization": f"Bearer {SESSION_TOKEN}",
     "Content-Type": "application/json"
 }
 
 def search_open_positions(account_id):
     url = f"{BASE_URL}/api/Position/searchOpen"
     payload = {"accountId": account_id}
-    response = requests.post(url, json=payload, headers=headers)
-    return response.json()
+    response = http_client.post(url, json=payload, headers=headers, authorized=True)
+    return http_client.parse_json(response)
 
 def close_position(account_id, contract_id):
     url = f"{BASE_URL}/api/Position/closeContract"
@@ -24,8 +22,8 @@ def close_position(account_id, contract_id):
         "accountId": account_id,
         "contractId": contract_id
     }
-    response = requests.post(url, json=payload, headers=headers)
-    return response.json()
+    response = http_client.post(url, json=payload, headers=headers, authorized=True)
+    return http_client.parse_json(response)
 
 def partial_close_position(account_id, contract_id, size):
     url = f"{BASE_URL}/api/Position/partialCloseContract"
@@ -34,5 +32,5 @@ def partial_close_position(account_id, contract_id, size):
         "contractId": contract_id,
         "size": size
     }
-    response = requests.post(url, json=payload, headers=headers)
-    return response.json()
+    response = http_client.post(url, json=payload, headers=headers, authorized=True)
+    return http_client.parse_json(response)
@@ -0,0 +1,106 @@
+# backend/topstepx_trader/read_cache.py
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from topstepx_trader import config
+from topstepx_trader.redis_utils import INVALIDATION_CHANNEL, get_json, get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class CachedValue:
+    """A decoded value with its serialized JSON body and a strong ETag over it."""
+
+    __slots__ = ("value", "body", "etag", "loaded_at")
+
+    def __init__(self, value):
+        self.value = value
+        self.body = json.dumps(value, separators=(",", ":")).encode()
+        self.etag = hashlib.sha1(self.body).hexdigest()[:20]
+        self.loaded_at = time.monotonic()
+
+
+class ReadCache:
+    """
+    Read-through, in-process cache of JSON values stored in Redis.
+
+    ``set_json`` announces every written key on ``INVALIDATION_CHANNEL``; a
+    listener thread drops those keys here, so hits cost no Redis round trip,
+    decode or re-serialization. Entries are only kept while the subscription
+    is live (on reconnect everything is dropped, since messages may have been
+    missed), and ``ttl`` bounds staleness if a writer bypasses ``set_json``.
+    A per-key generation, plus a global one bumped when everything is
+    dropped, stops a load that raced with an invalidation from being stored.
+    """
+
+    def __init__(self, loader=None, channel=INVALIDATION_CHANNEL, ttl=None, subscribe=True):
+        self.loader = loader or get_json
+        self.channel = channel
+        self.ttl = config.READ_CACHE_TTL if ttl is None else ttl
+        self.subscribe = subscribe
+        self.hits = self.misses = self.invalidations = 0
+        self._entries = {}
+        self._generations = {}
+        self._epoch = 0
+        self._lock = threading.Lock()
+        self._listening = threading.Event()
+        self._thread = None
+
+    def get(self, key, default=None):
+        """``CachedValue`` for ``key``, loading through ``loader`` on a miss."""
+        self.start()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry.loaded_at < self.ttl:
+                self.hits += 1
+                return entry
+            generation = (self._epoch, self._generations.get(key, 0))
+        self.misses += 1
+        entry = CachedValue(self.loader(key, default))
+        with self._lock:
+            if self._cacheable() and (self._epoch, self._generations.get(key, 0)) == generation:
+                self._entries[key] = entry
+        return entry
+
+    def _cacheable(self):
+        return not self.subscribe or self._listening.is_set()
+
+    def invalidate(self, key=None):
+        """Drop ``key`` (or everything when None)."""
+        with self._lock:
+            self.invalidations += 1
+            if key is None:
+                self._entries.clear()
+                self._epoch += 1
+            else:
+                self._entries.pop(key, None)
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+    def _listen(self):
+        while True:
+            try:
+                pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                self.invalidate()
+                self._listening.set()
+                for message in pubsub.listen():
+                    self.invalidate(message["data"])
+            except Exception as e:
+                logger.warning("Read cache invalidation feed lost: %s", e)
+            finally:
+                self._listening.clear()
+                self.invalidate()
+            time.sleep(1.0)
+
+    def start(self):
+        """Start the invalidation listener (idempotent)."""
+        if self.subscribe and self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._listen, daemon=True)
+                    self._thread.start()
+        return self
@@ -1,32 +1,133 @@
 # backend/topstepx_trader/redis_utils.py
 
 import redis
-import json
 import os
+import threading
+from topstepx_trader import serialization
+from topstepx_trader.metrics import timed_redis
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "64"))
+# set_json announces written keys here so in-process read caches can drop them
+INVALIDATION_CHANNEL = os.getenv("CACHE_INVALIDATION_CHANNEL", "cache:invalidate")
+
+_pool = None
+_binary_pool = None
+_pool_lock = threading.Lock()
+
+def get_pool():
+    """Process-wide connection pool shared by every ``get_redis()`` client."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = redis.ConnectionPool.from_url(
+                    REDIS_URL,
+                    decode_responses=True,
+                    max_connections=REDIS_MAX_CONNECTIONS,
+                )
+    return _pool
 
 def get_redis():
-    return redis.Redis.from_url(REDIS_URL, decode_responses=True)
+    return redis.Redis(connection_pool=get_pool())
 
-def set_json(key, value):
-    client = get_redis()
-    client.set(key, json.dumps(value))
+def get_binary_pool():
+    """Second pool that returns raw bytes, for keys stored with a binary codec."""
+    global _binary_pool
+    if _binary_pool is None:
+        with _pool_lock:
+            if _binary_pool is None:
+                _binary_pool = redis.ConnectionPool.from_url(
+                    REDIS_URL,
+                    decode_responses=False,
+                    max_connections=REDIS_MAX_CONNECTIONS,
+                )
+    return _binary_pool
+
+def get_binary_redis():
+    return redis.Redis(connection_pool=get_binary_pool())
 
+def _client_for(key):
+    return get_binary_redis() if serialization.codec_for(key).binary else get_redis()
+
+@timed_redis("set_json")
+def set_json(key, value, ttl=None):
+    """Store ``value`` under ``key`` with the key's codec (json unless configured)."""
+    pipe = _client_for(key).pipeline(transaction=False)
+    pipe.set(key, serialization.encode(key, value), ex=ttl)
+    pipe.publish(INVALIDATION_CHANNEL, key)
+    pipe.execute()
+
+@timed_redis("get_json")
 def get_json(key, default=None):
-    client = get_redis()
-    val = client.get(key)
+    val = _client_for(key).get(key)
     if val is None:
         return default
-    return json.loads(val)
+    return serialization.decode(key, val)
 
-def set_str(key, value):
+@timed_redis("set_str")
+def set_str(key, value, ttl=None):
     client = get_redis()
-    client.set(key, value)
+    client.set(key, value, ex=ttl)
 
+@timed_redis("get_str")
 def get_str(key, default=None):
     client = get_redis()
     val = client.get(key)
     if val is None:
         return default
     return val
+
+@timed_redis("get_many")
+def get_many(keys, default=None):
+    """Read several string keys in one MGET round trip; returns ``{key: value}``."""
+    keys = list(keys)
+    if not keys:
+        return {}
+    values = get_redis().mget(keys)
+    return {k: (default if v is None else v) for k, v in zip(keys, values)}
+
+@timed_redis("set_many")
+def set_many(mapping, ttl=None):
+    """
+    Write several string keys in one round trip.
+
+    Without a TTL this is a single MSET; with one, the SETs are pipelined
+    inside a MULTI/EXEC so every key gets the same expiry atomically.
+    """
+    if not mapping:
+        return
+    client = get_redis()
+    if ttl is None:
+        client.mset(mapping)
+        return
+    pipe = client.pipeline(transaction=True)
+    for key, value in mapping.items():
+        pipe.set(key, value, ex=ttl)
+    pipe.execute()
+
+@timed_redis("get_json_many")
+def get_json_many(keys, default=None):
+    """Decoding counterpart of ``get_many``; binary-codec keys share one extra MGET."""
+    keys = list(keys)
+    binary = [k for k in keys if serialization.codec_for(k).binary]
+    raw = get_many([k for k in keys if k not in binary])
+    if binary:
+        raw.update(zip(binary, get_binary_redis().mget(binary)))
+    return {k: (default if raw[k] is None else serialization.decode(k, raw[k])) for k in keys}
+
+@timed_redis("set_json_many")
+def set_json_many(mapping, ttl=None):
+    """Encoding counterpart of ``set_many``, e.g. per-account snapshots."""
+    if not mapping:
+        return
+    pipe = get_binary_redis().pipeline(transaction=ttl is not None)
+    for key, value in mapping.items():
+        pipe.set(key, serialization.encode(key, value), ex=ttl)
+    for key in mapping:
+        pipe.publish(INVALIDATION_CHANNEL, key)
+    pipe.execute()
+
+def pipeline(transaction=False):
+    """Pooled pipeline for callers batching their own mixed commands."""
+    return get_redis().pipeline(transaction=transaction)
@@ -0,0 +1,206 @@
+# backend/topstepx_trader/request_scheduler.py
+
+import heapq
+import itertools
+import threading
+import time
+from topstepx_trader import config, metrics
+
+# Priority classes, most urgent first.
+ORDERS, POSITIONS, GENERAL, HISTORY = 0, 1, 2, 3
+PRIORITY_NAMES = {ORDERS: "orders", POSITIONS: "positions", GENERAL: "general", HISTORY: "history"}
+
+# Path prefix -> (token bucket group, priority); first match wins. Auth rides
+# with orders since nothing else can go out without a token.
+ROUTES = (
+    ("/api/Order/place", "api", ORDERS),
+    ("/api/Order/cancel", "api", ORDERS),
+    ("/api/Order/modify", "api", ORDERS),
+    ("/api/Position/close", "api", ORDERS),
+    ("/api/Position/partialClose", "api", ORDERS),
+    ("/api/Auth/", "api", ORDERS),
+    ("/api/Position/", "api", POSITIONS),
+    ("/api/Order/searchOpen", "api", POSITIONS),
+    ("/api/Order/search", "api", HISTORY),
+    ("/api/Trade/search", "api", HISTORY),
+    ("/api/History/", "history", HISTORY),
+)
+
+
+class QueueDeadlineExceeded(Exception):
+    """A request waited longer than its deadline for a rate-limit token and was never sent."""
+
+
+def classify(path):
+    """``(group, priority)`` for an API path."""
+    for prefix, group, priority in ROUTES:
+        if path.startswith(prefix):
+            return group, priority
+    return "api", GENERAL
+
+
+def parse_limit(spec):
+    """``"200/60"`` -> (rate per second, burst capacity); ``""`` or ``"0"`` -> unlimited."""
+    if not spec or spec.strip() in ("0", "none"):
+        return None, None
+    count, _, seconds = spec.partition("/")
+    count, seconds = float(count), float(seconds or 1)
+    return count / seconds, count
+
+
+class TokenBucket:
+    """``rate`` tokens/sec up to ``capacity``; a ``rate`` of None never runs dry."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = None if rate is None else float(rate)
+        self.capacity = float(max(1, capacity or rate or 1))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        if self.rate is not None:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_take(self, floor=0.0, now=None):
+        """Take one token if more than ``floor`` would remain; else seconds until one would."""
+        if self.rate is None:
+            return 0.0
+        self._refill(time.monotonic() if now is None else now)
+        floor = min(floor, self.capacity - 1)
+        if self.tokens >= 1 + floor:
+            self.tokens -= 1
+            return 0.0
+        return (1 + floor - self.tokens) / self.rate
+
+    def acquire(self):
+        """Block until a token is taken (for callers pacing themselves)."""
+        while True:
+            with self.lock:
+                wait = self.try_take()
+            if not wait:
+                return
+            time.sleep(wait)
+
+
+class _Group:
+    __slots__ = ("name", "bucket", "reserve", "queue", "depth", "sent", "expired")
+
+    def __init__(self, name, bucket, reserve):
+        self.name = name
+        self.bucket = bucket
+        self.reserve = reserve
+        self.queue = []  # heap of [priority, seq, live]
+        self.depth = dict.fromkeys(PRIORITY_NAMES, 0)
+        self.sent = dict.fromkeys(PRIORITY_NAMES, 0)
+        self.expired = dict.fromkeys(PRIORITY_NAMES, 0)
+
+    def take(self, priority, now):
+        # Everything but orders leaves ``reserve`` tokens in the bucket.
+        return self.bucket.try_take(0.0 if priority == ORDERS else self.reserve, now)
+
+    def head(self):
+        while self.queue and not self.queue[0][2]:
+            heapq.heappop(self.queue)
+        return self.queue[0] if self.queue else None
+
+
+class RequestScheduler:
+    """
+    Shared gate for outbound API requests.
+
+    Each endpoint group has a token bucket sized to the API's rate limit.
+    Callers that find it empty queue by priority class (orders and cancels,
+    then positions, then general calls, then history), FIFO within a class,
+    and the head of the queue gets the next token. Non-order traffic also
+    leaves ``reserve`` tokens untouched, so a backfill can never drain the
+    bucket an order needs. A caller still queued after its ``deadline`` is
+    dropped with ``QueueDeadlineExceeded`` instead of sending a stale
+    request. Queue depth and wait time are exported through ``metrics``.
+    """
+
+    def __init__(self, limits=None, reserve=None):
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._groups = {}
+        limits = limits if limits is not None else {
+            "api": parse_limit(config.API_RATE_LIMIT),
+            "history": parse_limit(config.HISTORY_RATE_LIMIT),
+        }
+        for name, (rate, capacity) in limits.items():
+            self.set_limit(name, rate, capacity)
+        if "api" in self._groups:
+            self._groups["api"].reserve = config.API_ORDER_RESERVE if reserve is None else reserve
+
+    def set_limit(self, group, rate, capacity=None):
+        """Replace ``group``'s bucket; ``rate`` None lifts the limit."""
+        with self._cond:
+            bucket = TokenBucket(rate, capacity)
+            if group in self._groups:
+                self._groups[group].bucket = bucket
+            else:
+                self._groups[group] = _Group(group, bucket, 0.0)
+            self._cond.notify_all()
+
+    def acquire(self, group, priority=GENERAL, deadline=None):
+        """Wait for a token in ``group``; returns the seconds spent queued."""
+        g = self._groups[group]
+        label = {"group": group, "priority": PRIORITY_NAMES[priority]}
+        started = time.monotonic()
+        expires = None if deadline is None else started + deadline
+        with self._cond:
+            if g.head() is None and g.take(priority, started) == 0.0:
+                g.sent[priority] += 1
+                return 0.0
+            entry = [priority, next(self._seq), True]
+            heapq.heappush(g.queue, entry)
+            g.depth[priority] += 1
+            metrics.HTTP_QUEUE_DEPTH.set(g.depth[priority], **label)
+            try:
+                while True:
+                    now = time.monotonic()
+                    wait = None
+                    if g.head() is entry:
+                        wait = g.take(priority, now)
+                        if not wait:
+                            g.sent[priority] += 1
+                            waited = now - started
+                            metrics.HTTP_QUEUE_WAIT.observe(waited, **label)
+                            return waited
+                    if expires is not None:
+                        if now >= expires:
+                            g.expired[priority] += 1
+                            metrics.HTTP_QUEUE_EXPIRED.inc(**label)
+                            raise QueueDeadlineExceeded(
+                                f"{PRIORITY_NAMES[priority]} request queued {now - started:.2f}s "
+                                f"for {group} rate limit")
+                        wait = expires - now if wait is None else min(wait, expires - now)
+                    self._cond.wait(wait)
+            finally:
+                entry[2] = False
+                g.depth[priority] -= 1
+                metrics.HTTP_QUEUE_DEPTH.set(g.depth[priority], **label)
+                self._cond.notify_all()
+
+    def stats(self):
+        """Per group: tokens left, limit, and queued/sent/expired counts per priority class."""
+        now = time.monotonic()
+        with self._cond:
+            result = {}
+            for name, g in self._groups.items():
+                g.bucket._refill(now)
+                result[name] = {
+                    "tokens": None if g.bucket.rate is None else round(g.bucket.tokens, 2),
+                    "ratePerSecond": g.bucket.rate,
+                    "capacity": g.bucket.capacity,
+                    "reserve": g.reserve,
+                    "queued": {PRIORITY_NAMES[p]: n for p, n in g.depth.items()},
+                    "sent": {PRIORITY_NAMES[p]: n for p, n in g.sent.items()},
+                    "expired": {PRIORITY_NAMES[p]: n for p, n in g.expired.items()},
+                }
+            return result
+
+
+# Process-wide scheduler used by ``http_client``.
+outbound = RequestScheduler()
@@ -0,0 +1,157 @@
+# backend/topstepx_trader/resilience.py
+
+import random
+import threading
+import time
+from collections import deque
+import requests
+from topstepx_trader import config, metrics
+
+# Read-only endpoints that are safe to resend. Anything that places, changes
+# or closes an order or position is deliberately absent: those are never
+# retried or hedged here (ExecutionEngine retries places by customTag).
+IDEMPOTENT_READS = frozenset({
+    "/api/Account/search",
+    "/api/Contract/available",
+    "/api/Contract/search",
+    "/api/Contract/searchById",
+    "/api/Order/search",
+    "/api/Order/searchOpen",
+    "/api/Position/searchOpen",
+    "/api/Trade/search",
+    "/api/History/retrieveBars",
+})
+
+# Transient statuses worth another attempt (for idempotent reads only).
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+TRANSPORT_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+
+class CircuitOpenError(Exception):
+    """An endpoint's circuit is open; the request was not sent."""
+
+
+class CircuitBreaker:
+    """
+    Per-endpoint breaker: ``threshold`` consecutive failures (transport errors
+    or 5xx/429) open it for ``reset_after`` seconds, during which calls fail
+    fast with ``CircuitOpenError``. After that a single trial call is let
+    through; its success closes the circuit, its failure reopens it.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, endpoint, threshold=None, reset_after=None):
+        self.endpoint = endpoint
+        self.threshold = threshold or config.CIRCUIT_FAILURE_THRESHOLD
+        self.reset_after = config.CIRCUIT_RESET_TIMEOUT if reset_after is None else reset_after
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def before(self):
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_after:
+                self.state = self.HALF_OPEN
+                self._trial = False
+            if self.state == self.HALF_OPEN and not self._trial:
+                self._trial = True
+                return
+            raise CircuitOpenError(f"Circuit open for {self.endpoint} after {self.failures} failures")
+
+    def release(self):
+        """Give back a half-open trial taken by ``before`` for a call that was never sent."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._trial = False
+
+    def record(self, ok):
+        with self._lock:
+            if ok:
+                self.failures = 0
+                self.state = self.CLOSED
+                return
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                if self.state != self.OPEN:
+                    metrics.HTTP_CIRCUIT_OPENS.inc(endpoint=self.endpoint)
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class LatencyWindow:
+    """Recent successful latencies for one endpoint; ``p95`` is refreshed every ``every`` samples."""
+
+    def __init__(self, size=None, every=20):
+        self.samples = deque(maxlen=size or config.HTTP_LATENCY_WINDOW)
+        self.every = every
+        self._since = 0
+        self._p95 = None
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        with self._lock:
+            self.samples.append(seconds)
+            self._since += 1
+            if self._since >= self.every:
+                ordered = sorted(self.samples)
+                self._p95 = ordered[int(0.95 * (len(ordered) - 1))]
+                self._since = 0
+
+    def p95(self):
+        return self._p95
+
+
+_breakers = {}
+_latencies = {}
+_registry_lock = threading.Lock()
+
+
+def breaker(endpoint):
+    b = _breakers.get(endpoint)
+    if b is None:
+        with _registry_lock:
+            b = _breakers.setdefault(endpoint, CircuitBreaker(endpoint))
+    return b
+
+
+def latency(endpoint):
+    w = _latencies.get(endpoint)
+    if w is None:
+        with _registry_lock:
+            w = _latencies.setdefault(endpoint, LatencyWindow())
+    return w
+
+
+def hedge_delay(endpoint):
+    """Seconds to wait before hedging a read: its recent p95, or None until enough samples exist."""
+    p95 = latency(endpoint).p95()
+    return None if p95 is None else max(p95, config.HTTP_HEDGE_MIN_DELAY)
+
+
+def backoff(attempt, response=None):
+    """Full-jitter exponential backoff, honouring a numeric ``Retry-After``."""
+    delay = random.uniform(0, min(config.HTTP_RETRY_BACKOFF_MAX, config.HTTP_RETRY_BACKOFF * 2 ** attempt))
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, min(float(retry_after), config.HTTP_RETRY_BACKOFF_MAX))
+    return delay
+
+
+def reset():
+    """Forget every breaker and latency window (tests, benchmarks)."""
+    with _registry_lock:
+        _breakers.clear()
+        _latencies.clear()
+
+
+def state():
+    """Breaker state and read p95 per endpoint seen so far."""
+    return {endpoint: {"circuit": b.state, "failures": b.failures,
+                       "p95Ms": None if latency(endpoint).p95() is None else 1000.0 * latency(endpoint).p95()}
+            for endpoint, b in list(_breakers.items())}
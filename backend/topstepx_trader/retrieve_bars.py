@@ -1,50 +1,123 @@
 # topstepx_trader/retrieve_bars.py
 import os
-import requests
-import json
-from datetime import datetime, timedelta
+import logging
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
-from topstepx_trader.contracts import search_contracts
+from topstepx_trader import bar_store, config, http_client
+from topstepx_trader.contract_cache import front_month_contract_id
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 BASE_API_URL = os.getenv("BASE_API_URL", "https://api.topstepx.com")
-SESSION_TOKEN = os.getenv("SESSION_TOKEN")
 LIVE_MODE = os.getenv("LIVE_MODE", "true").lower() == "true"
 
 HEADERS = {
     "accept": "text/plain",
-    "Content-Type": "application/json",
-    "Authorization": f"Bearer {SESSION_TOKEN}"
+    "Content-Type": "application/json"
 }
 
 def get_current_front_month_contract_id(symbol: str = "NQ") -> str:
-    result = search_contracts(symbol, live=LIVE_MODE)
-    contracts = result.get("contracts", [])
-    if not contracts:
-        raise Exception("No contracts found for symbol")
-    return contracts[0]["id"]
-
-def retrieve_bars(symbol="NQ", minutes=100):
-    contract_id = get_current_front_month_contract_id(symbol)
+    return front_month_contract_id(symbol, live=LIVE_MODE)
 
-    end_time = datetime.utcnow()
-    start_time = end_time - timedelta(minutes=minutes)
+def iso_timestamp(epoch):
+    return datetime.fromtimestamp(epoch, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
+def fetch_bars(contract_id, start_time, end_time, unit=2, unit_number=1, limit=1000, include_partial_bar=False):
+    """Single ``/api/History/retrieveBars`` request; times are ISO strings."""
     payload = {
         "contractId": contract_id,
         "live": LIVE_MODE,
-        "startTime": start_time.isoformat() + "Z",
-        "endTime": end_time.isoformat() + "Z",
-        "unit": 2,  # Minute
-        "unitNumber": 1,
-        "limit": minutes,
-        "includePartialBar": False
+        "startTime": start_time,
+        "endTime": end_time,
+        "unit": unit,
+        "unitNumber": unit_number,
+        "limit": limit,
+        "includePartialBar": include_partial_bar
     }
 
-    response = requests.post(f"{BASE_API_URL}/api/History/retrieveBars", headers=HEADERS, json=payload)
-    print("[DEBUG] Status Code:", response.status_code)
-    print("[DEBUG] Payload:", json.dumps(payload, indent=2))
-    result = response.json()
-    print("[DEBUG] Response:", json.dumps(result, indent=2))
+    response = http_client.post(f"{BASE_API_URL}/api/History/retrieveBars", headers=HEADERS, json=payload, authorized=True)
+    result = http_client.parse_json(response)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("History/retrieveBars response", extra={
+            "status": response.status_code, "payload": payload, "bars": len(result.get("bars") or []),
+            "errorCode": result.get("errorCode"),
+        })
     return result
+
+def fill_gaps(contract_id, start, end, unit=2, unit_number=1):
+    """
+    Fetch only the parts of ``[start, end)`` (epoch seconds) missing from the
+    local bar store and merge them in. Returns the first failed API response,
+    or None when the store now covers the whole window.
+
+    Coverage near "now" is capped by ``bar_store.cap_coverage``, so a bar the
+    API has not published yet is fetched again next time rather than left as
+    a permanent hole.
+    """
+    step = bar_store.bar_seconds(unit, unit_number)
+    for gap_start, gap_end in bar_store.missing_ranges(contract_id, unit, unit_number, start, end):
+        while gap_start < gap_end:
+            limit = min(config.HISTORY_MAX_BARS, -(-(gap_end - gap_start) // step))
+            result = fetch_bars(contract_id, iso_timestamp(gap_start), iso_timestamp(gap_end), unit, unit_number, limit)
+            if not result or not result.get("success"):
+                return result
+            bars = result.get("bars") or []
+            times = [bar_store.parse_timestamp(b["t"]) for b in bars]
+            if len(bars) < limit:
+                covered = bar_store.cap_coverage(gap_start, gap_end, times, unit, unit_number)
+                bar_store.write_bars(contract_id, unit, unit_number, bars, covered=covered)
+                break
+            # The API returned the newest `limit` bars; store those and keep
+            # walking back toward gap_start.
+            oldest = min(times)
+            if oldest >= gap_end:
+                bar_store.write_bars(contract_id, unit, unit_number, bars)
+                break
+            covered = bar_store.cap_coverage(oldest, gap_end, times, unit, unit_number)
+            bar_store.write_bars(contract_id, unit, unit_number, bars, covered=covered)
+            gap_end = oldest
+    return None
+
+def _window(minutes, step):
+    """Bar-aligned ``[start, end)`` epoch window ending at the last completed bar."""
+    now = int(datetime.now(timezone.utc).timestamp())
+    end = now - now % step
+    start = -(-(now - minutes * 60) // step) * step
+    return start, end
+
+def load_bars(symbol="NQ", minutes=100, unit=2, unit_number=1):
+    """
+    Columnar NumPy bars for the last ``minutes`` minutes, ascending by time.
+
+    Served from the local bar store; only ranges the store has never seen are
+    requested from the API.
+    """
+    contract_id = get_current_front_month_contract_id(symbol)
+    start, end = _window(minutes, bar_store.bar_seconds(unit, unit_number))
+    failed = fill_gaps(contract_id, start, end, unit, unit_number)
+    if failed is not None:
+        raise Exception(f"retrieveBars failed: {failed}")
+    return bar_store.read_bars(contract_id, unit, unit_number, start, end)
+
+def retrieve_bars(symbol="NQ", minutes=100, unit=2, unit_number=1):
+    contract_id = get_current_front_month_contract_id(symbol)
+
+    if unit not in bar_store.UNIT_SECONDS:
+        end_time = datetime.utcnow()
+        start_time = end_time - timedelta(minutes=minutes)
+        return fetch_bars(contract_id, start_time.isoformat() + "Z", end_time.isoformat() + "Z",
+                          unit, unit_number, limit=minutes)
+
+    start, end = _window(minutes, bar_store.bar_seconds(unit, unit_number))
+    failed = fill_gaps(contract_id, start, end, unit, unit_number)
+    if failed is not None:
+        return failed
+    columns = bar_store.read_bars(contract_id, unit, unit_number, start, end)
+    return {
+        "bars": bar_store.to_api_bars(columns),
+        "success": True,
+        "errorCode": 0,
+        "errorMessage": None
+    }
@@ -1,12 +1,186 @@
-import schedule
-import time
+# backend/topstepx_trader/scheduler.py
+
+import heapq
+import itertools
+import logging
+import random
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from topstepx_trader import config
 from topstepx_trader.auth import authenticate
 
+logger = logging.getLogger(__name__)
+
+
+class Job:
+    __slots__ = ("name", "fn", "interval", "at_time", "jitter", "allow_overlap", "deadline",
+                 "running", "cancelled", "runs", "skipped", "errors",
+                 "lateness_total", "lateness_max", "last_lateness",
+                 "runtime_total", "runtime_max", "last_runtime")
+
+    def __init__(self, name, fn, interval=None, at_time=None, jitter=0.0, allow_overlap=False):
+        self.name = name
+        self.fn = fn
+        self.interval = interval
+        self.at_time = at_time
+        self.jitter = jitter
+        self.allow_overlap = allow_overlap
+        self.deadline = None
+        self.running = False
+        self.cancelled = False
+        self.runs = self.skipped = self.errors = 0
+        self.lateness_total = self.lateness_max = self.last_lateness = 0.0
+        self.runtime_total = self.runtime_max = self.last_runtime = 0.0
+
+    def stats(self):
+        return {
+            "runs": self.runs,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "nextRunIn": None if self.deadline is None else max(0.0, self.deadline - time.monotonic()),
+            "latenessAvgMs": 1000.0 * self.lateness_total / self.runs if self.runs else None,
+            "latenessMaxMs": 1000.0 * self.lateness_max,
+            "lastLatenessMs": 1000.0 * self.last_lateness,
+            "runtimeAvgMs": 1000.0 * self.runtime_total / self.runs if self.runs else None,
+            "runtimeMaxMs": 1000.0 * self.runtime_max,
+            "lastRuntimeMs": 1000.0 * self.last_runtime,
+        }
+
+
+def _seconds_until(at_time):
+    """Seconds from now until the next local ``HH:MM`` (or ``HH:MM:SS``)."""
+    now = datetime.now()
+    parts = [int(p) for p in at_time.split(":")]
+    target = now.replace(hour=parts[0], minute=parts[1], second=parts[2] if len(parts) > 2 else 0,
+                         microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+class TimerScheduler:
+    """
+    Deadline-driven scheduler for periodic and daily jobs.
+
+    Jobs sit in a heap ordered by deadline and one timer thread sleeps exactly
+    until the earliest one (or until a new job is added), so jobs fire on
+    time and sub-second intervals work. Due jobs run on a worker pool, so a
+    slow job never delays the others; by default a job whose previous run is
+    still going skips that tick instead of piling up. Each job records
+    lateness (actual start minus deadline) and runtime.
+    """
+
+    def __init__(self, max_workers=None):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers or config.SCHEDULER_WORKERS,
+                                       thread_name_prefix="scheduler")
+        self.jobs = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopped = False
+
+    def _push(self, job, deadline):
+        job.deadline = deadline
+        heapq.heappush(self._heap, (deadline, next(self._seq), job))
+
+    def _add(self, job, first_delay):
+        with self._cond:
+            self.jobs[job.name] = job
+            self._push(job, time.monotonic() + first_delay)
+            self._cond.notify()
+        return job
+
+    def every(self, interval, fn, name=None, jitter=0.0, first_delay=None, allow_overlap=False):
+        """Run ``fn`` every ``interval`` seconds, each deadline pushed back by up to ``jitter``."""
+        job = Job(name or fn.__name__, fn, interval=interval, jitter=jitter, allow_overlap=allow_overlap)
+        delay = interval if first_delay is None else first_delay
+        return self._add(job, delay + random.uniform(0, jitter))
+
+    def daily_at(self, at_time, fn, name=None, jitter=0.0):
+        """Run ``fn`` once a day at local ``HH:MM``."""
+        job = Job(name or fn.__name__, fn, at_time=at_time, jitter=jitter)
+        return self._add(job, _seconds_until(at_time) + random.uniform(0, jitter))
+
+    def cancel(self, name):
+        with self._cond:
+            job = self.jobs.pop(name, None)
+            if job is not None:
+                job.cancelled = True
+
+    def _reschedule(self, job, now):
+        if job.at_time is not None:
+            deadline = now + _seconds_until(job.at_time)
+        else:
+            deadline = job.deadline + job.interval
+            if deadline <= now:
+                # Fell behind (e.g. the process was suspended): skip missed ticks.
+                deadline = now + job.interval
+        self._push(job, deadline + random.uniform(0, job.jitter))
+
+    def _run_job(self, job, deadline):
+        started = time.monotonic()
+        lateness = started - deadline
+        try:
+            job.fn()
+        except Exception as e:
+            job.errors += 1
+            logger.exception("Scheduled job %s failed: %s", job.name, e)
+        finally:
+            runtime = time.monotonic() - started
+            job.runs += 1
+            job.last_lateness = lateness
+            job.lateness_total += lateness
+            job.lateness_max = max(job.lateness_max, lateness)
+            job.last_runtime = runtime
+            job.runtime_total += runtime
+            job.runtime_max = max(job.runtime_max, runtime)
+            job.running = False
+
+    def _loop(self):
+        with self._cond:
+            while not self._stopped:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                deadline, _, job = self._heap[0]
+                now = time.monotonic()
+                if deadline > now:
+                    self._cond.wait(deadline - now)
+                    continue
+                heapq.heappop(self._heap)
+                if job.cancelled:
+                    continue
+                if job.running and not job.allow_overlap:
+                    job.skipped += 1
+                else:
+                    job.running = True
+                    self.pool.submit(self._run_job, job, deadline)
+                self._reschedule(job, now)
+
+    def start(self):
+        with self._cond:
+            if self._thread is None:
+                self._stopped = False
+                self._thread = threading.Thread(target=self._loop, daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, wait=False):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        self.pool.shutdown(wait=wait)
+
+    def stats(self):
+        return {name: job.stats() for name, job in list(self.jobs.items())}
+
+
+scheduler = TimerScheduler()
+
+
 def schedule_reauth():
-    schedule.every().day.at("17:45").do(authenticate)
-    def run_scheduler():
-        while True:
-            schedule.run_pending()
-            time.sleep(60)
-    threading.Thread(target=run_scheduler, daemon=True).start()
+    scheduler.daily_at("17:45", authenticate, name="reauth")
+    scheduler.start()
@@ -0,0 +1,152 @@
+# backend/topstepx_trader/serialization.py
+
+import json
+import struct
+import numpy as np
+from topstepx_trader import config
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to stdlib json
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional: only needed if a namespace selects it
+    msgpack = None
+
+
+class JsonCodec:
+    """Stdlib ``json`` text; the default for every key."""
+
+    name = "json"
+    binary = False
+    magic = None
+
+    def encode(self, value):
+        return json.dumps(value)
+
+    def decode(self, data):
+        return json.loads(data)
+
+
+class FastJsonCodec(JsonCodec):
+    """``orjson`` when installed (bytes out, same JSON on the wire), else stdlib."""
+
+    name = "orjson"
+
+    def encode(self, value):
+        if orjson is None:
+            return json.dumps(value)
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    def decode(self, data):
+        return json.loads(data) if orjson is None else orjson.loads(data)
+
+
+class MsgpackCodec:
+    """MessagePack, prefixed with ``magic`` so old JSON values still decode."""
+
+    name = "msgpack"
+    binary = True
+    magic = b"\xc1"  # a byte msgpack never emits
+
+    def encode(self, value):
+        if msgpack is None:
+            raise Exception("msgpack codec selected but the msgpack package is not installed")
+        return self.magic + msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, data):
+        if msgpack is None:
+            raise Exception("msgpack codec selected but the msgpack package is not installed")
+        return msgpack.unpackb(memoryview(data)[len(self.magic):], raw=False)
+
+
+class PackedArraysCodec:
+    """
+    Numeric columns (e.g. ``bar_store`` bars or ticks) as raw little-endian buffers.
+
+    The value is a dict of 1-D arrays plus optional JSON-able scalars. The
+    layout is ``magic``, a u32 header length, a JSON header describing each
+    column, then the column buffers 8-byte aligned; ``decode`` returns
+    read-only ``np.frombuffer`` views over the fetched bytes, so no column is
+    copied.
+    """
+
+    name = "packed"
+    binary = True
+    magic = b"QXP1"
+
+    def encode(self, value):
+        columns, meta, buffers, offset = [], {}, [], 0
+        for key, item in value.items():
+            if isinstance(item, (np.ndarray, list, tuple)):
+                array = np.ascontiguousarray(item)
+                if array.ndim != 1 or array.dtype.kind not in "biuf":
+                    raise ValueError(f"Column {key!r} is not a 1-D numeric array")
+                array = array.astype(array.dtype.newbyteorder("<"), copy=False)
+                data = array.tobytes()
+                columns.append([key, array.dtype.str, len(array), offset])
+                pad = -len(data) % 8
+                buffers.append(data + b"\0" * pad)
+                offset += len(data) + pad
+            else:
+                meta[key] = item
+        header = json.dumps({"columns": columns, "meta": meta}, separators=(",", ":")).encode()
+        header += b" " * (-(len(self.magic) + 4 + len(header)) % 8)
+        return b"".join([self.magic, struct.pack("<I", len(header)), header] + buffers)
+
+    def decode(self, data):
+        start = len(self.magic) + 4
+        (header_len,) = struct.unpack_from("<I", data, len(self.magic))
+        header = json.loads(bytes(data[start:start + header_len]))
+        base = start + header_len
+        value = dict(header["meta"])
+        for key, dtype, length, offset in header["columns"]:
+            value[key] = np.frombuffer(data, dtype=dtype, count=length, offset=base + offset)
+        return value
+
+
+CODECS = {codec.name: codec for codec in (JsonCodec(), FastJsonCodec(), MsgpackCodec(), PackedArraysCodec())}
+DEFAULT_CODEC = CODECS["json"]
+
+# Key prefix -> codec, longest prefix wins; anything unmatched is plain json.
+_namespaces = {}
+
+
+def register_codec(prefix, codec):
+    """Use ``codec`` (a codec or its name) for every key starting with ``prefix``."""
+    _namespaces[prefix] = CODECS[codec] if isinstance(codec, str) else codec
+
+
+def codec_for(key):
+    best = None
+    for prefix in _namespaces:
+        if key.startswith(prefix) and (best is None or len(prefix) > len(best)):
+            best = prefix
+    return DEFAULT_CODEC if best is None else _namespaces[best]
+
+
+def encode(key, value):
+    return codec_for(key).encode(value)
+
+
+def decode(key, data):
+    """Decode ``data`` stored under ``key``; values written before a namespace
+    switched to a binary codec lack its magic and are read as JSON."""
+    codec = codec_for(key)
+    if codec.magic is not None and bytes(data[:len(codec.magic)]) != codec.magic:
+        return json.loads(data)
+    return codec.decode(data)
+
+
+def _load_config(spec):
+    # "accounts=orjson,bars:=packed"
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        prefix, _, name = item.partition("=")
+        if name.strip() not in CODECS:
+            raise Exception(f"Unknown codec {name.strip()!r} for key prefix {prefix!r} in REDIS_CODECS")
+        register_codec(prefix.strip(), name.strip())
+
+
+_load_config(config.REDIS_CODECS)
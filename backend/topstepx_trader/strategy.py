@@ -0,0 +1,81 @@
+# backend/topstepx_trader/strategy.py
+
+from collections import deque
+import numpy as np
+
+
+class StrategyContext:
+    """What a strategy sees besides the bar: its contract and current position."""
+
+    __slots__ = ("contract_id", "position", "bars_seen")
+
+    def __init__(self, contract_id=None, position=0):
+        self.contract_id = contract_id
+        self.position = position
+        self.bars_seen = 0
+
+
+class Strategy:
+    """
+    Interface shared by the backtester and the live runner.
+
+    A strategy answers with a *target position* (signed contracts), never
+    with orders; the caller turns changes in the target into fills or order
+    intents. ``on_bar`` is called once per closed bar (``{"t", "o", "h",
+    "l", "c", "v"}``, the same dict ``BarAggregator`` emits) and returns the
+    new target, or None to keep the current one. ``signals`` is the optional
+    vectorized form: given columnar bars it returns the target after each
+    bar's close, and must agree with replaying ``on_bar``.
+    """
+
+    name = "strategy"
+    defaults = {}
+
+    def __init__(self, **params):
+        self.params = {**self.defaults, **params}
+        self.reset()
+
+    def reset(self):
+        """Clear per-run state before a replay or a live start."""
+
+    def on_bar(self, bar, ctx):
+        raise NotImplementedError
+
+    def signals(self, bars):
+        raise NotImplementedError
+
+
+def moving_average(values, window):
+    """Trailing mean over ``window`` values; NaN until the window fills."""
+    out = np.full(len(values), np.nan)
+    if window <= len(values):
+        csum = np.cumsum(np.concatenate([[0.0], values]))
+        out[window - 1:] = (csum[window:] - csum[:-window]) / window
+    return out
+
+
+class SmaCross(Strategy):
+    """Long ``size`` when the fast SMA of closes is above the slow one, short when below."""
+
+    name = "sma_cross"
+    defaults = {"fast": 10, "slow": 30, "size": 1}
+
+    def reset(self):
+        self._closes = deque(maxlen=self.params["slow"])
+
+    def on_bar(self, bar, ctx):
+        fast, slow = self.params["fast"], self.params["slow"]
+        self._closes.append(bar["c"])
+        if len(self._closes) < slow:
+            return 0
+        closes = list(self._closes)
+        diff = sum(closes[-fast:]) / fast - sum(closes) / slow
+        return int(np.sign(diff)) * self.params["size"]
+
+    def signals(self, bars):
+        close = np.asarray(bars["c"], dtype=np.float64)
+        diff = moving_average(close, self.params["fast"]) - moving_average(close, self.params["slow"])
+        return (np.sign(np.nan_to_num(diff)) * self.params["size"]).astype(np.int64)
+
+
+STRATEGIES = {cls.name: cls for cls in (SmaCross,)}
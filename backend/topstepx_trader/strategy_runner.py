@@ -0,0 +1,276 @@
+# backend/topstepx_trader/strategy_runner.py
+
+import importlib
+import json
+import logging
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from topstepx_trader import config, resilience
+from topstepx_trader.execution import ExecutionEngine, _percentile, place_intent
+from topstepx_trader.redis_utils import get_redis, set_json
+from topstepx_trader.strategy import STRATEGIES, StrategyContext
+
+logger = logging.getLogger(__name__)
+
+STATS_KEY = "strategies:stats"
+
+
+def load_strategy(spec):
+    """Strategy instance for a spec's ``strategy`` (registry name or ``module:Class``)."""
+    name = spec["strategy"]
+    if ":" in name:
+        module, _, attr = name.partition(":")
+        cls = getattr(importlib.import_module(module), attr)
+    else:
+        cls = STRATEGIES[name]
+    return cls(**spec.get("params", {}))
+
+
+def _order_for(spec, position, target):
+    delta = target - position
+    return place_intent({
+        "accountId": spec["accountId"],
+        "contractId": spec["contractId"],
+        "type": 2,  # market
+        "side": 0 if delta > 0 else 1,
+        "size": abs(delta),
+    })
+
+
+def _run_worker(spec, inbox, outbox, results):
+    """
+    Worker process body: bars in, (decision, latency, intent) out. After an
+    intent the worker waits for its execution result on ``results`` and only
+    moves ``ctx.position`` if the order was accepted; no further bar is
+    decided until the outcome is known.
+    """
+    name = spec["name"]
+    try:
+        strategy = load_strategy(spec)
+    except Exception as e:
+        outbox.put(("error", name, repr(e), None))
+        return
+    ctx = StrategyContext(spec["contractId"], spec.get("position", 0))
+    outbox.put(("ready", name, None, None))
+    while True:
+        item = inbox.get()
+        if item is None:
+            break
+        bar, enqueued = item
+        started = time.time()
+        try:
+            target = strategy.on_bar(bar, ctx)
+        except Exception as e:
+            outbox.put(("error", name, repr(e), None))
+            continue
+        decided = time.time()
+        ctx.bars_seen += 1
+        intent = None
+        if target is not None and target != ctx.position:
+            intent = _order_for(spec, ctx.position, target)
+        timing = {"queueMs": 1000.0 * (started - enqueued), "decisionMs": 1000.0 * (decided - started)}
+        outbox.put(("decision", name, timing, intent))
+        if intent is not None and results.get():
+            ctx.position = target
+
+
+class _Worker:
+    __slots__ = ("spec", "inbox", "results", "process", "ready", "received", "dropped", "decisions", "intents",
+                 "rejected", "unknown", "errors", "last_error", "decision_ms", "queue_ms")
+
+    def __init__(self, spec, inbox, results):
+        self.spec = spec
+        self.inbox = inbox
+        self.results = results
+        self.process = None
+        self.ready = threading.Event()
+        self.received = self.dropped = self.decisions = self.intents = self.rejected = self.unknown = 0
+        self.errors = 0
+        self.last_error = None
+        self.decision_ms = deque(maxlen=config.STRATEGY_LATENCY_WINDOW)
+        self.queue_ms = deque(maxlen=config.STRATEGY_LATENCY_WINDOW)
+
+    def stats(self):
+        decision_ms = sorted(self.decision_ms)
+        queue_ms = sorted(self.queue_ms)
+        try:
+            depth = self.inbox.qsize()
+        except NotImplementedError:  # macOS
+            depth = None
+        return {
+            "contractId": self.spec["contractId"],
+            "timeframe": self.spec["timeframe"],
+            "alive": self.process is not None and self.process.is_alive(),
+            "ready": self.ready.is_set(),
+            "queueDepth": depth,
+            "received": self.received,
+            "dropped": self.dropped,
+            "decisions": self.decisions,
+            "intents": self.intents,
+            "rejected": self.rejected,
+            "unknown": self.unknown,
+            "errors": self.errors,
+            "lastError": self.last_error,
+            "decisionMs": {"p50": _percentile(decision_ms, 50), "p99": _percentile(decision_ms, 99),
+                           "max": decision_ms[-1] if decision_ms else None},
+            "queueMs": {"p50": _percentile(queue_ms, 50), "p99": _percentile(queue_ms, 99),
+                        "max": queue_ms[-1] if queue_ms else None},
+        }
+
+
+class StrategyRunner:
+    """
+    Runs each live strategy in its own process, away from the web server.
+
+    Specs are dicts: ``name``, ``strategy`` (registry name or
+    ``module:Class``), ``params``, ``contractId``, ``timeframe`` (seconds,
+    as published by ``BarAggregator``), ``accountId`` and optionally
+    ``queueSize``. Closed bars, from the ``BAR_CLOSE_CHANNEL`` Redis channel
+    or passed to ``on_bar_close`` directly, are fanned out to bounded
+    per-strategy queues; a strategy that falls behind has bars dropped (and
+    counted) instead of delaying the others. Target-position changes come
+    back as order intents and all go through one ``ExecutionEngine``; each
+    result is sent back to its worker, whose position only follows accepted
+    orders. A place whose outcome is unknown (its response was lost) is
+    looked up by customTag until it is settled, and the worker decides
+    nothing else meanwhile, so a lost fill is never sent twice. ``stats``
+    reports queue depth, drops, unknown outcomes and decision/queue latency
+    per strategy.
+    """
+
+    def __init__(self, specs, engine=None, queue_size=None, subscribe=True):
+        self._mp = multiprocessing.get_context("spawn")
+        self.engine = engine or ExecutionEngine()
+        self.subscribe = subscribe
+        self.outbox = self._mp.Queue()
+        queue_size = queue_size or config.STRATEGY_QUEUE_SIZE
+        self.workers = {spec["name"]: _Worker(spec, self._mp.Queue(maxsize=spec.get("queueSize", queue_size)),
+                                              self._mp.Queue())
+                        for spec in specs}
+        self._routes = {}
+        for worker in self.workers.values():
+            self._routes.setdefault((worker.spec["contractId"], worker.spec["timeframe"]), []).append(worker)
+        self._threads = []
+        self._stopped = threading.Event()
+
+    def on_bar_close(self, contract_id, timeframe, bar):
+        enqueued = time.time()
+        for worker in self._routes.get((contract_id, timeframe), ()):
+            worker.received += 1
+            try:
+                worker.inbox.put_nowait((bar, enqueued))
+            except queue.Full:
+                worker.dropped += 1
+
+    def _listen(self):
+        while not self._stopped.is_set():
+            try:
+                pubsub = get_redis().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(config.BAR_CLOSE_CHANNEL)
+                for message in pubsub.listen():
+                    if self._stopped.is_set():
+                        break
+                    data = json.loads(message["data"])
+                    self.on_bar_close(data["contractId"], data["timeframe"], data["bar"])
+            except Exception as e:
+                logger.warning("Bar subscription failed: %s", e)
+                self._stopped.wait(1.0)
+
+    def _on_result(self, worker, future):
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+        if result.get("status") == "unknown":
+            worker.unknown += 1
+            worker.last_error = result.get("error")
+            threading.Thread(target=self._settle, args=(worker, result), daemon=True).start()
+            return
+        if not result.get("success"):
+            worker.rejected += 1
+            worker.last_error = result.get("error") or result.get("errorMessage")
+        worker.results.put(bool(result.get("success")))
+
+    def _settle(self, worker, result):
+        # Only a definite answer is sent back; until then the worker stays blocked.
+        attempt = 0
+        while not self._stopped.wait(resilience.backoff(attempt)):
+            attempt += 1
+            try:
+                placed = self.engine.confirm_place(result)
+            except Exception as e:
+                logger.warning("customTag lookup for %s failed: %s", result.get("customTag"), e,
+                               extra={"strategy": worker.spec["name"]})
+                continue
+            if not placed:
+                worker.rejected += 1
+            worker.results.put(placed)
+            return
+
+    def _collect(self):
+        while True:
+            item = self.outbox.get()
+            if item is None:
+                break
+            kind, name, payload, intent = item
+            worker = self.workers[name]
+            if kind == "ready":
+                worker.ready.set()
+                continue
+            if kind == "error":
+                worker.errors += 1
+                worker.last_error = payload
+                continue
+            worker.decisions += 1
+            worker.decision_ms.append(payload["decisionMs"])
+            worker.queue_ms.append(payload["queueMs"])
+            if intent is not None:
+                worker.intents += 1
+                self.engine.submit(intent).add_done_callback(lambda f, w=worker: self._on_result(w, f))
+
+    def start(self):
+        for worker in self.workers.values():
+            worker.process = self._mp.Process(target=_run_worker,
+                                              args=(worker.spec, worker.inbox, self.outbox, worker.results),
+                                              name=f"strategy-{worker.spec['name']}", daemon=True)
+            worker.process.start()
+        targets = [self._collect] + ([self._listen] if self.subscribe else [])
+        for target in targets:
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def wait_ready(self, timeout=None):
+        """Block until every worker has loaded its strategy; False on timeout."""
+        deadline = None if timeout is None else time.time() + timeout
+        for worker in self.workers.values():
+            remaining = None if deadline is None else max(0.0, deadline - time.time())
+            if not worker.ready.wait(remaining):
+                return False
+        return True
+
+    def stop(self, timeout=5.0):
+        self._stopped.set()
+        for worker in self.workers.values():
+            worker.results.put(None)  # releases a worker still waiting on a result
+            try:
+                worker.inbox.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+        for worker in self.workers.values():
+            if worker.process is not None:
+                worker.process.join(timeout)
+                if worker.process.is_alive():
+                    worker.process.terminate()
+        self.outbox.put(None)
+
+    def stats(self):
+        return {name: worker.stats() for name, worker in self.workers.items()}
+
+    def publish_stats(self):
+        """Write ``stats`` to Redis for the web process (``/api/strategies``)."""
+        set_json(STATS_KEY, self.stats())
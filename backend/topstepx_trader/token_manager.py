@@ -0,0 +1,143 @@
+# backend/topstepx_trader/token_manager.py
+
+import base64
+import json
+import logging
+import threading
+import time
+import redis
+from topstepx_trader import auth, config
+from topstepx_trader.redis_utils import get_str
+
+logger = logging.getLogger(__name__)
+
+
+def token_expiry(token):
+    """Expiry (epoch seconds) from a JWT's ``exp`` claim, else now + TOKEN_LIFETIME."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return time.time() + config.TOKEN_LIFETIME
+
+
+class TokenManager:
+    """
+    Single in-memory source of the session token for every API client.
+
+    The token is renewed via ``/api/Auth/validate`` ``TOKEN_REFRESH_MARGIN``
+    seconds before it expires (falling back to a fresh login), so calls never
+    see an expired token. When many requests hit a 401 with the same token at
+    once, ``on_unauthorized`` lets exactly one of them log in again; the rest
+    wait on the lock and pick up the new token.
+    """
+
+    def __init__(self):
+        self._token = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        self._refresher = None
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+
+    def _set(self, token):
+        self._token = token
+        self._expires_at = token_expiry(token) if token else 0.0
+        self._wake.set()
+
+    def _initial_token(self):
+        try:
+            token = get_str("SESSION_TOKEN")
+        except redis.exceptions.RedisError:
+            token = None
+        return token or config.SESSION_TOKEN
+
+    def get_token(self):
+        token = self._token
+        if token is not None and time.time() < self._expires_at:
+            return token
+        with self._lock:
+            if self._token is None:
+                self._set(self._initial_token())
+            if self._token is None or time.time() >= self._expires_at:
+                self._set(auth.login())
+            return self._token
+
+    def set_token(self, token):
+        with self._lock:
+            self._set(token)
+
+    def on_unauthorized(self, rejected_token):
+        """Re-login once per rejected token; concurrent callers share the result."""
+        with self._lock:
+            if self._token is not None and self._token != rejected_token:
+                return self._token
+            self._set(auth.login())
+            return self._token
+
+    def refresh(self):
+        """
+        Renew ahead of expiry via validate; log in again if that fails or
+        hands back a token that expires no later than the current one.
+        """
+        with self._lock:
+            token = self._token or self._initial_token()
+            new_token = auth.renew_token(token) if token else None
+            if new_token and token == self._token and token_expiry(new_token) <= self._expires_at:
+                new_token = None  # validate succeeded without issuing a newer token
+            self._set(new_token or auth.login())
+            return self._token
+
+    def _refresh_loop(self):
+        last_attempt = None
+        while True:
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            delay = self._expires_at - config.TOKEN_REFRESH_MARGIN - time.time()
+            if last_attempt is not None:
+                # Even a token that is already inside the margin (e.g. its
+                # lifetime is shorter) is only renewed every TOKEN_RETRY_DELAY.
+                delay = max(delay, last_attempt + config.TOKEN_RETRY_DELAY - time.time())
+            if delay > 0 and self._wake.wait(delay):
+                continue  # token replaced or stopped meanwhile; recompute the deadline
+            if self._stopped.is_set():
+                break
+            last_attempt = time.time()
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning("Token refresh failed: %s", e)
+
+    def start(self):
+        """Start proactive background renewal (idempotent)."""
+        self.get_token()
+        if self._refresher is None:
+            self._refresher = threading.Thread(target=self._refresh_loop, daemon=True)
+            self._refresher.start()
+        return self
+
+    def stop(self):
+        """Stop background renewal."""
+        self._stopped.set()
+        self._wake.set()
+
+
+_manager = TokenManager()
+
+
+def get_token():
+    return _manager.get_token()
+
+
+def set_token(token):
+    _manager.set_token(token)
+
+
+def on_unauthorized(rejected_token):
+    return _manager.on_unauthorized(rejected_token)
+
+
+def start():
+    return _manager.start()
@@ -1,17 +1,15 @@
 import os
-import requests
 from dotenv import load_dotenv
+from topstepx_trader import http_client
 
 # Load environment variables from a .env file
 load_dotenv()
 
-# Base URL and session token for API authentication
+# Base URL for the API
 BASE_URL = os.getenv("BASE_API_URL")
-SESSION_TOKEN = os.getenv("SESSION_TOKEN")
 
-# Headers including the authorization token
+# Common headers; the session token is attached by http_client
 headers = {
-    "Authorization": f"Bearer {SESSION_TOKEN}",
     "Content-Type": "application/json"
 }
 
@@ -36,5 +34,5 @@ def search_trades(account_id, start_timestamp, end_timestamp=None):
     if end_timestamp:
         payload["endTimestamp"] = end_timestamp
 
-    response = requests.post(url, json=payload, headers=headers)
-    return response.json()
+    response = http_client.post(url, json=payload, headers=headers, authorized=True)
+    return http_client.parse_json(response)
@@ -0,0 +1,58 @@
+# benchmarks/bench_http_client.py
+"""
+Latency of a bare ``requests.post`` (new connection per call) versus the shared
+pooled session in ``topstepx_trader.http_client``, measured against a local
+stand-in for the TopstepX API.
+
+Usage:
+    PYTHONPATH=./backend python benchmarks/bench_http_client.py [-n 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend")))
+
+import requests
+from mock_api import MockTopstepX
+from topstepx_trader import http_client
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run(label, post, url, n):
+    payload = {"onlyActiveAccounts": True}
+    for _ in range(min(50, n)):  # warm-up
+        post(url, json=payload)
+    samples = []
+    for _ in range(n):
+        start = time.perf_counter()
+        post(url, json=payload).json()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    print(f"{label:<24} p50={percentile(samples, 50):7.3f} ms  p99={percentile(samples, 99):7.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=2000, help="requests per client")
+    parser.add_argument("--items", type=int, default=0, help="accounts per response")
+    args = parser.parse_args()
+
+    with MockTopstepX(items=args.items) as mock:
+        url = f"{mock.base_url}/api/Account/search"
+        try:
+            run("requests.post (before)", requests.post, url, args.n)
+            run("http_client.post (after)", http_client.post, url, args.n)
+        finally:
+            http_client.reset_session()
+
+
+if __name__ == "__main__":
+    main()
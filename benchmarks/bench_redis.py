@@ -0,0 +1,89 @@
+# benchmarks/bench_redis.py
+"""
+Redis ops/sec for the cache helpers in ``topstepx_trader.redis_utils``:
+a fresh client per call (the old ``get_redis``) versus the pooled client, and
+per-key GET/SET versus the batched MGET/MSET/pipelined-TTL helpers.
+
+Requires a local redis-server (REDIS_URL, default redis://localhost:6379/0).
+
+Usage:
+    PYTHONPATH=./backend python benchmarks/bench_redis.py [-n 5000] [--batch 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend")))
+
+import redis
+from topstepx_trader import redis_utils
+
+PREFIX = "bench:redis:"
+
+
+def report(label, ops, elapsed):
+    print(f"{label:<36} {ops / elapsed:12,.0f} ops/sec")
+
+
+def bench_unpooled_get(n):
+    start = time.perf_counter()
+    for i in range(n):
+        redis.Redis.from_url(redis_utils.REDIS_URL, decode_responses=True).get(f"{PREFIX}{i % 100}")
+    report("GET, new client per call (before)", n, time.perf_counter() - start)
+
+
+def bench_pooled_get(n):
+    start = time.perf_counter()
+    for i in range(n):
+        redis_utils.get_str(f"{PREFIX}{i % 100}")
+    report("GET, pooled client (after)", n, time.perf_counter() - start)
+
+
+def bench_batched(n, batch):
+    keys = [f"{PREFIX}{i}" for i in range(batch)]
+    mapping = {k: "x" * 64 for k in keys}
+    rounds = max(1, n // batch)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        redis_utils.get_many(keys)
+    report(f"MGET x{batch}", rounds * batch, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        redis_utils.set_many(mapping)
+    report(f"MSET x{batch}", rounds * batch, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        redis_utils.set_many(mapping, ttl=60)
+    report(f"pipelined SET EX x{batch}", rounds * batch, time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=5000, help="operations per case")
+    parser.add_argument("--batch", type=int, default=50, help="keys per batched call")
+    args = parser.parse_args()
+
+    try:
+        redis_utils.get_redis().ping()
+    except redis.exceptions.ConnectionError as e:
+        sys.exit(f"redis-server not reachable at {redis_utils.REDIS_URL}: {e}")
+
+    redis_utils.set_many({f"{PREFIX}{i}": "x" * 64 for i in range(max(100, args.batch))})
+    try:
+        bench_unpooled_get(args.n)
+        bench_pooled_get(args.n)
+        bench_batched(args.n, args.batch)
+    finally:
+        client = redis_utils.get_redis()
+        keys = list(client.scan_iter(f"{PREFIX}*"))
+        if keys:
+            client.delete(*keys)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# benchmarks/bench_serialization.py
+"""
+Encode/decode speed and payload size of each Redis value codec in
+``topstepx_trader.serialization`` on representative cache values: a bar
+series in ``bar_store`` column form, a depth snapshot and an account list.
+
+The packed codec only applies to numeric columns; for the JSON codecs and
+msgpack the bars are stored as lists. Codecs whose optional package is not
+installed are skipped. No Redis is needed.
+
+Usage:
+    PYTHONPATH=./backend python benchmarks/bench_serialization.py [-n 200] [--bars 5000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend")))
+
+import numpy as np
+from topstepx_trader import serialization
+from topstepx_trader.bar_store import COLUMNS
+
+
+def bar_columns(n):
+    rng = np.random.default_rng(7)
+    close = 21000.0 + np.cumsum(rng.normal(0, 2.0, n)).round(2)
+    return {
+        "t": (1751376600 + 60 * np.arange(n)).astype(COLUMNS["t"]),
+        "o": close - 0.25, "h": close + 1.0, "l": close - 1.0, "c": close,
+        "v": rng.integers(1, 500, n).astype(COLUMNS["v"]),
+    }
+
+
+def depth_snapshot(levels):
+    return {"contractId": "CON.F.US.ENQ.U25", "timestamp": "2025-07-01T13:30:00Z",
+            "bids": [[21000.0 - 0.25 * i, 5 + i] for i in range(levels)],
+            "asks": [[21000.25 + 0.25 * i, 5 + i] for i in range(levels)]}
+
+
+def account_list(n):
+    return [{"id": 1000 + i, "name": f"ACC-{i}", "balance": 50000.0 + i, "canTrade": True,
+             "isVisible": True, "simulated": i % 2 == 0} for i in range(n)]
+
+
+def time_per_call(fn, n):
+    fn()
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(n):
+            fn()
+        best = min(best, (time.perf_counter() - started) / n)
+    return best * 1e6
+
+
+def available(codec):
+    if codec.name == "msgpack":
+        return serialization.msgpack is not None
+    if codec.name == "orjson":
+        return serialization.orjson is not None
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Redis value codec speed and size.")
+    parser.add_argument("-n", type=int, default=200, help="calls per measurement")
+    parser.add_argument("--bars", type=int, default=5000)
+    parser.add_argument("--levels", type=int, default=50, help="depth levels per side")
+    parser.add_argument("--accounts", type=int, default=500)
+    args = parser.parse_args()
+
+    columns = bar_columns(args.bars)
+    values = {
+        f"bars x{args.bars}": {name: col.tolist() for name, col in columns.items()},
+        f"depth x{args.levels}": depth_snapshot(args.levels),
+        f"accounts x{args.accounts}": account_list(args.accounts),
+    }
+    print(f"{'value':<16} {'codec':<8} {'bytes':>10} {'encode us':>11} {'decode us':>11}")
+    for label, value in values.items():
+        for codec in serialization.CODECS.values():
+            if not available(codec):
+                print(f"{label:<16} {codec.name:<8} {'(not installed)':>10}")
+                continue
+            if codec.name == "packed":
+                if not label.startswith("bars"):
+                    continue
+                value = columns
+            data = codec.encode(value)
+            size = len(data.encode() if isinstance(data, str) else data)
+            enc = time_per_call(lambda: codec.encode(value), args.n)
+            dec = time_per_call(lambda: codec.decode(data), args.n)
+            print(f"{label:<16} {codec.name:<8} {size:>10,} {enc:>11.1f} {dec:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
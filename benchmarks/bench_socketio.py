@@ -0,0 +1,167 @@
+# benchmarks/bench_socketio.py
+"""
+Concurrent Socket.IO client capacity of the backend during account refreshes.
+
+Starts the mock TopstepX API (``Account/search`` answering after
+``--api-latency`` seconds) and, for each mode, the real ``app.py`` under
+eventlet in a subprocess. For each client count, that many Socket.IO
+clients send ``refresh_accounts`` at once while a probe client keeps
+timing a cheap ``subscribe_positions`` round trip. The report shows API
+calls made, refresh latency and probe latency during the burst.
+
+Modes: ``blocking`` re-registers the old handler, which called
+``search_accounts()`` inside the event handler. ``offloaded`` is the
+current handler, which hands the refresh to the shared background
+``AccountRefresher``. Redis writes and rate limits are disabled in the
+server so only the handler path is compared.
+
+Usage:
+    PYTHONPATH=./backend python benchmarks/bench_socketio.py [--clients 10 50 100] [--api-latency 0.3]
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend")))
+
+from mock_api import MockTopstepX, fake_jwt
+
+
+def serve(port, api_url, blocking):
+    import eventlet
+    eventlet.monkey_patch()
+    from topstepx_trader import accounts, config, request_scheduler, token_manager
+    config.BASE_API_URL = api_url
+    token_manager.set_token(fake_jwt())
+    accounts.set_json = lambda *a, **kw: None
+    for group in ("api", "history"):
+        request_scheduler.outbound.set_limit(group, None)
+    import app as server
+    server.account_broadcaster.loader = lambda: []
+
+    if blocking:
+        def handle_refresh_accounts():
+            result = accounts.search_accounts()
+            if result and result.get("accounts"):
+                server.account_broadcaster.publish(result["accounts"])
+            server.emit("accounts_refreshed", {"version": server.account_broadcaster.version})
+        server.socketio.on_event("refresh_accounts", handle_refresh_accounts)
+
+    server.socketio.run(server.app, host="127.0.0.1", port=port, log_output=False)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(api_url, blocking):
+    port = free_port()
+    args = [sys.executable, __file__, "--serve", str(port), "--api-url", api_url] + (["--blocking"] if blocking else [])
+    process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.5).close()
+            return process, f"http://127.0.0.1:{port}"
+        except OSError:
+            time.sleep(0.1)
+    process.kill()
+    raise Exception("Backend did not start")
+
+
+def percentile(ordered, pct):
+    if not ordered:
+        return float("nan")
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def connect(url):
+    import socketio
+    client = socketio.Client(reconnection=False)
+    client.connect(url, transports=["polling"], wait_timeout=30)
+    return client
+
+
+def run_level(url, n, timeout):
+    clients = [connect(url) for _ in range(n)]
+    probe = connect(url)
+    done = [threading.Event() for _ in range(n)]
+    latencies = [None] * n
+    started = [0.0] * n
+    for i, client in enumerate(clients):
+        def on_refreshed(data, i=i):
+            latencies[i] = time.perf_counter() - started[i]
+            done[i].set()
+        client.on("accounts_refreshed", on_refreshed)
+
+    probe_ms, stop = [], threading.Event()
+    pong = threading.Event()
+    probe.on("positions_snapshot", lambda data: pong.set())
+
+    def probe_loop():
+        while not stop.is_set():
+            pong.clear()
+            t = time.perf_counter()
+            probe.emit("subscribe_positions")
+            if pong.wait(timeout):
+                probe_ms.append(1000.0 * (time.perf_counter() - t))
+            time.sleep(0.01)
+
+    prober = threading.Thread(target=probe_loop, daemon=True)
+    prober.start()
+    burst = time.perf_counter()
+    for i, client in enumerate(clients):
+        started[i] = time.perf_counter()
+        client.emit("refresh_accounts")
+    for event in done:
+        event.wait(max(0.0, timeout - (time.perf_counter() - burst)))
+    wall = time.perf_counter() - burst
+    stop.set()
+    prober.join()
+    for client in clients + [probe]:
+        client.disconnect()
+    ok = sorted(1000.0 * x for x in latencies if x is not None)
+    probe_ms.sort()
+    return {"answered": len(ok), "wall": wall, "refresh_p50": percentile(ok, 50), "refresh_p99": percentile(ok, 99),
+            "probe_p50": percentile(probe_ms, 50), "probe_p99": percentile(probe_ms, 99)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Socket.IO client capacity during account refreshes.")
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--api-latency", type=float, default=0.3, help="Account/search latency (seconds)")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--api-url", help=argparse.SUPPRESS)
+    parser.add_argument("--blocking", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.serve, args.api_url, args.blocking)
+        return
+
+    with MockTopstepX(route_latency={"/api/Account/search": args.api_latency}, items=20) as mock:
+        print(f"{'mode':<10} {'clients':>7} {'answered':>8} {'API calls':>9} {'wall s':>7} "
+              f"{'refresh p50/p99 ms':>19} {'probe p50/p99 ms':>17}")
+        for mode in ("blocking", "offloaded"):
+            process, url = start_server(mock.base_url, mode == "blocking")
+            try:
+                for n in args.clients:
+                    before = mock.requests
+                    r = run_level(url, n, args.timeout)
+                    print(f"{mode:<10} {n:>7} {r['answered']:>8} {mock.requests - before:>9} {r['wall']:>7.2f} "
+                          f"{r['refresh_p50']:>9.0f}/{r['refresh_p99']:<9.0f} {r['probe_p50']:>8.1f}/{r['probe_p99']:<8.1f}")
+            finally:
+                process.kill()
+                process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+# benchmarks/mock_api.py
+"""
+Local stand-in for the TopstepX REST API and the Node bridge ``/stream`` feed.
+
+Answers the ``/api/Auth``, ``/api/Account``, ``/api/Contract``, ``/api/Order``,
+``/api/Position``, ``/api/Trade`` and ``/api/History`` endpoints the clients
+in ``topstepx_trader`` call, with canned payloads of a configurable size and
+an optional per-request latency, so the clients can be measured offline.
+
+Usage:
+    from mock_api import MockTopstepX
+    with MockTopstepX(latency=0.02, items=50) as mock:
+        mock.point_clients_at()
+        ...
+"""
+
+import base64
+import json
+import os
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend")))
+
+CONTRACT_ID = "CON.F.US.ENQ.U25"
+EPOCH = datetime(2025, 7, 1, 13, 30, tzinfo=timezone.utc)
+
+
+def fake_jwt(lifetime=86400):
+    """Unsigned JWT whose ``exp`` the token manager can read."""
+    def part(obj):
+        return base64.urlsafe_b64encode(json.dumps(obj).encode()).rstrip(b"=").decode()
+    return f"{part({'alg': 'none'})}.{part({'exp': int(time.time() + lifetime)})}.sig"
+
+
+def _iso(dt):
+    return dt.isoformat().replace("+00:00", "Z")
+
+
+def _account(i):
+    return {"id": 1000 + i, "name": f"BENCH-{i}", "balance": 50000.0 + i, "canTrade": True,
+            "isVisible": True, "simulated": True}
+
+
+def _contract(i):
+    return {"id": CONTRACT_ID if i == 0 else f"CON.F.US.BENCH.{i}", "name": "NQU5" if i == 0 else f"B{i}U5",
+            "description": "E-mini NASDAQ-100: September 2025", "tickSize": 0.25, "tickValue": 5.0,
+            "activeContract": True, "symbolId": "F.US.ENQ"}
+
+
+def _order(account_id, i):
+    return {"id": 5000 + i, "accountId": account_id, "contractId": CONTRACT_ID,
+            "creationTimestamp": _iso(EPOCH + timedelta(minutes=i)),
+            "updateTimestamp": _iso(EPOCH + timedelta(minutes=i)), "status": 1, "type": 1,
+            "side": i % 2, "size": 1, "limitPrice": 21000.0 + i * 0.25, "stopPrice": None,
+            "customTag": f"bench-{i}"}
+
+
+def _position(account_id, i):
+    return {"id": 7000 + i, "accountId": account_id, "contractId": CONTRACT_ID,
+            "creationTimestamp": _iso(EPOCH), "type": 1, "size": 1 + i, "averagePrice": 21000.0}
+
+
+def _trade(account_id, i):
+    return {"id": 9000 + i, "accountId": account_id, "contractId": CONTRACT_ID,
+            "creationTimestamp": _iso(EPOCH + timedelta(minutes=i)), "price": 21000.0 + i * 0.25,
+            "profitAndLoss": None if i % 2 == 0 else 25.0, "fees": 1.4, "side": i % 2, "size": 1,
+            "voided": False, "orderId": 5000 + i}
+
+
+def _bars(count):
+    return [{"t": _iso(EPOCH - timedelta(minutes=i)), "o": 21000.0, "h": 21001.0, "l": 20999.0,
+             "c": 21000.5, "v": 100 + i} for i in range(count)]
+
+
+class MockTopstepX:
+    """
+    Threaded HTTP server playing the TopstepX API and the bridge stream.
+
+    ``latency`` seconds (plus up to ``jitter``) are slept before every API
+    response; ``route_latency`` overrides it per path. Search endpoints return
+    ``items`` records each and History returns up to ``bars`` bars (capped by
+    the request's ``limit``). ``/stream`` serves ``stream_events`` trade
+    events as NDJSON, ``events_per_message`` per message, each message
+    carrying a ``seq`` so resumption via ``?since=`` works.
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, route_latency=None, items=10, bars=1000,
+                 stream_events=100000, events_per_message=10):
+        self.latency = latency
+        self.jitter = jitter
+        self.route_latency = route_latency or {}
+        self.items = items
+        self.bars = bars
+        self.stream_events = stream_events
+        self.events_per_message = events_per_message
+        self.requests = 0
+        self._order_ids = iter(range(100000, 10**9))
+        self._lock = threading.Lock()
+        self._server = None
+        self._payload_cache = {}
+
+    # -- responses --------------------------------------------------------
+
+    def _respond(self, path, body):
+        account_id = body.get("accountId", 1000)
+        n = self.items
+        if path == "/api/Auth/loginKey":
+            return {"success": True, "errorCode": 0, "token": fake_jwt()}
+        if path == "/api/Auth/validate":
+            return {"success": True, "errorCode": 0, "newToken": fake_jwt()}
+        if path == "/api/Account/search":
+            return self._cached(path, lambda: {"success": True, "errorCode": 0,
+                                               "accounts": [_account(i) for i in range(n)]})
+        if path == "/api/Contract/search":
+            return self._cached(path, lambda: {"success": True, "errorCode": 0,
+                                               "contracts": [_contract(i) for i in range(n)]})
+        if path == "/api/Contract/available":
+            return self._cached(path, lambda: {"success": True, "errorCode": 0,
+                                               "contracts": [_contract(i) for i in range(n)]})
+        if path == "/api/Contract/searchById":
+            return {"success": True, "errorCode": 0, "contract": _contract(0)}
+        if path == "/api/Order/place":
+            with self._lock:
+                order_id = next(self._order_ids)
+            return {"success": True, "errorCode": 0, "orderId": order_id}
+        if path in ("/api/Order/cancel", "/api/Order/modify", "/api/Position/closeContract",
+                    "/api/Position/partialCloseContract"):
+            return {"success": True, "errorCode": 0}
+        if path in ("/api/Order/search", "/api/Order/searchOpen"):
+            return {"success": True, "errorCode": 0, "orders": [_order(account_id, i) for i in range(n)]}
+        if path == "/api/Position/searchOpen":
+            return {"success": True, "errorCode": 0, "positions": [_position(account_id, i) for i in range(n)]}
+        if path == "/api/Trade/search":
+            return {"success": True, "errorCode": 0, "trades": [_trade(account_id, i) for i in range(n)]}
+        if path == "/api/History/retrieveBars":
+            count = min(self.bars, int(body.get("limit") or self.bars))
+            return self._cached(("bars", count), lambda: {"success": True, "errorCode": 0, "bars": _bars(count)})
+        return None
+
+    def _cached(self, key, build):
+        payload = self._payload_cache.get(key)
+        if payload is None:
+            payload = self._payload_cache[key] = build()
+        return payload
+
+    def _stream_messages(self, since):
+        per = self.events_per_message
+        first = 0 if since is None else since + 1
+        ts = _iso(EPOCH)
+        for seq in range(first, (self.stream_events + per - 1) // per):
+            data = [{"timestamp": ts, "price": 21000.0 + (seq * per + i) % 40 * 0.25, "volume": 1,
+                     "type": i % 2} for i in range(per)]
+            yield {"seq": seq, "type": "GatewayTrade", "contractId": CONTRACT_ID, "data": data}
+
+    # -- server -----------------------------------------------------------
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+            disable_nagle_algorithm = True
+
+            def _send_json(self, status, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                raw = self.rfile.read(length) if length else b""
+                path = urlparse(self.path).path
+                with mock._lock:
+                    mock.requests += 1
+                delay = mock.route_latency.get(path, mock.latency)
+                if mock.jitter:
+                    delay += random.uniform(0, mock.jitter)
+                if delay:
+                    time.sleep(delay)
+                payload = mock._respond(path, json.loads(raw) if raw else {})
+                if payload is None:
+                    self._send_json(404, {"success": False, "errorMessage": f"Unknown path {path}"})
+                else:
+                    self._send_json(200, payload)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path != "/stream":
+                    self._send_json(404, {"success": False})
+                    return
+                since = parse_qs(url.query).get("since")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+                buffer = []
+                for message in mock._stream_messages(int(since[0]) if since else None):
+                    buffer.append(json.dumps(message))
+                    if len(buffer) >= 100:
+                        self.wfile.write(("\n".join(buffer) + "\n").encode())
+                        buffer = []
+                if buffer:
+                    self.wfile.write(("\n".join(buffer) + "\n").encode())
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def point_clients_at(self):
+        """Aim every ``topstepx_trader`` API client and the bridge URL at this server, unthrottled."""
+        from topstepx_trader import (config, order_api_client, position_api_client, request_scheduler,
+                                     retrieve_bars, token_manager, trades_api_client)
+        config.BASE_API_URL = self.base_url
+        for group in ("api", "history"):  # measure the clients, not the rate limits
+            request_scheduler.outbound.set_limit(group, None)
+        config.NODE_BRIDGE_URL = self.base_url
+        for module in (order_api_client, position_api_client, trades_api_client):
+            module.BASE_URL = self.base_url
+        retrieve_bars.BASE_API_URL = self.base_url
+        token_manager.set_token(fake_jwt())
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the mock TopstepX API until interrupted.")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds per API response")
+    parser.add_argument("--items", type=int, default=10, help="records per search response")
+    args = parser.parse_args()
+    mock = MockTopstepX(latency=args.latency, items=args.items).start()
+    print(f"Mock TopstepX API on {mock.base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        mock.stop()
@@ -0,0 +1,260 @@
+# benchmarks/run_benchmarks.py
+"""
+Offline benchmark suite: every REST client function and bridge ingestion,
+measured against the local TopstepX stand-in in ``mock_api.py``.
+
+For each client function it reports sequential latency percentiles and the
+throughput of ``--concurrency`` threads sharing the pooled session; for the
+bridge it reports events/s through ``BridgeIngestor``. Redis side effects of
+the clients (token and account caching) are skipped unless ``--with-redis``
+is given, so only the HTTP path is measured.
+
+Each figure is the median of ``--repeat`` rounds, so a single lucky or
+unlucky round on a shared CI machine moves neither the baseline nor the
+comparison. Every run also times a ``calibration`` case, one round after
+each case round: an ``Order/modify`` round trip to the mock over a bare
+``http.client`` connection, with none of the client code. It tracks the
+machine (CPU, loopback, the mock server) but not this repository, so with
+``--baseline`` each case is compared as a multiple of the calibration
+figure of its own run rather than in absolute milliseconds, and a baseline
+saved on one machine stays usable on another. The script exits 1 when any
+normalised p50 is slower, or any normalised throughput lower, than the
+baseline by more than ``--tolerance``, so it can gate CI.
+
+Cases in ``LOCAL_CASES`` make no API call and take microseconds, where a
+ratio to a network round trip is mostly timer noise; they are checked in
+absolute terms instead, failing only when their p50 or time per call grows
+by more than ``--local-tolerance`` milliseconds.
+
+Usage:
+    PYTHONPATH=./backend python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json
+    PYTHONPATH=./backend python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+"""
+
+import argparse
+import http.client
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../backend")))
+
+from mock_api import CONTRACT_ID, MockTopstepX
+from topstepx_trader import (accounts, auth, contract_catalog, contracts, http_client, order_api_client,
+                             position_api_client, retrieve_bars, trades_api_client)
+from topstepx_trader.bridge_client import BridgeIngestor, add_listener, remove_listener
+
+ACCOUNT_ID = 1000
+START, END = "2025-07-01T00:00:00Z", "2025-07-02T00:00:00Z"
+CALIBRATION = "calibration"
+LOCAL_CASES = {"contracts.catalog_search"}
+
+CASES = {
+    "auth.login": lambda: auth.login(),
+    "auth.renew_token": lambda: auth.renew_token("bench-token"),
+    "accounts.search_accounts": lambda: accounts.search_accounts(),
+    "contracts.search_contracts": lambda: contracts.search_contracts("NQ"),
+    "contracts.search_contract_by_id": lambda: contracts.search_contract_by_id(CONTRACT_ID),
+    "contracts.catalog_search": lambda: contract_catalog.catalog.search("nq"),  # local, see LOCAL_CASES
+    "order.place_order": lambda: order_api_client.place_order(
+        {"accountId": ACCOUNT_ID, "contractId": CONTRACT_ID, "type": 2, "side": 0, "size": 1}),
+    "order.cancel_order": lambda: order_api_client.cancel_order(ACCOUNT_ID, 5000),
+    "order.modify_order": lambda: order_api_client.modify_order(ACCOUNT_ID, 5000, limitPrice=21000.25),
+    "order.search_orders": lambda: order_api_client.search_orders(ACCOUNT_ID, START, END),
+    "order.search_open_orders": lambda: order_api_client.search_open_orders(ACCOUNT_ID),
+    "position.search_open_positions": lambda: position_api_client.search_open_positions(ACCOUNT_ID),
+    "position.close_position": lambda: position_api_client.close_position(ACCOUNT_ID, CONTRACT_ID),
+    "position.partial_close_position": lambda: position_api_client.partial_close_position(
+        ACCOUNT_ID, CONTRACT_ID, 1),
+    "trades.search_trades": lambda: trades_api_client.search_trades(ACCOUNT_ID, START, END),
+    "history.fetch_bars": lambda: retrieve_bars.fetch_bars(CONTRACT_ID, START, END),
+}
+
+
+def calibration_call(mock):
+    """``Order/modify`` on the mock over one bare ``http.client`` connection per thread."""
+    url = urlsplit(mock.base_url)
+    local = threading.local()
+    body = json.dumps({"accountId": ACCOUNT_ID, "orderId": 5000, "limitPrice": 21000.25})
+    headers = {"Content-Type": "application/json", "Authorization": "Bearer calibration"}
+
+    def call():
+        conn = getattr(local, "conn", None)
+        if conn is None:
+            conn = local.conn = http.client.HTTPConnection(url.hostname, url.port)
+        conn.request("POST", "/api/Order/modify", body, headers)
+        conn.getresponse().read()
+    return call
+
+
+def percentile(ordered, pct):
+    return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+def median_of(rounds):
+    """Per-figure median across repeated rounds."""
+    return {key: statistics.median(r[key] for r in rounds) for key in rounds[0]}
+
+
+def bench_call(fn, n, concurrency):
+    for _ in range(min(20, n)):  # warm-up: open pooled connections, fill caches
+        fn()
+    samples = []
+    for _ in range(n):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    samples.sort()
+
+    def worker(count):
+        for _ in range(count):
+            fn()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker, n // concurrency) for _ in range(concurrency)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+    return {
+        "p50": samples[len(samples) // 2],
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "throughput": (n // concurrency) * concurrency / elapsed,
+    }
+
+
+def bench_bridge(mock, timeout=60.0):
+    total = mock.stream_events
+    done = threading.Event()
+    seen = [0]
+
+    def count(events):
+        seen[0] += len(events)
+        if seen[0] >= total:
+            done.set()
+
+    add_listener(count)
+    started = time.perf_counter()
+    ingestor = BridgeIngestor(url=f"{mock.base_url}/stream", publish_to_redis=False).start()
+    try:
+        done.wait(timeout)
+    finally:
+        elapsed = time.perf_counter() - started
+        ingestor.stop()
+        remove_listener(count)
+    return {"events": seen[0], "throughput": seen[0] / elapsed}
+
+
+def compare(results, baseline, tolerance, local_tolerance):
+    """
+    Regressions of each case relative to its run's calibration case, or in
+    absolute milliseconds for ``LOCAL_CASES``.
+    """
+    if CALIBRATION not in baseline:
+        return [f"baseline has no {CALIBRATION!r} case; save it again with --save-baseline"]
+    calibration, base_calibration = results[CALIBRATION], baseline[CALIBRATION]
+    failures = []
+    for name, base in baseline.items():
+        if name == CALIBRATION:
+            continue
+        current = results.get(name)
+        if current is None:
+            failures.append(f"{name}: missing from this run")
+            continue
+        if name in LOCAL_CASES:
+            if current["p50"] > base["p50"] + local_tolerance:
+                failures.append(f"{name}: p50 {current['p50']:.4f} ms vs baseline {base['p50']:.4f} ms")
+            now, then = 1000.0 / current["throughput"], 1000.0 / base["throughput"]
+            if now > then + local_tolerance:
+                failures.append(f"{name}: {now:.4f} ms per call vs baseline {then:.4f} ms")
+            continue
+        if "p50" in base:
+            now, then = current["p50"] / calibration["p50"], base["p50"] / base_calibration["p50"]
+            if now > then * (1 + tolerance):
+                failures.append(f"{name}: p50 {now:.2f}x calibration vs baseline {then:.2f}x")
+        now = current["throughput"] / calibration["throughput"]
+        then = base["throughput"] / base_calibration["throughput"]
+        if now < then * (1 - tolerance):
+            failures.append(f"{name}: throughput {now:.3f}x calibration vs baseline {then:.3f}x")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks against the mock TopstepX API.")
+    parser.add_argument("-n", type=int, default=200, help="calls per client function and round")
+    parser.add_argument("--repeat", type=int, default=5, help="rounds per benchmark (median is kept)")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.0, help="mock API latency (seconds)")
+    parser.add_argument("--items", type=int, default=50, help="records per search response")
+    parser.add_argument("--bars", type=int, default=1000, help="bars per History response")
+    parser.add_argument("--stream-events", type=int, default=200000)
+    parser.add_argument("--only", action="append", help="run only cases whose name contains this")
+    parser.add_argument("--with-redis", action="store_true", help="keep the clients' Redis writes")
+    parser.add_argument("--baseline", help="compare against this JSON file; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed relative slowdown")
+    parser.add_argument("--local-tolerance", type=float, default=0.05,
+                        help="allowed slowdown of LOCAL_CASES in milliseconds")
+    parser.add_argument("--save-baseline", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    if not args.with_redis:
+        auth.set_str = lambda *a, **kw: None
+        accounts.set_json = lambda *a, **kw: None
+        contract_catalog.set_json = lambda *a, **kw: None
+
+    results = {}
+    with MockTopstepX(latency=args.latency, items=args.items, bars=args.bars,
+                      stream_events=args.stream_events) as mock:
+        mock.point_clients_at()
+        contract_catalog.catalog.refresh()
+        try:
+            # Calibration rounds are spread through the run, so it sees the
+            # same machine conditions as the cases it normalises.
+            calibrate = calibration_call(mock)
+            calibration = [bench_call(calibrate, args.n, args.concurrency)]
+            for name, fn in CASES.items():
+                if args.only and not any(part in name for part in args.only):
+                    continue
+                rounds = []
+                for _ in range(args.repeat):
+                    rounds.append(bench_call(fn, args.n, args.concurrency))
+                    calibration.append(bench_call(calibrate, args.n, args.concurrency))
+                results[name] = median_of(rounds)
+                r = results[name]
+                print(f"{name:<34} p50={r['p50']:8.3f} ms  p95={r['p95']:8.3f} ms  "
+                      f"p99={r['p99']:8.3f} ms  {r['throughput']:9.0f} calls/s")
+            if not args.only or any(part in "bridge.ingest" for part in args.only):
+                results["bridge.ingest"] = median_of([bench_bridge(mock) for _ in range(args.repeat)])
+                r = results["bridge.ingest"]
+                print(f"{'bridge.ingest':<34} {r['events']} events  {r['throughput']:9.0f} events/s")
+            results[CALIBRATION] = r = median_of(calibration)
+            print(f"{CALIBRATION:<34} p50={r['p50']:8.3f} ms  p95={r['p95']:8.3f} ms  "
+                  f"p99={r['p99']:8.3f} ms  {r['throughput']:9.0f} calls/s")
+        finally:
+            http_client.reset_session()
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if args.only:
+            baseline = {k: v for k, v in baseline.items() if k in results or k == CALIBRATION}
+        failures = compare(results, baseline, args.tolerance, args.local_tolerance)
+        for failure in failures:
+            print("[REGRESSION]", failure)
+        if failures:
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
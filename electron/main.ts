@@ -42,10 +42,19 @@ ipcMain.handle('save-creds', async (_, creds) => {
   }
 })
 
+// Revalidate with the last ETag so unchanged accounts come back as an empty 304
+let accountsCache: { etag?: string; data: any } = { data: [] }
+
 ipcMain.handle('get-accounts', async () => {
   try {
-    const res = await axios.get('http://127.0.0.1:5000/api/accounts')
-    return res.data
+    const res = await axios.get('http://127.0.0.1:5000/api/accounts', {
+      headers: accountsCache.etag ? { 'If-None-Match': accountsCache.etag } : {},
+      validateStatus: (status) => status === 200 || status === 304,
+    })
+    if (res.status === 200) {
+      accountsCache = { etag: res.headers['etag'], data: res.data }
+    }
+    return accountsCache.data
   } catch {
     return []
   }
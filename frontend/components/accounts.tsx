@@ -1,5 +1,5 @@
 // components/accounts.tsx
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef } from 'react'
 import { Card, CardContent, CardHeader, CardTitle } from './ui/card'
 import { Button } from './ui/button'
 import { Badge } from './ui/badge'
@@ -19,22 +19,57 @@ interface Account {
   canTrade?: boolean
 }
 
+interface AccountsDelta {
+  baseVersion: number
+  version: number
+  added: Account[]
+  changed: Partial<Account>[]
+  removed: Array<string | number>
+}
+
 const socket = io('http://localhost:5000') // adjust if needed
 
+function applyAccountsDelta(accounts: Account[], delta: AccountsDelta): Account[] {
+  const removed = new Set(delta.removed)
+  const changed = new Map<Account['id'] | undefined, Partial<Account>>(delta.changed.map((c) => [c.id, c]))
+  return accounts
+    .filter((a) => !removed.has(a.id))
+    .map((a) => (changed.has(a.id) ? { ...a, ...changed.get(a.id) } : a))
+    .concat(delta.added)
+}
+
 export function Accounts() {
   const [accounts, setAccounts] = useState<Account[]>([])
   const [isLoading, setIsLoading] = useState(true)
   const [lastUpdated, setLastUpdated] = useState<Date>(new Date())
+  const versionRef = useRef(-1)
 
   useEffect(() => {
     setIsLoading(true)
     socket.emit('subscribe_accounts')
-    socket.on('accounts_update', (data) => {
-      setAccounts(Array.isArray(data) ? data : [])
+    socket.on('accounts_snapshot', (data) => {
+      versionRef.current = data?.version ?? -1
+      setAccounts(Array.isArray(data?.accounts) ? data.accounts : [])
       setLastUpdated(new Date())
       setIsLoading(false)
     })
-    return () => { socket.off('accounts_update') }
+    socket.on('accounts_delta', (delta: AccountsDelta) => {
+      if (delta.baseVersion !== versionRef.current) {
+        // Missed an update; ask the server for a full snapshot
+        socket.emit('resync_accounts', { version: versionRef.current })
+        return
+      }
+      versionRef.current = delta.version
+      setAccounts((prev) => applyAccountsDelta(prev, delta))
+      setLastUpdated(new Date())
+      setIsLoading(false)
+    })
+    socket.on('accounts_refreshed', () => setIsLoading(false))
+    return () => {
+      socket.off('accounts_snapshot')
+      socket.off('accounts_delta')
+      socket.off('accounts_refreshed')
+    }
   }, [])
 
   // If you want to support manual reload (triggers server to refresh data)
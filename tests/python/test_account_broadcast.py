@@ -0,0 +1,94 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_account_broadcast.py
+import json
+from backend.topstepx_trader.account_broadcast import AccountBroadcaster, AccountRefresher, diff_accounts
+
+with open(os.path.join(LOG_DIR, "account_log.json")) as f:
+    ACCOUNTS = json.load(f)
+
+
+class FakeSocketIO:
+    def __init__(self):
+        self.emitted = []
+        self.tasks = []
+
+    def emit(self, event, data):
+        self.emitted.append((event, data))
+
+    def start_background_task(self, target):
+        self.tasks.append(target)
+
+    def sleep(self, seconds):
+        pass
+
+
+def test_diff_accounts_sends_only_changed_fields():
+    before = {a["id"]: a for a in ACCOUNTS}
+    after = {a["id"]: dict(a) for a in ACCOUNTS[1:]}
+    after[ACCOUNTS[1]["id"]]["balance"] = 1.0
+    added, changed, removed = diff_accounts(before, after)
+    assert added == []
+    assert changed == [{"id": ACCOUNTS[1]["id"], "balance": 1.0}]
+    assert removed == [ACCOUNTS[0]["id"]]
+
+
+def test_bursts_are_coalesced_into_one_versioned_delta():
+    sio = FakeSocketIO()
+    broadcaster = AccountBroadcaster(sio, window=0.1, loader=lambda: ACCOUNTS)
+    assert broadcaster.snapshot()["version"] == 0
+
+    for balance in (1.0, 2.0, 3.0):
+        accounts = [dict(a) for a in ACCOUNTS]
+        accounts[0]["balance"] = balance
+        broadcaster.publish(accounts)
+    assert len(sio.tasks) == 1
+    sio.tasks[0]()
+
+    assert sio.emitted == [("accounts_delta", {
+        "baseVersion": 0, "version": 1, "added": [], "removed": [],
+        "changed": [{"id": ACCOUNTS[0]["id"], "balance": 3.0}],
+    })]
+
+    # Publishing an identical state emits nothing.
+    broadcaster.publish(accounts)
+    sio.tasks[1]()
+    assert len(sio.emitted) == 1
+    assert broadcaster.snapshot()["version"] == 1
+
+
+def test_concurrent_refreshes_share_one_background_fetch():
+    sio = FakeSocketIO()
+    sio.emit = lambda event, data, to=None: sio.emitted.append((event, data, to))
+    broadcaster = AccountBroadcaster(sio, window=0, loader=lambda: ACCOUNTS)
+    fetched = []
+    refresher = AccountRefresher(sio, broadcaster, lambda: fetched.append(1) or {"accounts": ACCOUNTS[1:]})
+
+    assert refresher.request("a") is True
+    assert refresher.request("b") is False
+    assert fetched == []  # nothing ran inside the handlers
+    assert len(sio.tasks) == 1
+    sio.tasks.pop()()
+
+    assert fetched == [1]
+    refreshed = {to: data for event, data, to in sio.emitted if event == "accounts_refreshed"}
+    assert refreshed == {"a": {"version": 1}, "b": {"version": 1}}
+
+    # A later request starts a new fetch; a failing one reports the error.
+    refresher.fetch = lambda: 1 / 0
+    assert refresher.request("c") is True
+    sio.tasks.pop()()
+    assert "error" in sio.emitted[-1][1]
+    assert refresher.calls == 2
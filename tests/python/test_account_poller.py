@@ -0,0 +1,84 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_account_poller.py
+import time
+from backend.topstepx_trader import account_poller
+from backend.topstepx_trader.scheduler import TimerScheduler
+
+RTT = 0.05
+
+
+def test_active_account_ids_accepts_dicts_and_ids():
+    assert account_poller.active_account_ids('[{"id": 7, "name": "A"}, 9]') == [7, 9]
+    assert account_poller.active_account_ids("") == []
+
+
+def test_fifty_accounts_take_about_one_round_trip(monkeypatch):
+    def fake_positions(account_id):
+        time.sleep(RTT)
+        return {"success": True, "positions": [{"accountId": account_id, "size": 1}]}
+
+    def fake_orders(account_id):
+        time.sleep(RTT)
+        if account_id == 3:
+            raise Exception("boom")
+        return {"success": True, "orders": []}
+
+    monkeypatch.setattr(account_poller, "search_open_positions", fake_positions)
+    monkeypatch.setattr(account_poller, "search_open_orders", fake_orders)
+    poller = account_poller.AccountPoller(list(range(50)), max_workers=100, publish_to_redis=False)
+    pushed = []
+    poller.on_snapshot(pushed.append)
+
+    started = time.perf_counter()
+    snapshot = poller.poll()
+    elapsed = time.perf_counter() - started
+    assert elapsed < 5 * RTT
+    assert snapshot["version"] == 1
+    assert len(snapshot["accounts"]) == 50
+    assert [a["accountId"] for a in snapshot["accounts"] if a["stale"]] == [3]
+
+    # Nothing changed, so no new version and nothing pushed.
+    assert poller.poll()["version"] == 1
+    assert len(pushed) == 1
+    poller.shutdown()
+
+
+def test_poll_interval_leaves_rate_budget_for_other_traffic(monkeypatch):
+    monkeypatch.setattr(account_poller.config, "ACCOUNT_POLL_INTERVAL", 2.0)
+    monkeypatch.setattr(account_poller.config, "ACCOUNT_POLL_RATE_SHARE", 0.5)
+    assert account_poller.poll_interval(1, "200/60") == 2.0
+    for accounts in (4, 10, 50):
+        per_minute = 2 * accounts * 60 / account_poller.poll_interval(accounts, "200/60")
+        assert per_minute <= 100 + 1e-9
+    assert account_poller.poll_interval(50, "") == 2.0  # no rate limit configured
+
+
+def test_scheduled_poller_adapts_interval_to_account_count(monkeypatch):
+    monkeypatch.setattr(account_poller.config, "API_RATE_LIMIT", "200/60")
+    monkeypatch.setattr(account_poller, "search_open_positions", lambda account_id: {"success": True, "positions": []})
+    monkeypatch.setattr(account_poller, "search_open_orders", lambda account_id: {"success": True, "orders": []})
+    poller = account_poller.AccountPoller(list(range(10)), max_workers=4, publish_to_redis=False)
+    timer = TimerScheduler(max_workers=1)
+    poller.start(timer)
+    try:
+        deadline = time.time() + 5
+        while poller.version == 0 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        timer.stop()
+        poller.shutdown()
+    assert poller.version == 1
+    assert timer.jobs["account-poll"].interval == account_poller.poll_interval(10) >= 6.0
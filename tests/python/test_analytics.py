@@ -0,0 +1,88 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_analytics.py
+import numpy as np
+from backend.topstepx_trader import analytics
+
+T0 = 1_750_000_000
+
+
+def _fill(trade_id, offset, pnl, contract_id="CON.F.US.ENQ.U25", fees=1.0):
+    return {"id": trade_id, "accountId": 7, "contractId": contract_id,
+            "creationTimestamp": T0 + offset, "profitAndLoss": pnl, "fees": fees,
+            "side": 0, "size": 1, "voided": False}
+
+
+FILLS = [
+    _fill(1, 0, None),
+    _fill(2, 60, 100.0),
+    _fill(3, 120, None, "CON.F.US.MNQ.U25"),
+    _fill(4, 180, -250.0, "CON.F.US.MNQ.U25"),
+    _fill(5, 86400, 50.0),
+]
+
+
+def test_summary_metrics():
+    account = analytics.AccountAnalytics(7)
+    assert account.add_trades(FILLS) == 5
+    summary = account.summary()
+    assert summary["roundTurns"] == 3
+    assert summary["wins"] == 2
+    assert summary["netPnl"] == -105.0
+    # Equity after fees: -1, 98, 97, -154, -105; worst point is 98 -> -154.
+    assert summary["maxDrawdown"] == -252.0
+    assert summary["peakEquity"] == 98.0
+    assert summary["tradingDays"] == 2
+    assert summary["contracts"]["CON.F.US.MNQ.U25"]["netPnl"] == -252.0
+
+
+def test_incremental_update_matches_full_rebuild():
+    incremental = analytics.AccountAnalytics(7)
+    for fill in FILLS:
+        incremental.add_trades([fill])
+    incremental.add_trades(FILLS[:2])  # duplicates are ignored
+    full = analytics.AccountAnalytics(7)
+    full.add_trades(FILLS)
+    assert np.array_equal(incremental.equity, full.equity)
+    assert np.array_equal(incremental.peak, full.peak)
+
+    # A late fill that sorts before the tail rebuilds the curve in order.
+    late = analytics.AccountAnalytics(7)
+    late.add_trades(FILLS[:2] + FILLS[3:])
+    late.add_trades([FILLS[2]])
+    assert np.array_equal(late.equity, full.equity)
+
+
+def test_equity_series_downsamples():
+    account = analytics.AccountAnalytics(7)
+    account.add_trades([_fill(i, i, 1.0, fees=0.0) for i in range(1, 101)])
+    series = account.equity_series(points=10)
+    assert len(series["t"]) == 10
+    assert series["equity"][-1] == 100.0
+    assert max(series["drawdown"]) == 0.0
+
+
+def test_account_analytics_respects_start(monkeypatch):
+    def get_trades(account_id, start=None, end=None, contract_id=None):
+        return [f for f in FILLS if start is None or f["creationTimestamp"] >= start]
+
+    monkeypatch.setattr(analytics.history_store, "get_trades", get_trades)
+    monkeypatch.setattr(analytics, "_accounts", analytics.OrderedDict())
+
+    everything = analytics.account_analytics(7).summary()
+    last_day = analytics.account_analytics(7, T0 + 86400).summary()
+    assert everything["netPnl"] == -105.0
+    assert last_day["netPnl"] == 49.0 and last_day["firstTimestamp"] == T0 + 86400
+    assert analytics.account_analytics(7).summary()["netPnl"] == -105.0
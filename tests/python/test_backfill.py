@@ -0,0 +1,65 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_backfill.py
+import threading
+from backend.topstepx_trader import backfill as bf
+from backend.topstepx_trader import bar_store
+
+CONTRACT_ID = "CON.F.US.EP.U25"
+
+
+def test_backfill_is_chunked_concurrent_and_resumable(tmp_path, monkeypatch):
+    monkeypatch.setattr(bar_store.config, "BAR_STORE_DIR", str(tmp_path))
+    calls = []
+    lock = threading.Lock()
+
+    def fake_fetch(contract_id, start_time, end_time, unit=2, unit_number=1, limit=1000, include_partial_bar=False):
+        start, end = bar_store.parse_timestamp(start_time), bar_store.parse_timestamp(end_time)
+        with lock:
+            calls.append((start, end))
+        bars = [{"t": bar_store.format_timestamp(t), "o": 1.0, "h": 1.0, "l": 1.0, "c": 1.0, "v": 1}
+                for t in range(start, end, 60)]
+        return {"bars": bars, "success": True}
+
+    monkeypatch.setattr(bf, "fetch_bars", fake_fetch)
+
+    stats = bf.backfill([CONTRACT_ID], 0, 60 * 1000, chunk_bars=100, max_workers=4,
+                        requests_per_second=1000, flush_chunks=3)
+    assert stats["chunks"] == 10
+    assert stats["bars"] == 1000
+    assert len(calls) == 10
+    assert len(bar_store.read_bars(CONTRACT_ID, 2, 1)["t"]) == 1000
+
+    # Everything is covered now, so a rerun plans nothing.
+    assert bf.plan_chunks(CONTRACT_ID, 0, 60 * 1000, chunk_bars=100) == []
+    bf.backfill([CONTRACT_ID], 0, 60 * 1000, chunk_bars=100, requests_per_second=1000)
+    assert len(calls) == 10
+
+
+def test_failed_chunk_is_not_retried_on_top_of_http_retries(tmp_path, monkeypatch):
+    monkeypatch.setattr(bar_store.config, "BAR_STORE_DIR", str(tmp_path))
+    calls = []
+
+    def failing_fetch(contract_id, start_time, end_time, unit=2, unit_number=1, limit=1000,
+                      include_partial_bar=False):
+        calls.append(start_time)
+        return {"success": False, "errorCode": 1, "errorMessage": "unavailable"}
+
+    monkeypatch.setattr(bf, "fetch_bars", failing_fetch)
+
+    stats = bf.backfill([CONTRACT_ID], 0, 60 * 200, chunk_bars=100, requests_per_second=1000)
+    assert stats["failed"] == 2
+    assert len(calls) == 2  # once per chunk; transient errors are retried inside http_client
+    assert bf.plan_chunks(CONTRACT_ID, 0, 60 * 200, chunk_bars=100) == [(0, 6000), (6000, 12000)]
@@ -0,0 +1,62 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_backtest.py
+import numpy as np
+from backend.topstepx_trader import backtest, strategy
+
+
+def _bars(n=2000, seed=1):
+    rng = np.random.default_rng(seed)
+    close = 20000 + np.round(np.cumsum(rng.normal(0, 2, n)) * 4) / 4
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    return {"t": 1_750_000_000 + 60 * np.arange(n, dtype=np.int64), "o": open_,
+            "h": np.maximum(open_, close) + 0.25, "l": np.minimum(open_, close) - 0.25,
+            "c": close, "v": np.ones(n, dtype=np.int64)}
+
+
+def test_vectorized_and_event_modes_agree():
+    bars = _bars()
+    fast = backtest.run_vectorized(strategy.SmaCross(fast=5, slow=20), bars)
+    slow = backtest.run_events(strategy.SmaCross(fast=5, slow=20), bars)
+    assert np.array_equal(fast["position"], slow["position"])
+    assert np.allclose(fast["equity"], slow["equity"])
+    assert fast["summary"]["trades"] > 0
+
+
+def test_fill_and_commission_accounting():
+    bars = {"t": np.arange(3, dtype=np.int64) * 60, "o": np.array([100.0, 101.0, 103.0]),
+            "h": np.array([101.0, 103.0, 104.0]), "l": np.array([99.0, 100.0, 102.0]),
+            "c": np.array([100.0, 102.0, 104.0]), "v": np.ones(3, dtype=np.int64)}
+
+    class BuyOnce(strategy.Strategy):
+        def signals(self, bars):
+            return np.array([1, 1, 1])
+
+    result = backtest.run_vectorized(BuyOnce(), bars, fill=backtest.FillModel(slippage_ticks=1, tick_size=0.25),
+                                     commission=backtest.CommissionModel(per_contract=2.0), point_value=20.0)
+    # Bought at the second open plus a tick (101.25), marked at 104, minus one side of commission.
+    assert result["summary"]["netPnl"] == (104.0 - 101.25) * 20.0 - 2.0
+    assert result["summary"]["contracts"] == 1
+
+
+def test_sweep_ranks_parameter_grid():
+    bars = _bars(1000)
+    results = backtest.sweep(strategy.SmaCross, {"fast": [3, 5], "slow": [20, 40]}, bars, max_workers=2)
+    assert len(results) == 4
+    pnls = [summary["netPnl"] for _, summary in results]
+    assert pnls == sorted(pnls, reverse=True)
+    params, summary = results[0]
+    expected = backtest.run_vectorized(strategy.SmaCross(**params), bars)["summary"]
+    assert summary == expected
@@ -0,0 +1,68 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_bar_aggregator.py
+from backend.topstepx_trader.bar_aggregator import BarAggregator, BarRing
+from backend.topstepx_trader.market_events import TradeEvent, QuoteEvent
+
+CONTRACT_ID = "CON.F.US.ENQ.U25"
+
+
+def trade(ts, price, size=1):
+    return TradeEvent(CONTRACT_ID, ts, price, size, 0)
+
+
+def test_multi_timeframe_bars_and_close_events():
+    closes = []
+    agg = BarAggregator(timeframes=(1, 60))
+    agg.on_close(lambda contract_id, tf, bar: closes.append((tf, bar["t"], bar["c"])))
+
+    agg.on_events([trade(0.1, 10.0), trade(0.5, 12.0, 2), QuoteEvent(CONTRACT_ID, 0.6, 9, 10, 10, 1),
+                   trade(0.9, 9.0), trade(1.2, 11.0), trade(61.0, 13.0)])
+
+    assert closes == [(1, 0, 9.0), (1, 1, 11.0), (60, 0, 11.0)]
+    second = agg.bars(CONTRACT_ID, 1)
+    assert list(second["o"]) == [10.0, 11.0]
+    assert list(second["h"]) == [12.0, 11.0]
+    assert list(second["l"]) == [9.0, 11.0]
+    assert list(second["v"]) == [4, 1]
+    assert agg.current_bar(CONTRACT_ID, 60)["o"] == 13.0
+
+    # Time-based close with no further ticks; late ticks are not re-opened.
+    assert agg.close_due(now=121.0) == 2
+    agg.on_events([trade(61.5, 1.0)])
+    assert agg.current_bar(CONTRACT_ID, 60) is None
+    assert agg.late_ticks == 2
+
+
+def test_tick_arriving_just_after_the_boundary_still_counts():
+    closes = []
+    agg = BarAggregator(timeframes=(60,), close_grace=0.5)
+    agg.on_close(lambda contract_id, tf, bar: closes.append(bar))
+    agg.on_events([trade(0.5, 100.0, 6), trade(30.0, 101.0)])
+
+    # The boundary has passed, but the bucket's last tick is still in flight.
+    assert agg.close_due(now=60.01) == 0
+    agg.on_events([trade(59.99, 105.0, 6)])
+    assert agg.close_due(now=60.5) == 1
+    assert agg.late_ticks == 0
+    assert (closes[0]["c"], closes[0]["v"]) == (105.0, 13)
+
+
+def test_ring_keeps_newest_bars():
+    ring = BarRing(3)
+    for t in range(5):
+        ring.append(t, t, t, t, t, t)
+    assert list(ring.last()["t"]) == [2, 3, 4]
+    assert list(ring.last(2)["t"]) == [3, 4]
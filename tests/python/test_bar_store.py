@@ -0,0 +1,132 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_bar_store.py
+import time
+import pytest
+from backend.topstepx_trader import bar_store
+from backend.topstepx_trader import retrieve_bars as rb
+
+CONTRACT_ID = "CON.F.US.ENQ.U25"
+
+
+def make_bar(epoch, close):
+    return {"t": bar_store.format_timestamp(epoch), "o": close, "h": close, "l": close, "c": close, "v": 1}
+
+
+@pytest.fixture(autouse=True)
+def store_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(bar_store.config, "BAR_STORE_DIR", str(tmp_path))
+
+
+def test_write_read_and_coverage():
+    bar_store.write_bars(CONTRACT_ID, 2, 1, [make_bar(120, 2.0), make_bar(60, 1.0)], covered=(60, 180))
+    bar_store.write_bars(CONTRACT_ID, 2, 1, [make_bar(120, 5.0), make_bar(300, 3.0)], covered=(240, 360))
+
+    columns = bar_store.read_bars(CONTRACT_ID, 2, 1)
+    assert list(columns["t"]) == [60, 120, 300]
+    assert list(columns["c"]) == [1.0, 5.0, 3.0]
+    assert list(bar_store.read_bars(CONTRACT_ID, 2, 1, 100, 300)["t"]) == [120]
+    assert bar_store.missing_ranges(CONTRACT_ID, 2, 1, 0, 420) == [(0, 60), (180, 240), (360, 420)]
+
+
+def test_retrieve_bars_only_fetches_missing_ranges(monkeypatch):
+    calls = []
+
+    def fake_fetch(contract_id, start_time, end_time, unit=2, unit_number=1, limit=1000, include_partial_bar=False):
+        calls.append((start_time, end_time, limit))
+        start, end = bar_store.parse_timestamp(start_time), bar_store.parse_timestamp(end_time)
+        bars = [make_bar(t, float(t)) for t in range(end - 60, start - 1, -60)]
+        return {"bars": bars, "success": True, "errorCode": 0, "errorMessage": None}
+
+    monkeypatch.setattr(rb, "get_current_front_month_contract_id", lambda symbol="NQ": CONTRACT_ID)
+    monkeypatch.setattr(rb, "fetch_bars", fake_fetch)
+
+    first = rb.retrieve_bars("NQ", 30)
+    assert first["success"] is True
+    assert len(calls) == 1
+    assert len(first["bars"]) == calls[0][2]
+
+    second = rb.retrieve_bars("NQ", 30)
+    assert len(calls) <= 2  # at most the newly completed minute is fetched
+    assert second["success"] is True
+    assert second["bars"][0]["t"] >= first["bars"][0]["t"]
+
+
+def test_newer_bars_are_appended_in_place(monkeypatch):
+    bar_store.write_bars(CONTRACT_ID, 2, 1, [make_bar(60, 1.0), make_bar(120, 2.0)])
+
+    def no_rewrite(*args, **kwargs):
+        raise AssertionError("append should not rewrite the series")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(bar_store.np, "save", no_rewrite)
+        bar_store.write_bars(CONTRACT_ID, 2, 1, [make_bar(240, 4.0), make_bar(180, 3.0), make_bar(240, 4.5)])
+
+    columns = bar_store.read_bars(CONTRACT_ID, 2, 1)
+    assert list(columns["t"]) == [60, 120, 180, 240]
+    assert list(columns["c"]) == [1.0, 2.0, 3.0, 4.5]
+
+    # A bar inside the stored range still goes through the full merge.
+    bar_store.write_bars(CONTRACT_ID, 2, 1, [make_bar(120, 9.0), make_bar(300, 5.0)])
+    columns = bar_store.read_bars(CONTRACT_ID, 2, 1)
+    assert list(columns["t"]) == [60, 120, 180, 240, 300]
+    assert list(columns["c"]) == [1.0, 9.0, 3.0, 4.5, 5.0]
+
+
+def test_reader_never_sees_a_half_rewritten_series(monkeypatch):
+    bar_store.write_bars(CONTRACT_ID, 2, 1, [make_bar(60, 1.0), make_bar(120, 2.0), make_bar(180, 3.0)])
+    seen = []
+    save = bar_store.np.save
+
+    def save_then_read(file, column):
+        save(file, column)
+        bar_store._mapped.clear()  # a cold reader, e.g. another process
+        columns = bar_store.read_bars(CONTRACT_ID, 2, 1)
+        seen.append(dict(zip(columns["t"].tolist(), columns["c"].tolist())))
+
+    with monkeypatch.context() as patch:
+        patch.setattr(bar_store.np, "save", save_then_read)
+        # Older than everything stored, so the series is rewritten.
+        bar_store.write_bars(CONTRACT_ID, 2, 1, [make_bar(0, 0.5)])
+
+    assert seen and all(pairs == {60: 1.0, 120: 2.0, 180: 3.0} for pairs in seen)
+    columns = bar_store.read_bars(CONTRACT_ID, 2, 1)
+    assert list(columns["t"]) == [0, 60, 120, 180]
+    assert list(columns["c"]) == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_unpublished_current_bar_is_fetched_again(monkeypatch):
+    now = int(time.time())
+    end = now - now % 60
+    start = end - 10 * 60
+    published = {"newest": end - 120}  # the bar that just closed is not out yet
+    calls = []
+
+    def fake_fetch(contract_id, start_time, end_time, unit=2, unit_number=1, limit=1000, include_partial_bar=False):
+        lo, hi = bar_store.parse_timestamp(start_time), bar_store.parse_timestamp(end_time)
+        calls.append((lo, hi))
+        bars = [make_bar(t, float(t)) for t in range(min(hi - 60, published["newest"]), lo - 1, -60)]
+        return {"bars": bars, "success": True, "errorCode": 0, "errorMessage": None}
+
+    monkeypatch.setattr(rb, "fetch_bars", fake_fetch)
+
+    assert rb.fill_gaps(CONTRACT_ID, start, end) is None
+    assert bar_store.read_bars(CONTRACT_ID, 2, 1)["t"][-1] == end - 120
+    assert bar_store.missing_ranges(CONTRACT_ID, 2, 1, start, end)  # the current bar is not marked covered
+
+    published["newest"] = end - 60
+    assert rb.fill_gaps(CONTRACT_ID, start, end) is None
+    assert calls[-1][1] == end and calls[-1][0] >= end - 120
+    assert bar_store.read_bars(CONTRACT_ID, 2, 1)["t"][-1] == end - 60
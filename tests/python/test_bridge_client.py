@@ -0,0 +1,100 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_bridge_client.py
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from backend.topstepx_trader import bridge_client
+from backend.topstepx_trader.market_events import QuoteEvent, TradeEvent, DepthEvent, parse_message
+
+QUOTE = {"type": "GatewayQuote", "contractId": "CON.F.US.ENQ.U25",
+         "data": {"bestBid": 22866.0, "bestAsk": 22866.25, "lastPrice": 22866.25,
+                  "volume": 1200, "lastUpdated": "2025-07-14T05:15:00.1234567+00:00"}}
+TRADES = {"type": "GatewayTrade", "contractId": "CON.F.US.ENQ.U25",
+          "data": [{"price": 22866.25, "volume": 2, "type": 0, "timestamp": "2025-07-14T05:15:00Z"},
+                   {"price": 22866.0, "volume": 1, "type": 1, "timestamp": "2025-07-14T05:15:01Z"}]}
+BAD_TIMESTAMP = {"type": "GatewayQuote", "contractId": "CON.F.US.ENQ.U25",
+                 "data": {"bestBid": 1.0, "lastUpdated": "2025-07-14Tgarbage.123"}}
+
+
+def test_decoder_handles_split_chunks_and_sse_framing():
+    decoder = bridge_client.JsonStreamDecoder()
+    payload = (json.dumps(QUOTE) + "\n" + "data: " + json.dumps(TRADES) + "\n\n: ping\nnot json\n").encode()
+    out = []
+    for i in range(0, len(payload), 7):
+        out.extend(decoder.feed(payload[i:i + 7]))
+    assert out == [QUOTE, TRADES]
+    assert decoder.errors == 1
+
+
+def test_parse_message_types():
+    quote, = parse_message(QUOTE)
+    assert isinstance(quote, QuoteEvent) and quote.bid == 22866.0 and quote.ts is not None
+    trades = parse_message(TRADES)
+    assert [type(t) for t in trades] == [TradeEvent, TradeEvent]
+    assert [t.size for t in trades] == [2, 1]
+    depth, = parse_message({"type": "GatewayDepth", "contractId": "X",
+                            "data": {"type": 2, "price": 1.0, "volume": 3}})
+    assert isinstance(depth, DepthEvent) and depth.dom_type == 2
+    assert parse_message({"type": "Heartbeat"}) == []
+
+
+class StreamHandler(BaseHTTPRequestHandler):
+    requests_seen = []
+
+    def do_GET(self):
+        StreamHandler.requests_seen.append(self.path)
+        first = len(StreamHandler.requests_seen) == 1
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.end_headers()
+        seq = 1 if first else 3
+        if first:
+            self.wfile.write((json.dumps(BAD_TIMESTAMP) + "\n").encode())
+        for message in ([QUOTE, TRADES] if first else [QUOTE]):
+            self.wfile.write((json.dumps(dict(message, seq=seq)) + "\n").encode())
+            seq += 1
+        self.wfile.flush()
+        if not first:
+            time.sleep(1.0)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_ingestor_reconnects_and_resumes(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StreamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(bridge_client.config, "BRIDGE_RECONNECT_MIN", 0.05)
+    received = []
+    bridge_client.add_listener(received.extend)
+    ingestor = bridge_client.BridgeIngestor(url=f"http://127.0.0.1:{server.server_address[1]}/stream",
+                                            batch_interval=0.01, publish_to_redis=False).start()
+    try:
+        deadline = time.time() + 5
+        while len(received) < 4 and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        ingestor.stop()
+        bridge_client.remove_listener(received.extend)
+        server.shutdown()
+
+    assert [e.kind for e in received] == ["quote", "trade", "trade", "quote"]
+    assert StreamHandler.requests_seen[0] == "/stream"
+    assert StreamHandler.requests_seen[1] == "/stream?since=2"
+    stats = ingestor.stats()
+    assert stats["messages"] == 4 and stats["events"] == 4 and stats["reconnects"] >= 1
+    assert stats["parse_errors"] == 1
@@ -0,0 +1,54 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_contract_cache.py
+import json
+from datetime import date
+from backend.topstepx_trader import contract_cache
+
+with open(os.path.join(LOG_DIR, "contracts_log.json")) as f:
+    CONTRACTS = json.load(f)
+
+
+def test_pick_front_month_matches_symbol_root():
+    assert contract_cache.pick_front_month("NQ", CONTRACTS)["id"] == "CON.F.US.ENQ.U25"
+    assert contract_cache.pick_front_month("MNQ", CONTRACTS)["id"] == "CON.F.US.MNQ.U25"
+
+
+def test_roll_window():
+    assert contract_cache.contract_expiry("CON.F.US.ENQ.U25") == date(2025, 9, 19)
+    assert contract_cache.near_roll("CON.F.US.ENQ.U25", today=date(2025, 9, 12))
+    assert not contract_cache.near_roll("CON.F.US.ENQ.U25", today=date(2025, 8, 1))
+
+
+def test_resolution_is_local_after_first_lookup(monkeypatch):
+    calls = []
+    stored = {}
+    monkeypatch.setattr(contract_cache, "_front_month", {})
+    monkeypatch.setattr(contract_cache, "_contracts", {})
+    monkeypatch.setattr(contract_cache, "_loaded", False)
+    monkeypatch.setattr(contract_cache, "get_json", lambda key, default=None: stored.get(key, default))
+    monkeypatch.setattr(contract_cache, "set_json", lambda key, value, ttl=None: stored.__setitem__(key, value))
+
+    def fake_search(search_text="NQ", live=False):
+        calls.append(search_text)
+        return {"success": True, "contracts": CONTRACTS}
+
+    monkeypatch.setattr(contract_cache, "search_contracts", fake_search)
+
+    for _ in range(3):
+        assert contract_cache.front_month_contract_id("NQ") == "CON.F.US.ENQ.U25"
+    assert calls == ["NQ"]
+    assert contract_cache.front_month_details("NQ")["tickValue"] == 5
+    assert stored[contract_cache.REDIS_KEY]["frontMonth"]["NQ:sim"]["contractId"] == "CON.F.US.ENQ.U25"
@@ -0,0 +1,65 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_contract_catalog.py
+import pytest
+from backend.topstepx_trader import contract_catalog
+
+CONTRACTS = [
+    {"id": "CON.F.US.MNQ.U25", "name": "MNQU5", "description": "Micro E-mini Nasdaq-100: September 2025",
+     "symbolId": "F.US.MNQ", "activeContract": True},
+    {"id": "CON.F.US.ENQ.U25", "name": "NQU5", "description": "E-mini NASDAQ-100: September 2025",
+     "symbolId": "F.US.ENQ", "activeContract": True},
+    {"id": "CON.F.US.EP.U25", "name": "ESU5", "description": "E-mini S&P 500: September 2025",
+     "symbolId": "F.US.EP", "activeContract": True},
+    {"id": "CON.F.US.CLE.V25", "name": "CLV5", "description": "Crude Oil: October 2025",
+     "symbolId": "F.US.CLE", "activeContract": True},
+    {"id": "CON.F.US.GCE.Z25", "name": "GCZ5", "description": "Gold: December 2025",
+     "symbolId": "F.US.GCE", "activeContract": True},
+]
+
+
+def names(results):
+    return [c["name"] for c in results]
+
+
+def test_symbol_prefix_ranks_exact_root_first():
+    index = contract_catalog.ContractIndex(CONTRACTS)
+    assert names(index.search("nq"))[0] == "NQU5"
+    assert names(index.search("NQU"))[0] == "NQU5"
+    assert names(index.search("mnq")) == ["MNQU5"]
+    assert names(index.search("c", limit=1)) == ["CLV5"]
+
+
+def test_description_words_typos_and_multiword_queries():
+    index = contract_catalog.ContractIndex(CONTRACTS)
+    assert set(names(index.search("nasdaq"))) == {"NQU5", "MNQU5"}
+    assert names(index.search("gold")) == ["GCZ5"]
+    assert set(names(index.search("nasdq"))) == {"NQU5", "MNQU5"}  # typos
+    assert names(index.search("golld")) == ["GCZ5"]
+    assert names(index.search("micro nasdaq")) == ["MNQU5"]
+    assert index.search("") == []
+
+
+def test_catalog_swaps_in_a_refreshed_index(monkeypatch):
+    monkeypatch.setattr(contract_catalog, "set_json", lambda *a, **kw: None)
+    catalog = contract_catalog.ContractCatalog(live=False, fetch=lambda live: {"contracts": CONTRACTS[:2]})
+    assert catalog.search("es") == []
+    assert catalog.refresh() == 2
+    assert names(catalog.search("nq"))[0] == "NQU5"
+
+    catalog.fetch = lambda live: {"success": False, "errorMessage": "down", "contracts": []}
+    with pytest.raises(Exception):
+        catalog.refresh()
+    assert len(catalog.index) == 2  # the last good index keeps serving
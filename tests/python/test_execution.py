@@ -0,0 +1,158 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_execution.py
+import time
+import requests
+from backend.topstepx_trader import execution
+
+ORDER = {"accountId": 1, "contractId": "CON.F.US.MES.M25", "type": 1, "side": 1, "size": 1,
+         "limitPrice": 9999, "stopPrice": None, "trailPrice": None, "customTag": None,
+         "linkedOrderId": None}
+
+
+def test_batch_runs_concurrently_and_records_latency(monkeypatch):
+    def slow_place(order_data):
+        time.sleep(0.2)
+        return {"success": True, "orderId": 42, "errorCode": 0, "errorMessage": None}
+
+    def slow_cancel(account_id, order_id):
+        time.sleep(0.2)
+        return {"success": True, "errorCode": 0, "errorMessage": None}
+
+    monkeypatch.setattr(execution.order_api_client, "place_order", slow_place)
+    monkeypatch.setattr(execution.order_api_client, "cancel_order", slow_cancel)
+    engine = execution.ExecutionEngine(max_workers=10)
+    intents = [execution.place_intent(ORDER) for _ in range(5)]
+    intents += [execution.cancel_intent(1, n) for n in range(5)]
+
+    start = time.perf_counter()
+    results = engine.submit_batch(intents)
+    elapsed = time.perf_counter() - start
+    engine.shutdown()
+
+    assert elapsed < 0.6
+    assert all(r["success"] for r in results)
+    tags = {r["customTag"] for r in results[:5]}
+    assert len(tags) == 5 and all(tag.startswith("qx-") for tag in tags)
+    assert engine.latency_stats()["count"] == 10
+    assert engine.latency_stats()["p50"] >= 200
+
+
+def test_place_is_not_resent_when_tag_already_landed(monkeypatch):
+    calls, searches, sleeps = [], [], []
+
+    def flaky_place(order_data):
+        calls.append(order_data["customTag"])
+        raise requests.ConnectionError("reset by peer")
+
+    def recent_orders(account_id, start_ts, end_ts, priority=None):
+        searches.append((start_ts, end_ts, priority))
+        # A market order that already filled is no longer open, but Order/search still has it.
+        return {"success": True, "orders": [{"id": 7, "status": 2, "customTag": calls[0]}]}
+
+    monkeypatch.setattr(execution.order_api_client, "place_order", flaky_place)
+    monkeypatch.setattr(execution.order_api_client, "search_orders", recent_orders)
+    monkeypatch.setattr(execution.resilience, "backoff", lambda attempt, response=None: sleeps.append(attempt) or 0)
+    engine = execution.ExecutionEngine(max_workers=1)
+    result, = engine.submit_batch([execution.place_intent(dict(ORDER, customTag="mine"))])
+    engine.shutdown()
+
+    assert calls == ["mine"]
+    assert result["success"] is True
+    assert result["response"]["orderId"] == 7
+    assert sleeps == [0]
+    assert searches[0][0] < searches[0][1] and searches[0][2] == execution.ORDERS
+
+
+def test_place_resends_with_backoff_only_when_tag_is_missing(monkeypatch):
+    calls, sleeps = [], []
+
+    def place(order_data):
+        calls.append(order_data["customTag"])
+        if len(calls) < 3:
+            raise requests.ConnectionError("reset by peer")
+        return {"success": True, "orderId": 9, "errorCode": 0, "errorMessage": None}
+
+    monkeypatch.setattr(execution.order_api_client, "place_order", place)
+    monkeypatch.setattr(execution.order_api_client, "search_orders",
+                        lambda account_id, start_ts, end_ts, priority=None: {"success": True, "orders": []})
+    monkeypatch.setattr(execution.resilience, "backoff", lambda attempt, response=None: sleeps.append(attempt) or 0)
+    engine = execution.ExecutionEngine(max_workers=1, retries=2)
+    result, = engine.submit_batch([execution.place_intent(dict(ORDER, customTag="mine"))])
+    engine.shutdown()
+
+    assert calls == ["mine", "mine", "mine"]
+    assert sleeps == [0, 1]
+    assert result["success"] is True and result["attempts"] == 3
+
+
+def test_place_is_not_resent_when_tag_lookup_fails(monkeypatch):
+    calls = []
+
+    def place(order_data):
+        calls.append(order_data["customTag"])
+        raise requests.ConnectionError("reset by peer")
+
+    def lookup_fails(account_id, start_ts, end_ts, priority=None):
+        raise requests.ConnectionError("still down")
+
+    monkeypatch.setattr(execution.order_api_client, "place_order", place)
+    monkeypatch.setattr(execution.order_api_client, "search_orders", lookup_fails)
+    monkeypatch.setattr(execution.resilience, "backoff", lambda attempt, response=None: 0)
+    engine = execution.ExecutionEngine(max_workers=1, retries=2)
+    result, = engine.submit_batch([execution.place_intent(dict(ORDER, customTag="mine"))])
+    engine.shutdown()
+
+    assert calls == ["mine"]
+    assert result["status"] == "unknown" and result["success"] is None
+    assert "not resending" in result["error"]
+
+
+def test_last_failed_place_is_still_looked_up(monkeypatch):
+    calls, searches = [], []
+
+    def place(order_data):
+        calls.append(order_data["customTag"])
+        raise requests.ReadTimeout("read timed out")
+
+    def recent_orders(account_id, start_ts, end_ts, priority=None):
+        searches.append(start_ts)
+        # Only the last send's response was lost after the order was accepted.
+        return {"success": True, "orders": [{"id": 11, "status": 1, "customTag": "mine"}] if len(calls) == 3 else []}
+
+    monkeypatch.setattr(execution.order_api_client, "place_order", place)
+    monkeypatch.setattr(execution.order_api_client, "search_orders", recent_orders)
+    monkeypatch.setattr(execution.resilience, "backoff", lambda attempt, response=None: 0)
+    engine = execution.ExecutionEngine(max_workers=1, retries=2)
+    result, = engine.submit_batch([execution.place_intent(dict(ORDER, customTag="mine"))])
+    engine.shutdown()
+
+    assert len(calls) == 3 and len(searches) == 3
+    assert result["status"] == "success" and result["response"]["orderId"] == 11
+
+
+def test_place_confirmed_absent_after_last_attempt_is_failed(monkeypatch):
+    def place(order_data):
+        raise requests.ReadTimeout("read timed out")
+
+    monkeypatch.setattr(execution.order_api_client, "place_order", place)
+    monkeypatch.setattr(execution.order_api_client, "search_orders",
+                        lambda account_id, start_ts, end_ts, priority=None: {"success": True, "orders": []})
+    monkeypatch.setattr(execution.resilience, "backoff", lambda attempt, response=None: 0)
+    engine = execution.ExecutionEngine(max_workers=1, retries=1)
+    result, = engine.submit_batch([execution.place_intent(dict(ORDER, customTag="mine"))])
+    engine.shutdown()
+
+    assert result["status"] == "failed" and result["success"] is False
@@ -0,0 +1,98 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_history_store.py
+import threading
+import time
+from backend.topstepx_trader import history_store
+
+DAY = 86400
+
+
+def _trade(trade_id, ts, contract_id="CON.F.US.ENQ.U25"):
+    return {"id": trade_id, "accountId": 7, "contractId": contract_id,
+            "creationTimestamp": history_store._iso(ts), "price": 100.0 + trade_id,
+            "profitAndLoss": 10.0, "fees": 1.0, "side": 0, "size": 1, "voided": False}
+
+
+def _use_store(monkeypatch, tmp_path, trades):
+    calls = []
+    monkeypatch.setattr(history_store.config, "HISTORY_DB_PATH", str(tmp_path / "history.sqlite3"))
+
+    def fake_search(account_id, start, end=None):
+        calls.append((start, end))
+        lo, hi = history_store.parse_time(start), history_store.parse_time(end)
+        rows = [t for t in trades if lo <= history_store.parse_time(t["creationTimestamp"]) < hi]
+        return {"success": True, "trades": rows}
+
+    monkeypatch.setattr(history_store, "search_trades", fake_search)
+    return calls
+
+
+def test_month_of_history_is_served_locally(monkeypatch, tmp_path):
+    now = time.time()
+    trades = [_trade(i, now - (30 - i) * DAY + 3600) for i in range(30)]
+    calls = _use_store(monkeypatch, tmp_path, trades)
+
+    first = history_store.get_trades(7, now - 31 * DAY)
+    assert [t["id"] for t in first] == list(range(30))
+    assert len(calls) == 1
+
+    calls.clear()
+    month = history_store.get_trades(7, now - 31 * DAY, now - DAY)
+    assert len(month) == 29
+    again = history_store.get_trades(7, now - 31 * DAY)
+    assert len(again) == 30
+    assert calls == []
+
+
+def test_sync_fetches_only_after_high_water_mark(monkeypatch, tmp_path):
+    now = time.time()
+    trades = [_trade(1, now - 2 * DAY)]
+    calls = _use_store(monkeypatch, tmp_path, trades)
+    history_store.sync_trades(7, now - 5 * DAY, now=now)
+
+    trades.append(_trade(2, now + 10))
+    assert history_store.sync_trades(7, now=now + 60) == 1
+    start = history_store.parse_time(calls[-1][0])
+    assert abs(start - (now - history_store.config.HISTORY_SYNC_OVERLAP)) < 1e-3
+    assert [t["id"] for t in history_store.query_trades(7)] == [1, 2]
+
+    # Asking for older history fetches only the gap below the low-water mark.
+    history_store.sync_trades(7, now - 10 * DAY, now=now + 120)
+    assert abs(history_store.parse_time(calls[-2][1]) - (now - 5 * DAY)) < 1e-3
+
+
+def test_query_filters_by_contract(monkeypatch, tmp_path):
+    now = time.time()
+    trades = [_trade(1, now - 100), _trade(2, now - 50, "CON.F.US.MNQ.U25")]
+    _use_store(monkeypatch, tmp_path, trades)
+    history_store.sync_trades(7, now - DAY, now=now)
+    assert [t["id"] for t in history_store.query_trades(7, contract_id="CON.F.US.MNQ.U25")] == [2]
+
+
+def test_connections_are_pooled_across_threads(monkeypatch, tmp_path):
+    _use_store(monkeypatch, tmp_path, [])
+    opened = []
+    real_open = history_store._open
+    monkeypatch.setattr(history_store, "_open", lambda path: opened.append(path) or real_open(path))
+
+    # Like eventlet greenlets, every request runs on a fresh thread.
+    for _ in range(20):
+        worker = threading.Thread(target=history_store.query_trades, args=(7,))
+        worker.start()
+        worker.join()
+
+    assert len(opened) == 1
+    assert len(history_store._pools[str(tmp_path / "history.sqlite3")]) == 1
@@ -0,0 +1,52 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_http_client.py
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from backend.topstepx_trader import http_client
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers = set()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        KeepAliveHandler.peers.add(self.client_address)
+        body = b'{"success": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_shared_session_reuses_connection():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/Account/search"
+    try:
+        http_client.reset_session()
+        assert http_client.get_session() is http_client.get_session()
+        for _ in range(5):
+            assert http_client.post(url, json={}).json()["success"] is True
+        # One client socket served all five requests
+        assert len(KeepAliveHandler.peers) == 1
+    finally:
+        http_client.reset_session()
+        server.shutdown()
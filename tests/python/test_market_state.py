@@ -0,0 +1,60 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_market_state.py
+from backend import app as app_module
+from backend.topstepx_trader.market_events import QuoteEvent, TradeEvent, DepthEvent
+from backend.topstepx_trader.market_state import MarketState
+
+CONTRACT_ID = "CON.F.US.ENQ.U25"
+
+
+def feed(state):
+    state.on_events([
+        DepthEvent(CONTRACT_ID, 1.0, 2, 100.0, 5),
+        DepthEvent(CONTRACT_ID, 1.0, 2, 99.75, 7),
+        DepthEvent(CONTRACT_ID, 1.0, 1, 100.25, 3),
+        DepthEvent(CONTRACT_ID, 1.0, 1, 100.5, 4),
+        QuoteEvent(CONTRACT_ID, 1.1, 100.0, 100.25, 100.0, 10),
+        QuoteEvent(CONTRACT_ID, 1.2, None, None, 100.25, None),
+        TradeEvent(CONTRACT_ID, 1.3, 100.25, 2, 0),
+        DepthEvent(CONTRACT_ID, 1.4, 1, 100.25, 0),
+    ])
+
+
+def test_snapshot_reflects_quotes_trades_and_book():
+    state = MarketState()
+    feed(state)
+    assert state.quote(CONTRACT_ID) == (100.0, 100.25, 100.25)
+    snap = state.snapshot(CONTRACT_ID, depth=1)
+    assert snap["book"]["bids"] == [[100.0, 5]]
+    assert snap["book"]["asks"] == [[100.5, 4]]
+    assert snap["lastTrade"]["size"] == 2
+    assert snap["quote"]["volume"] == 10
+
+    state.on_events([DepthEvent(CONTRACT_ID, 2.0, 6, None, None)])
+    assert state.snapshot(CONTRACT_ID)["book"]["bids"] == []
+
+
+def test_market_endpoints(monkeypatch):
+    monkeypatch.setattr(app_module, "_market_feed", object())
+    monkeypatch.setattr(app_module, "market_state", MarketState())
+    feed(app_module.market_state)
+    client = app_module.app.test_client()
+
+    response = client.get(f"/api/market/{CONTRACT_ID}?depth=2")
+    assert response.status_code == 200
+    assert response.get_json()["book"]["bids"] == [[100.0, 5], [99.75, 7]]
+    assert client.get("/api/market/CON.F.US.XXX.Z25").status_code == 404
+    assert list(client.get("/api/market").get_json()) == [CONTRACT_ID]
@@ -0,0 +1,92 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_metrics.py
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from backend.topstepx_trader import http_client, logging_setup, retrieve_bars
+
+metrics = http_client.metrics
+
+
+class BarsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = json.dumps({"success": True, "errorCode": 0,
+                           "bars": [{"t": "2025-07-01T13:30:00Z", "o": 1, "h": 1, "l": 1, "c": 1, "v": 1}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_histogram_renders_cumulative_buckets():
+    hist = metrics.Histogram("test_latency_seconds", "Test histogram.", ("op",), buckets=(0.1, 1.0))
+    hist.observe(0.05, op="a")
+    hist.observe(0.5, op="a")
+    hist.observe(5.0, op="a")
+    text = metrics.render()
+    assert '# TYPE test_latency_seconds histogram' in text
+    assert 'test_latency_seconds_bucket{op="a",le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{op="a",le="1.0"} 2' in text
+    assert 'test_latency_seconds_bucket{op="a",le="+Inf"} 3' in text
+    assert 'test_latency_seconds_count{op="a"} 3' in text
+
+
+def test_timed_redis_counts_failures():
+    @metrics.timed_redis("test_op")
+    def broken():
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        broken()
+    assert metrics.REDIS_ERRORS.value(op="test_op") == 1
+    assert metrics.REDIS_LATENCY.count(op="test_op") == 1
+
+
+def test_fetch_bars_is_quiet_and_counted(monkeypatch, capsys):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BarsHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(retrieve_bars, "BASE_API_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(http_client.token_manager, "get_token", lambda: "token")
+    logging_setup.configure_logging("INFO")
+    before = metrics.HTTP_REQUESTS.value(method="POST", endpoint="/api/History/retrieveBars", status="200")
+    try:
+        result = retrieve_bars.fetch_bars("CON.F.US.ENQ.U25", "2025-07-01T13:00:00Z", "2025-07-01T14:00:00Z")
+    finally:
+        http_client.reset_session()
+        server.shutdown()
+    assert len(result["bars"]) == 1
+    captured = capsys.readouterr()
+    assert captured.out == "" and captured.err == ""
+    after = metrics.HTTP_REQUESTS.value(method="POST", endpoint="/api/History/retrieveBars", status="200")
+    assert after == before + 1
+    assert "topstepx_http_request_seconds_bucket" in metrics.render()
+
+
+def test_json_formatter_includes_extra_fields():
+    record = logging.LogRecord("topstepx_trader.x", logging.DEBUG, __file__, 1, "hello %s", ("world",), None)
+    record.contractId = "CON.F.US.ENQ.U25"
+    entry = json.loads(logging_setup.JsonFormatter().format(record))
+    assert entry["msg"] == "hello world"
+    assert entry["contractId"] == "CON.F.US.ENQ.U25"
@@ -0,0 +1,86 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_read_cache.py
+from backend.topstepx_trader import read_cache
+
+ACCOUNTS = [{"id": 1, "name": "A", "balance": 50000.0}]
+
+
+def _cache(store, loads, **kwargs):
+    def loader(key, default=None):
+        loads.append(key)
+        return store.get(key, default)
+    return read_cache.ReadCache(loader=loader, subscribe=False, **kwargs)
+
+
+def test_hits_skip_loader_until_invalidated():
+    store, loads = {"accounts": list(ACCOUNTS)}, []
+    cache = _cache(store, loads, ttl=60)
+    first = cache.get("accounts", [])
+    assert cache.get("accounts", []) is first
+    assert loads == ["accounts"]
+
+    store["accounts"] = ACCOUNTS + [{"id": 2, "name": "B", "balance": 1.0}]
+    cache.invalidate("accounts")
+    second = cache.get("accounts", [])
+    assert len(second.value) == 2
+    assert second.etag != first.etag
+    assert loads == ["accounts", "accounts"]
+
+
+def test_etag_is_stable_for_equal_values():
+    assert read_cache.CachedValue(ACCOUNTS).etag == read_cache.CachedValue(list(ACCOUNTS)).etag
+
+
+def test_load_racing_an_invalidation_is_not_stored():
+    store, loads = {"accounts": ACCOUNTS}, []
+    cache = _cache(store, loads, ttl=60)
+
+    def racing_loader(key, default=None):
+        loads.append(key)
+        cache.invalidate(key)  # a write lands while we were reading
+        return store.get(key, default)
+
+    cache.loader = racing_loader
+    cache.get("accounts")
+    cache.loader = lambda key, default=None: loads.append(key) or store.get(key, default)
+    cache.get("accounts")
+    assert len(loads) == 2
+
+
+def test_load_racing_a_full_invalidation_is_not_stored():
+    store, loads = {"accounts": ACCOUNTS}, []
+    cache = _cache(store, loads, ttl=60)
+
+    def racing_loader(key, default=None):
+        loads.append(key)
+        cache.invalidate()  # e.g. the invalidation feed reconnected mid-load
+        return store.get(key, default)
+
+    cache.loader = racing_loader
+    cache.get("accounts")  # first load: no per-key generation exists yet
+    cache.loader = lambda key, default=None: loads.append(key) or store.get(key, default)
+    cache.get("accounts")
+    assert len(loads) == 2
+
+
+def test_nothing_is_cached_without_a_live_subscription():
+    store, loads = {"accounts": ACCOUNTS}, []
+    cache = _cache(store, loads, ttl=60)
+    cache.subscribe = True  # listener never connected
+    cache._thread = object()
+    cache.get("accounts")
+    cache.get("accounts")
+    assert loads == ["accounts", "accounts"]
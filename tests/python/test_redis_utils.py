@@ -0,0 +1,39 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_redis_utils.py
+import pytest
+import redis
+from backend.topstepx_trader import redis_utils
+
+
+def test_clients_share_one_pool():
+    assert redis_utils.get_redis().connection_pool is redis_utils.get_pool()
+    assert redis_utils.get_redis().connection_pool is redis_utils.get_redis().connection_pool
+
+
+def test_batched_json_round_trip():
+    try:
+        redis_utils.get_redis().ping()
+    except redis.exceptions.ConnectionError:
+        pytest.skip("redis-server not running")
+
+    snapshots = {f"test:account:{i}": {"id": i, "balance": 1000.0 + i} for i in range(5)}
+    redis_utils.set_json_many(snapshots, ttl=30)
+    result = redis_utils.get_json_many(list(snapshots) + ["test:account:missing"], default={})
+    for key, value in snapshots.items():
+        assert result[key] == value
+    assert result["test:account:missing"] == {}
+    assert 0 < redis_utils.get_redis().ttl("test:account:0") <= 30
+    redis_utils.get_redis().delete(*snapshots)
@@ -0,0 +1,77 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_request_scheduler.py
+import threading
+import time
+import pytest
+from backend.topstepx_trader import request_scheduler as rs
+
+
+def test_routes_pick_group_and_priority():
+    assert rs.classify("/api/Order/place") == ("api", rs.ORDERS)
+    assert rs.classify("/api/Position/closeContract") == ("api", rs.ORDERS)
+    assert rs.classify("/api/Position/searchOpen") == ("api", rs.POSITIONS)
+    assert rs.classify("/api/Order/searchOpen") == ("api", rs.POSITIONS)
+    assert rs.classify("/api/Order/search") == ("api", rs.HISTORY)
+    assert rs.classify("/api/Account/search") == ("api", rs.GENERAL)
+    assert rs.classify("/api/History/retrieveBars") == ("history", rs.HISTORY)
+    assert rs.parse_limit("200/60") == (200 / 60, 200)
+    assert rs.parse_limit("") == (None, None)
+
+
+def test_orders_jump_the_queue_and_keep_the_reserve():
+    scheduler = rs.RequestScheduler(limits={"api": (5.0, 3)}, reserve=1)
+    # Non-order traffic stops one token short of empty...
+    scheduler.acquire("api", rs.HISTORY)
+    scheduler.acquire("api", rs.HISTORY)
+    order = []
+    lock = threading.Lock()
+
+    def call(name, priority):
+        scheduler.acquire("api", priority)
+        with lock:
+            order.append(name)
+
+    history = [threading.Thread(target=call, args=(f"history-{i}", rs.HISTORY)) for i in range(3)]
+    for t in history:
+        t.start()
+    time.sleep(0.02)
+    assert scheduler.stats()["api"]["queued"]["history"] == 3
+    # ...which an order takes immediately, ahead of everything queued.
+    call("order", rs.ORDERS)
+    positions = threading.Thread(target=call, args=("positions", rs.POSITIONS))
+    positions.start()
+    for t in history + [positions]:
+        t.join(5)
+    assert order[0] == "order"
+    assert order[1] == "positions"
+    assert scheduler.stats()["api"]["queued"]["history"] == 0
+
+
+def test_deadline_drops_a_request_without_a_token():
+    scheduler = rs.RequestScheduler(limits={"api": (0.5, 1)}, reserve=0)
+    scheduler.acquire("api", rs.GENERAL)
+    started = time.monotonic()
+    with pytest.raises(rs.QueueDeadlineExceeded):
+        scheduler.acquire("api", rs.GENERAL, deadline=0.05)
+    assert time.monotonic() - started < 0.5
+    stats = scheduler.stats()["api"]
+    assert stats["expired"]["general"] == 1
+    assert stats["queued"]["general"] == 0
+
+
+def test_unlimited_group_never_waits():
+    scheduler = rs.RequestScheduler(limits={"history": (None, None)})
+    assert all(scheduler.acquire("history", rs.HISTORY) == 0.0 for _ in range(1000))
@@ -0,0 +1,137 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_resilience.py
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from backend.topstepx_trader import http_client
+
+
+class FlakyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    failures = 0    # next N requests answer 503
+    slow_first = 0  # seconds the first request of a run sleeps
+    hits = []
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        FlakyHandler.hits.append(self.path)
+        if len(FlakyHandler.hits) == 1 and FlakyHandler.slow_first:
+            time.sleep(FlakyHandler.slow_first)
+        if FlakyHandler.failures > 0:
+            FlakyHandler.failures -= 1
+            status, body = 503, b"<html>unavailable</html>"
+        else:
+            status, body = 200, b'{"success": true}'
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api(monkeypatch):
+    monkeypatch.setattr(http_client.config, "HTTP_RETRY_BACKOFF", 0.0)
+    monkeypatch.setattr(http_client.config, "CIRCUIT_FAILURE_THRESHOLD", 3)
+    monkeypatch.setattr(http_client.config, "CIRCUIT_RESET_TIMEOUT", 0.2)
+    monkeypatch.setattr(http_client.request_scheduler, "outbound", http_client.request_scheduler.RequestScheduler(
+        limits={"api": (None, None), "history": (None, None)}))
+    http_client.resilience.reset()
+    FlakyHandler.failures, FlakyHandler.slow_first, FlakyHandler.hits = 0, 0, []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FlakyHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    http_client.reset_session()
+    http_client.resilience.reset()
+    server.shutdown()
+
+
+def test_reads_are_retried_but_orders_are_not(api):
+    FlakyHandler.failures = 2
+    response = http_client.post(f"{api}/api/Position/searchOpen", json={})
+    assert response.status_code == 200
+    assert len(FlakyHandler.hits) == 3
+
+    FlakyHandler.failures, FlakyHandler.hits = 1, []
+    response = http_client.post(f"{api}/api/Order/place", json={})
+    assert response.status_code == 503
+    assert len(FlakyHandler.hits) == 1
+    with pytest.raises(http_client.ApiError):
+        http_client.parse_json(response)
+
+
+def test_breaker_opens_fails_fast_and_recovers(api):
+    url = f"{api}/api/Order/place"
+    FlakyHandler.failures = 3
+    for _ in range(3):
+        http_client.post(url, json={})
+    with pytest.raises(http_client.resilience.CircuitOpenError):
+        http_client.post(url, json={})
+    assert len(FlakyHandler.hits) == 3
+    # Other endpoints are unaffected.
+    assert http_client.post(f"{api}/api/Account/search", json={}).status_code == 200
+
+    time.sleep(0.25)  # half-open: one trial goes through and closes the circuit
+    assert http_client.post(url, json={}).status_code == 200
+    assert http_client.post(url, json={}).status_code == 200
+
+
+def test_open_breaker_fails_before_taking_a_rate_token(api, monkeypatch):
+    url = f"{api}/api/Order/place"
+    scheduler = http_client.request_scheduler.outbound
+    acquired = []
+    real_acquire = scheduler.acquire
+
+    def acquire(group, priority, deadline=None):
+        acquired.append(group)
+        return real_acquire(group, priority, deadline)
+
+    monkeypatch.setattr(scheduler, "acquire", acquire)
+    FlakyHandler.failures = 3
+    for _ in range(3):
+        http_client.post(url, json={})
+    with pytest.raises(http_client.resilience.CircuitOpenError):
+        http_client.post(url, json={})
+    assert len(acquired) == 3
+
+    # A half-open trial that times out in the queue is handed back, not lost.
+    time.sleep(0.25)
+
+    def expired(group, priority, deadline=None):
+        raise http_client.request_scheduler.QueueDeadlineExceeded("queued too long")
+
+    monkeypatch.setattr(scheduler, "acquire", expired)
+    with pytest.raises(http_client.request_scheduler.QueueDeadlineExceeded):
+        http_client.post(url, json={})
+    monkeypatch.setattr(scheduler, "acquire", acquire)
+    assert http_client.post(url, json={}).status_code == 200
+
+
+def test_slow_read_is_hedged_past_p95(api):
+    url = f"{api}/api/Contract/search"
+    window = http_client.resilience.latency("/api/Contract/search")
+    for _ in range(window.every):
+        window.observe(0.01)
+    FlakyHandler.slow_first = 1.0
+    started = time.perf_counter()
+    response = http_client.post(url, json={}, hedge=True)
+    assert response.status_code == 200
+    assert time.perf_counter() - started < 0.5
+    assert len(FlakyHandler.hits) == 2
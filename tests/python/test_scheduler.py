@@ -12,10 +12,31 @@ LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
 # Load environment
 load_dotenv(dotenv_path=ENV_PATH, override=True)
 
-import schedule
-from backend.topstepx_trader.scheduler import schedule_reauth
+import threading
+import time
+from backend.topstepx_trader.scheduler import TimerScheduler, schedule_reauth, scheduler
 
 def test_schedule_exists():
-    schedule.clear()
     schedule_reauth()
-    assert any(job.at_time.strftime("%H:%M") == "17:45" for job in schedule.jobs)
+    assert scheduler.jobs["reauth"].at_time == "17:45"
+    assert 0 < scheduler.jobs["reauth"].deadline - time.monotonic() <= 24 * 3600
+
+def test_subsecond_jobs_run_on_time_without_blocking_each_other():
+    timer = TimerScheduler(max_workers=4).start()
+    ticks = []
+    release = threading.Event()
+    timer.every(0.05, lambda: ticks.append(time.monotonic()), name="fast")
+    timer.every(0.05, lambda: release.wait(5), name="slow")
+    deadline = time.monotonic() + 5
+    while len(ticks) < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    stats = timer.stats()
+    release.set()
+    timer.stop()
+
+    # The fast job kept ticking while the slow one was still on its first run.
+    assert len(ticks) >= 5
+    assert stats["slow"]["runs"] == 0 and stats["slow"]["skipped"] > 0
+    assert stats["fast"]["runs"] >= 5
+    # Loose bound: only catches a regression to coarse polling, not CI jitter.
+    assert stats["fast"]["latenessMaxMs"] < 1000
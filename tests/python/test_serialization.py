@@ -0,0 +1,83 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_serialization.py
+import json
+import numpy as np
+import pytest
+from backend.topstepx_trader import serialization
+
+ACCOUNTS = [{"id": i, "name": f"ACC-{i}", "balance": 50000.0 + i, "canTrade": True} for i in range(3)]
+
+
+def _bars(n=100):
+    return {
+        "contractId": "CON.F.US.ENQ.U25",
+        "t": np.arange(n, dtype=np.int64) * 60,
+        "o": np.linspace(21000.0, 21100.0, n),
+        "c": np.linspace(21000.5, 21100.5, n),
+        "v": np.arange(n, dtype=np.int64) + 1,
+    }
+
+
+def test_packed_columns_decode_as_views_over_the_payload():
+    codec = serialization.CODECS["packed"]
+    bars = _bars()
+    data = codec.encode(bars)
+    decoded = codec.decode(data)
+    assert decoded["contractId"] == bars["contractId"]
+    for name in ("t", "o", "c", "v"):
+        assert decoded[name].dtype == bars[name].dtype
+        np.testing.assert_array_equal(decoded[name], bars[name])
+        assert decoded[name].base is data  # no copy
+        assert decoded[name].ctypes.data % 8 == 0
+
+
+def test_packed_rejects_non_numeric_columns():
+    with pytest.raises(ValueError):
+        serialization.CODECS["packed"].encode({"names": ["a", "b"]})
+
+
+def test_json_codecs_agree():
+    for name in ("json", "orjson"):
+        codec = serialization.CODECS[name]
+        assert codec.decode(codec.encode(ACCOUNTS)) == ACCOUNTS
+
+
+def test_msgpack_round_trip():
+    pytest.importorskip("msgpack")
+    codec = serialization.CODECS["msgpack"]
+    assert codec.decode(codec.encode(ACCOUNTS)) == ACCOUNTS
+
+
+def test_namespaces_pick_the_longest_prefix_and_read_legacy_json(monkeypatch):
+    monkeypatch.setattr(serialization, "_namespaces", {})
+    serialization.register_codec("bars:", "packed")
+    serialization.register_codec("bars:raw:", "json")
+    assert serialization.codec_for("accounts").name == "json"
+    assert serialization.codec_for("bars:NQ:1m").name == "packed"
+    assert serialization.codec_for("bars:raw:NQ").name == "json"
+
+    legacy = json.dumps({"t": [1, 2]}).encode()  # written before bars: switched codec
+    assert serialization.decode("bars:NQ:1m", legacy) == {"t": [1, 2]}
+    packed = serialization.encode("bars:NQ:1m", {"t": np.array([1, 2])})
+    np.testing.assert_array_equal(serialization.decode("bars:NQ:1m", packed)["t"], [1, 2])
+
+
+def test_config_rejects_unknown_codecs(monkeypatch):
+    monkeypatch.setattr(serialization, "_namespaces", {})
+    serialization._load_config("accounts=orjson, bars:=packed")
+    assert serialization.codec_for("accounts").name == "orjson"
+    with pytest.raises(Exception):
+        serialization._load_config("accounts=yaml")
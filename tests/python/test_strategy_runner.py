@@ -0,0 +1,134 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_strategy_runner.py
+import time
+from concurrent.futures import Future
+from backend.topstepx_trader import strategy, strategy_runner
+
+
+class FlipStrategy(strategy.Strategy):
+    """Alternates long/short every bar."""
+
+    def on_bar(self, bar, ctx):
+        return 1 if ctx.bars_seen % 2 == 0 else -1
+
+
+class SlowStrategy(strategy.Strategy):
+    def on_bar(self, bar, ctx):
+        time.sleep(0.2)
+        return None
+
+
+class FakeEngine:
+    def __init__(self, reject=(), unknown=(), lookups=()):
+        self.intents = []
+        self.reject = set(reject)
+        self.unknown = set(unknown)
+        self.lookups = list(lookups)  # confirm_place outcomes in turn; an exception is raised
+
+    def submit(self, intent):
+        self.intents.append(intent)
+        future = Future()
+        if len(self.intents) in self.unknown:
+            future.set_result({"intent": intent, "success": None, "status": "unknown", "error": "read timed out"})
+            return future
+        rejected = len(self.intents) in self.reject
+        future.set_result({"success": not rejected, "errorMessage": "rejected" if rejected else None})
+        return future
+
+    def confirm_place(self, result):
+        outcome = self.lookups.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _spec(name, cls, queue_size):
+    return {"name": name, "strategy": f"{__name__}:{cls.__name__}", "contractId": "CON.F.US.ENQ.U25",
+            "timeframe": 60, "accountId": 7, "queueSize": queue_size}
+
+
+def test_slow_strategy_does_not_hold_up_others():
+    engine = FakeEngine()
+    specs = [_spec("flip", FlipStrategy, 100), _spec("slow", SlowStrategy, 3)]
+    runner = strategy_runner.StrategyRunner(specs, engine=engine, subscribe=False).start()
+    try:
+        assert runner.wait_ready(30)
+        for i in range(10):
+            bar = {"t": 60 * i, "o": 1.0, "h": 1.0, "l": 1.0, "c": 1.0, "v": 1}
+            runner.on_bar_close("CON.F.US.ENQ.U25", 60, bar)
+        runner.on_bar_close("CON.F.US.MNQ.U25", 60, bar)  # no subscriber
+
+        deadline = time.time() + 30
+        while runner.workers["flip"].decisions < 10 and time.time() < deadline:
+            time.sleep(0.05)
+        stats = runner.stats()
+        assert stats["flip"]["decisions"] == 10
+        assert stats["flip"]["dropped"] == 0
+        assert stats["slow"]["dropped"] > 0
+        assert stats["slow"]["received"] == 10
+        assert stats["flip"]["decisionMs"]["p50"] is not None
+    finally:
+        runner.stop()
+
+    sides = [intent["order"]["side"] for intent in engine.intents]
+    sizes = [intent["order"]["size"] for intent in engine.intents]
+    assert sides == [0, 1] * 5
+    assert sizes == [1] + [2] * 9
+
+
+def test_rejected_order_does_not_move_strategy_position():
+    engine = FakeEngine(reject={2})
+    runner = strategy_runner.StrategyRunner([_spec("flip", FlipStrategy, 100)], engine=engine,
+                                            subscribe=False).start()
+    try:
+        assert runner.wait_ready(30)
+        for i in range(4):
+            runner.on_bar_close("CON.F.US.ENQ.U25", 60, {"t": 60 * i, "o": 1.0, "h": 1.0, "l": 1.0, "c": 1.0, "v": 1})
+        deadline = time.time() + 30
+        while runner.workers["flip"].decisions < 4 and time.time() < deadline:
+            time.sleep(0.05)
+        assert runner.stats()["flip"]["rejected"] == 1
+    finally:
+        runner.stop()
+
+    # Targets are 1, -1, 1, -1. The -1 is rejected, so the position stays 1:
+    # the third bar needs no order and the fourth still has to sell 2.
+    orders = [(intent["order"]["side"], intent["order"]["size"]) for intent in engine.intents]
+    assert orders == [(0, 1), (1, 2), (1, 2)]
+
+
+def test_unknown_outcome_is_settled_before_the_next_intent(monkeypatch):
+    monkeypatch.setattr(strategy_runner.resilience, "backoff", lambda attempt, response=None: 0.01)
+    engine = FakeEngine(unknown={2}, lookups=[ConnectionError("still down"), True])
+    runner = strategy_runner.StrategyRunner([_spec("flip", FlipStrategy, 100)], engine=engine,
+                                            subscribe=False).start()
+    try:
+        assert runner.wait_ready(30)
+        for i in range(4):
+            runner.on_bar_close("CON.F.US.ENQ.U25", 60, {"t": 60 * i, "o": 1.0, "h": 1.0, "l": 1.0, "c": 1.0, "v": 1})
+        deadline = time.time() + 30
+        while runner.workers["flip"].decisions < 4 and time.time() < deadline:
+            time.sleep(0.05)
+        stats = runner.stats()["flip"]
+        assert stats["unknown"] == 1 and stats["rejected"] == 0
+    finally:
+        runner.stop()
+
+    # The lost -1 was found by its tag, so the position is -1 and the third bar
+    # buys 2 rather than selling another 2.
+    assert engine.lookups == []
+    orders = [(intent["order"]["side"], intent["order"]["size"]) for intent in engine.intents]
+    assert orders == [(0, 1), (1, 2), (0, 2), (1, 2)]
@@ -0,0 +1,118 @@
+import os
+import sys
+from dotenv import load_dotenv
+
+# Fix import paths
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+
+# Define key paths
+ENV_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../.env'))
+LOG_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../logs'))
+
+# Load environment
+load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+# tests/test_token_manager.py
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from backend.topstepx_trader import http_client
+
+token_manager = http_client.token_manager
+
+
+class AuthCheckingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        ok = self.headers.get("Authorization") == "Bearer fresh"
+        body = json.dumps({"success": ok}).encode()
+        self.send_response(200 if ok else 401)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_token_expiry_reads_jwt_exp():
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": 1234567890}).encode()).decode().rstrip("=")
+    assert token_manager.token_expiry(f"header.{claims}.sig") == 1234567890
+    assert token_manager.token_expiry("opaque") > time.time()
+
+
+def test_concurrent_401s_trigger_a_single_login(monkeypatch):
+    logins = []
+
+    def fake_login():
+        logins.append(1)
+        time.sleep(0.1)
+        return "fresh"
+
+    monkeypatch.setattr(token_manager.auth, "login", fake_login)
+    monkeypatch.setattr(token_manager, "_manager", token_manager.TokenManager())
+    token_manager.set_token("stale")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), AuthCheckingHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/Position/searchOpen"
+    statuses = []
+
+    def call():
+        statuses.append(http_client.post(url, json={}, authorized=True).status_code)
+
+    threads = [threading.Thread(target=call) for _ in range(20)]
+    try:
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        http_client.reset_session()
+        server.shutdown()
+
+    assert statuses == [200] * 20
+    assert len(logins) == 1
+    assert token_manager.get_token() == "fresh"
+
+
+def _jwt(exp):
+    claims = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).decode().rstrip("=")
+    return f"header.{claims}.sig"
+
+
+def test_renewal_without_a_later_expiry_logs_in_and_does_not_spin(monkeypatch):
+    soon = _jwt(int(time.time()) + 600)  # inside the 30-minute refresh margin
+    renewals, logins = [], []
+
+    def fake_renew(token):
+        renewals.append(token)
+        return token  # validate succeeded but returned no newToken
+
+    def fake_login():
+        logins.append(1)
+        return soon  # even a fresh login does not get past the margin
+
+    monkeypatch.setattr(token_manager.auth, "renew_token", fake_renew)
+    monkeypatch.setattr(token_manager.auth, "login", fake_login)
+    monkeypatch.setattr(token_manager.config, "TOKEN_REFRESH_MARGIN", 1800)
+    monkeypatch.setattr(token_manager.config, "TOKEN_RETRY_DELAY", 0.2)
+    manager = token_manager.TokenManager()
+    manager.set_token(soon)
+
+    assert manager.refresh() == soon
+    assert len(logins) == 1
+
+    renewals.clear()
+    loop = threading.Thread(target=manager._refresh_loop, daemon=True)
+    loop.start()
+    time.sleep(0.5)
+    manager.stop()
+    loop.join(1.0)
+    assert not loop.is_alive()
+    assert 1 <= len(renewals) <= 4
+